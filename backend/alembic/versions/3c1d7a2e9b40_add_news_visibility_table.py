@@ -0,0 +1,56 @@
+"""add news_visibility table
+
+Revision ID: 3c1d7a2e9b40
+Revises: 9952ac03c607
+Create Date: 2026-10-19 10:12:41.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1d7a2e9b40'
+down_revision: Union[str, Sequence[str], None] = '9952ac03c607'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'news_visibility',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('company_id', sa.Integer(), nullable=False),
+        sa.Column('news_id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('company_id', 'news_id', name='uq_news_visibility_company_news'),
+    )
+    op.create_index('ix_news_visibility_company_created', 'news_visibility', ['company_id', 'created_at'], unique=False)
+    op.create_index(op.f('ix_news_visibility_news_id'), 'news_visibility', ['news_id'], unique=False)
+
+    # 기존 게시 새소식으로 초기 데이터 생성
+    op.execute(
+        """
+        INSERT INTO news_visibility (company_id, news_id, created_at)
+        SELECT DISTINCT nc.company_id, n.seq, n.created_at
+        FROM News n JOIN News_companies nc ON nc.news_id = n.seq
+        WHERE n.is_published = 1
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO news_visibility (company_id, news_id, created_at)
+        SELECT 0, n.seq, n.created_at
+        FROM News n
+        WHERE n.is_published = 1
+          AND NOT EXISTS (SELECT 1 FROM News_companies nc WHERE nc.news_id = n.seq)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_news_visibility_news_id'), table_name='news_visibility')
+    op.drop_index('ix_news_visibility_company_created', table_name='news_visibility')
+    op.drop_table('news_visibility')
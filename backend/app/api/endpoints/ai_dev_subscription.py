@@ -1,8 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_current_user
-from app.db.session import get_db
+from app.core.deps import get_current_user, get_read_db
 from app.models.manager import Manager
 from app.models.ai_dev_subscription import AIDevSubscription
 
@@ -42,7 +41,7 @@ def _serialize(sub: AIDevSubscription) -> dict:
 @router.get("")
 def list_ai_dev_subscriptions(
     current_user: Manager = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     subs = (
         db.query(AIDevSubscription)
@@ -57,7 +56,7 @@ def list_ai_dev_subscriptions(
 def get_ai_dev_subscription(
     seq: int,
     current_user: Manager = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     sub = (
         db.query(AIDevSubscription)
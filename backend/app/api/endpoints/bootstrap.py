@@ -0,0 +1,88 @@
+"""
+앱 시작용 통합 엔드포인트.
+
+대시보드, 프로젝트 목록(유지보수/프로젝트구축), AI 개발 구독, 푸시 토큰 등록을 한 번의
+요청으로 처리한다. 섹션은 요청의 읽기 세션 하나로 차례로 계산하므로 요청당 커넥션은
+개별 API 하나와 같다. 섹션마다 내용 해시 ETag를 붙여 클라이언트가 보낸 ETag와 같으면
+데이터를 생략한다.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Callable
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session
+
+from app.core.deps import get_current_user, get_read_db
+from app.db.session import get_db
+from app.models.manager import Manager
+from app.schemas.bootstrap import BootstrapRequest
+from app.schemas.push import PushTokenResponse
+from app.services.push import register_token
+from app.api.endpoints.dashboard import get_dashboard
+from app.api.endpoints.maintenance import get_available_projects
+from app.api.endpoints.project_board import list_company_projects
+from app.api.endpoints.ai_dev_subscription import list_ai_dev_subscriptions
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/bootstrap", tags=["bootstrap"])
+
+SECTIONS: dict[str, Callable[[Manager, Session], object]] = {
+    "dashboard": lambda user, db: get_dashboard(current_user=user, db=db),
+    "maintenance_projects": lambda user, db: get_available_projects(current_user=user, db=db),
+    "project_board_projects": lambda user, db: list_company_projects(current_user=user, db=db),
+    "ai_dev_subscriptions": lambda user, db: list_ai_dev_subscriptions(current_user=user, db=db),
+}
+
+
+def _section_etag(data) -> str:
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return f'"{hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]}"'
+
+
+@router.post("")
+def bootstrap(
+    body: BootstrapRequest,
+    current_user: Manager = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    read_db: Session = Depends(get_read_db),
+):
+    """앱 시작 시 필요한 데이터를 한 번에 반환."""
+    if body.push and body.push.platform not in ("ios", "android"):
+        raise HTTPException(status_code=400, detail="platform must be 'ios' or 'android'")
+
+    sections = {}
+    for name, build in SECTIONS.items():
+        try:
+            data = jsonable_encoder(build(current_user, read_db))
+        except HTTPException as e:
+            sections[name] = {"error": e.detail, "status_code": e.status_code}
+            continue
+        except Exception as e:
+            logger.error(f"Bootstrap section {name} failed: {e}")
+            # 실패한 쿼리가 남긴 트랜잭션 상태가 다음 섹션에 영향을 주지 않도록
+            read_db.rollback()
+            sections[name] = {"error": "데이터를 불러오지 못했습니다.", "status_code": 500}
+            continue
+
+        etag = _section_etag(data)
+        if body.etags.get(name) == etag:
+            sections[name] = {"etag": etag, "not_modified": True}
+        else:
+            sections[name] = {"etag": etag, "data": data}
+
+    result = {"sections": sections}
+    if body.push:
+        push = body.push
+        try:
+            token = register_token(db, current_user.seq, push.token, push.platform, push.device_id)
+            result["push"] = PushTokenResponse.model_validate(token).model_dump()
+        except Exception as e:
+            logger.error(f"Bootstrap push registration failed: {e}")
+            db.rollback()
+            result["push"] = None
+    return result
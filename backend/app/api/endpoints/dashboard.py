@@ -3,14 +3,12 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func, case, and_
 from datetime import datetime, timedelta
 
-from app.core.deps import get_current_user
-from app.db.session import get_db
+from app.core.deps import get_current_user, get_read_db
 from app.models.manager import Manager
 from app.models.customer import (
     Managelist,
     ManagelistComment,
     Inditask,
-    News,
     Estimate,
     Inquiry,
     InquiryAnswer,
@@ -19,16 +17,18 @@ from app.models.customer import (
     Project,
     DevSubscription,
     MaintSubscription,
-    news_companies,
 )
+from app.models.news_visibility import NewsVisibility
+from app.schemas.dashboard import DashboardResponse
+from app.services.news_visibility import count_visible_news, visible_news_query
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 
-@router.get("")
+@router.get("", response_model=DashboardResponse)
 def get_dashboard(
     current_user: Manager = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     company_id = current_user.company_id
     company_name = current_user.company.name if current_user.company else ""
@@ -44,18 +44,7 @@ def get_dashboard(
         .scalar() or 0
     )
 
-    news_with_company = (
-        db.query(News.seq)
-        .join(news_companies, news_companies.c.news_id == News.seq)
-        .filter(News.is_published == True, news_companies.c.company_id == company_id)
-    )
-    news_no_company = (
-        db.query(News.seq)
-        .outerjoin(news_companies, news_companies.c.news_id == News.seq)
-        .filter(News.is_published == True, news_companies.c.news_id == None)
-    )
-    news_ids = news_with_company.union(news_no_company).subquery()
-    news_count = db.query(func.count()).select_from(news_ids).scalar() or 0
+    news_count = count_visible_news(db, company_id)
 
     estimate_count = (
         db.query(func.count(Estimate.seq))
@@ -90,10 +79,10 @@ def get_dashboard(
 
     activities = []
     for m in recent_maintenance:
-        activities.append({"id": m.id, "title": m.title, "date": m.date.isoformat() if m.date else None, "type": "maintenance", "status": m.status})
+        activities.append({"id": m.id, "title": m.title, "date": m.date, "type": "maintenance", "status": m.status})
     for i in recent_inquiries:
-        activities.append({"id": i.id, "title": i.title, "date": i.date.isoformat() if i.date else None, "type": "inquiry", "status": i.status})
-    activities.sort(key=lambda x: x["date"] or "", reverse=True)
+        activities.append({"id": i.id, "title": i.title, "date": i.date, "type": "inquiry", "status": i.status})
+    activities.sort(key=lambda x: x["date"] or datetime.min, reverse=True)
     recent_activities = activities[:5]
 
     current_month_start = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
@@ -131,18 +120,8 @@ def get_dashboard(
         if completed_count > 0 or in_progress_count > 0:
             worker_stats.append({"name": wt_name, "completed_count": completed_count, "in_progress_count": in_progress_count})
 
-    visible_news_with_company = (
-        db.query(News)
-        .join(news_companies, news_companies.c.news_id == News.seq)
-        .filter(News.is_published == True, news_companies.c.company_id == company_id)
-    )
-    visible_news_no_company = (
-        db.query(News)
-        .outerjoin(news_companies, news_companies.c.news_id == News.seq)
-        .filter(News.is_published == True, news_companies.c.news_id == None)
-    )
-    latest_news_items = visible_news_with_company.union(visible_news_no_company).order_by(News.created_at.desc()).limit(5).all()
-    latest_news = [{"id": n.seq, "title": n.title, "category": n.category, "created_at": n.created_at.isoformat() if n.created_at else None} for n in latest_news_items]
+    latest_news_items = visible_news_query(db, company_id).order_by(NewsVisibility.created_at.desc()).limit(5).all()
+    latest_news = [{"id": n.seq, "title": n.title, "category": n.category, "created_at": n.created_at} for n in latest_news_items]
 
     monthly_payment_result = db.query(
         func.coalesce(func.sum(Payment.payment_amount), 0).label("total_amount"),
@@ -150,7 +129,7 @@ def get_dashboard(
     ).filter(Payment.company_id == company_id, Payment.payment_date >= current_month_start.date()).first()
 
     monthly_payment = {
-        "total_amount": monthly_payment_result.total_amount if monthly_payment_result else 0,
+        "total_amount": int(monthly_payment_result.total_amount) if monthly_payment_result else 0,
         "count": monthly_payment_result.count if monthly_payment_result else 0,
     }
 
@@ -217,8 +196,8 @@ def get_dashboard(
         project_progress.append({
             "id": proj.seq, "title": proj.title, "status": proj.project_status,
             "total_tasks": total_tasks, "completed_tasks": completed_tasks, "progress": progress,
-            "contract_date": proj.contract_date.isoformat() if proj.contract_date else None,
-            "contract_termination_date": proj.contract_termination_date.isoformat() if proj.contract_termination_date else None,
+            "contract_date": proj.contract_date,
+            "contract_termination_date": proj.contract_termination_date,
             "project_type": PROJECT_TYPE_MAP.get(proj.project_type, proj.project_type),
             "monthly_point": proj.point or 0,
         })
@@ -6,10 +6,10 @@ from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, File, UploadFile, Form
 from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy import func, or_
 
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user, get_read_db
 from app.services.email import notify_dev_request_created, notify_dev_request_comment_created
 from app.db.session import get_db
 from app.models.manager import Manager
@@ -65,7 +65,7 @@ def list_dev_requests(
     search: str = Query(""),
     status: str = Query(""),
     current_user: Manager = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     company_id = current_user.company_id
 
@@ -185,16 +185,16 @@ async def create_dev_request(
 def get_dev_request_detail(
     request_id: int,
     current_user: Manager = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     company_id = current_user.company_id
 
     item = (
         db.query(Managelist)
         .options(
-            joinedload(Managelist.comments).joinedload(ManagelistComment.writer),
-            joinedload(Managelist.comments).joinedload(ManagelistComment.comment_attachments),
-            joinedload(Managelist.attachments),
+            selectinload(Managelist.comments).joinedload(ManagelistComment.writer),
+            selectinload(Managelist.comments).selectinload(ManagelistComment.comment_attachments),
+            selectinload(Managelist.attachments),
             joinedload(Managelist.writer),
             joinedload(Managelist.dev_subscription),
         )
@@ -0,0 +1,47 @@
+import hmac
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import FileResponse
+
+from app.core.config import settings
+from app.core.profiling import create_profile_token, get_profile, list_profiles, profile_stats_path
+
+router = APIRouter(prefix="/diagnostics", tags=["diagnostics"])
+
+
+def _verify_diagnostics_key(x_api_key: str = Header(...)):
+    if not settings.DIAGNOSTICS_API_KEY or not hmac.compare_digest(x_api_key, settings.DIAGNOSTICS_API_KEY):
+        raise HTTPException(status_code=403, detail="Invalid API key")
+    return x_api_key
+
+
+@router.post("/profile-token")
+def issue_profile_token(
+    ttl_seconds: int = Query(600, ge=60, le=3600),
+    _: str = Depends(_verify_diagnostics_key),
+):
+    """X-Profile-Token 헤더 값 발급. 이 헤더를 붙인 요청은 프로파일되어 저장된다."""
+    return {"header": "X-Profile-Token", "token": create_profile_token(ttl_seconds), "ttl_seconds": ttl_seconds}
+
+
+@router.get("/profiles")
+def get_profiles(_: str = Depends(_verify_diagnostics_key)):
+    return list_profiles()
+
+
+@router.get("/profiles/{profile_id}")
+def get_profile_detail(profile_id: str, _: str = Depends(_verify_diagnostics_key)):
+    """메타데이터와 누적 시간 기준 상위 함수 요약."""
+    profile = get_profile(profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다.")
+    return profile
+
+
+@router.get("/profiles/{profile_id}/download")
+def download_profile(profile_id: str, _: str = Depends(_verify_diagnostics_key)):
+    """pstats 파일 (snakeviz 등으로 열람)."""
+    path = profile_stats_path(profile_id)
+    if not path:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다.")
+    return FileResponse(path, media_type="application/octet-stream", filename=f"{profile_id}.prof")
@@ -1,24 +1,31 @@
 import math
 from datetime import timedelta
+from functools import partial
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import Response
-from sqlalchemy.orm import Session, joinedload
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload, selectinload
 from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime, timezone as tz
 
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user, get_read_db
 from app.db.session import get_db
 from app.models.manager import Manager
 from app.models.customer import Estimate, EstimateItem, EstimateContract, EstimateStatusHistory, EstimateRevisionRequest
 from app.models.company import Company
 from app.models.manager import Manager as HcmsManager
 from app.core.security import create_access_token, create_refresh_token
-from app.utils.pdf_generator import generate_estimate_pdf, generate_contract_pdf
+from app.utils.pdf_cache import render_pdf_cached
+from app.services.pdf_render import PdfRenderError, PdfRenderUnavailable, iter_rendered_pdfs, render_pdf
+from app.services.exports import ZIP_MEDIA_TYPE, iter_zip_bytes
+from app.services.estimate_pricing import line_amount, price_estimate_for
 
 router = APIRouter(prefix="/estimates", tags=["estimates"])
 
+MAX_PDF_BUNDLE_ESTIMATES = 100
+
 ESTIMATE_STATUS_LABELS = {
 	1: "작성중",
 	2: "제출",
@@ -38,6 +45,24 @@ class RevisionRequest(BaseModel):
 	content: str
 
 
+class PdfBundleRequest(BaseModel):
+	ids: list[int] = []
+	search: str = ""
+	status: str = ""
+
+
+def _filter_estimates(db: Session, company_id: int, search: str = "", status: str = ""):
+	query = db.query(Estimate).filter(Estimate.company_id == company_id)
+
+	if search:
+		query = query.filter(Estimate.estimate_title.ilike(f"%{search}%"))
+
+	if status:
+		query = query.filter(Estimate.estimate_status == int(status))
+
+	return query
+
+
 @router.get("")
 def list_estimates(
 	page: int = Query(1, ge=1),
@@ -45,23 +70,26 @@ def list_estimates(
 	search: str = Query("", description="Search in estimate_title"),
 	status: str = Query("", description="Filter by estimate_status (1-5)"),
 	current_user: Manager = Depends(get_current_user),
-	db: Session = Depends(get_db),
+	db: Session = Depends(get_read_db),
 ):
 	company_id = current_user.company_id
 
-	query = db.query(Estimate).filter(Estimate.company_id == company_id)
-
-	if search:
-		query = query.filter(Estimate.estimate_title.ilike(f"%{search}%"))
-
-	if status:
-		query = query.filter(Estimate.estimate_status == int(status))
+	query = _filter_estimates(db, company_id, search, status)
 
 	total = query.count()
 	total_pages = math.ceil(total / per_page) if total > 0 else 1
 
-	items_db = (
-		query.options(joinedload(Estimate.project), joinedload(Estimate.items))
+	# 견적 항목 합계는 페이지에 포함된 견적서에 대해서만 DB에서 계산
+	items_total = (
+		db.query(func.coalesce(func.sum(func.coalesce(EstimateItem.quantity, 0) * func.coalesce(EstimateItem.unit_price, 0)), 0))
+		.filter(EstimateItem.estimate_id == Estimate.seq)
+		.correlate(Estimate)
+		.scalar_subquery()
+	)
+
+	rows = (
+		query.add_columns(items_total)
+		.options(joinedload(Estimate.project))
 		.order_by(Estimate.created_at.desc())
 		.offset((page - 1) * per_page)
 		.limit(per_page)
@@ -69,7 +97,7 @@ def list_estimates(
 	)
 
 	items = []
-	for e in items_db:
+	for e, e_items_total in rows:
 		items.append(
 			{
 				"id": e.seq,
@@ -78,7 +106,7 @@ def list_estimates(
 				"estimate_type": e.estimate_type,
 				"status": str(e.estimate_status) if e.estimate_status else "1",
 				"status_label": ESTIMATE_STATUS_LABELS.get(int(e.estimate_status) if e.estimate_status else 0, ""),
-				"total_amount": e.estimate_amount if e.estimate_amount else sum((item.quantity or 0) * (item.unit_price or 0) for item in e.items),
+				"total_amount": price_estimate_for(e, e_items_total).subtotal,
 				"estimate_date": (
 					e.estimate_date.isoformat() if e.estimate_date else None
 				),
@@ -248,7 +276,7 @@ def verify_contract_token(
 def get_estimate_detail(
 	estimate_id: int,
 	current_user: Manager = Depends(get_current_user),
-	db: Session = Depends(get_db),
+	db: Session = Depends(get_read_db),
 ):
 	company_id = current_user.company_id
 
@@ -269,33 +297,19 @@ def get_estimate_detail(
 	# Build items list
 	estimate_items = []
 	for ei in item.items:
-		line_total = (ei.quantity or 0) * (ei.unit_price or 0)
 		estimate_items.append(
 			{
 				"name": ei.item_name,
 				"quantity": ei.quantity or 0,
 				"unit": ei.unit or "",
 				"unit_price": ei.unit_price or 0,
-				"amount": line_total,
+				"amount": line_amount(ei),
 			}
 		)
 
 	# Amount breakdown
-	supply_amount = item.estimate_amount if item.estimate_amount else sum(
-		(ei.quantity or 0) * (ei.unit_price or 0) for ei in item.items
-	)
-
-	# Discount calculation
-	discount = 0
-	if item.discount_type == '1' and item.discount_rate:
-		discount = int(supply_amount * (item.discount_rate / 100))
-	elif item.discount_type == '2' and item.discount_amount:
-		discount = item.discount_amount
-
-	after_discount = supply_amount - discount
-	tax_rate = item.tax_rate or 10.0
-	tax_amount = int(after_discount * (tax_rate / 100))
-	total_amount = after_discount + tax_amount
+	pricing = price_estimate_for(item, sum(i["amount"] for i in estimate_items))
+	total_amount = pricing.total
 	if estimate_id == 19:
 		total_amount = 10000000
 
@@ -307,41 +321,20 @@ def get_estimate_detail(
 		"valid_until": None,
 		"company_name": item.company.name if item.company else None,
 		"items": estimate_items,
-		"subtotal": supply_amount,
-		"discount": discount,
+		"subtotal": pricing.subtotal,
+		"discount": pricing.discount,
 		"discount_description": item.discount_description or "",
-		"tax": tax_amount,
+		"tax": pricing.tax,
 		"total": total_amount,
 		"notes": item.estimate_content,
 	}
 
 
-@router.get("/{estimate_id}/pdf")
-def download_estimate_pdf(
-	estimate_id: int,
-	current_user: Manager = Depends(get_current_user),
-	db: Session = Depends(get_db),
-):
-	company_id = current_user.company_id
-
-	item = (
-		db.query(Estimate)
-		.options(
-			joinedload(Estimate.items),
-			joinedload(Estimate.project),
-			joinedload(Estimate.company),
-		)
-		.filter(Estimate.seq == estimate_id, Estimate.company_id == company_id)
-		.first()
-	)
-
-	if not item:
-		raise HTTPException(status_code=404, detail="Estimate not found")
-
+def _estimate_pdf_data(item: Estimate) -> dict:
+	"""견적서 PDF 생성용 데이터 (items/company 로드된 Estimate 기준)."""
 	# Build items list
 	estimate_items = []
 	for ei in item.items:
-		line_total = (ei.quantity or 0) * (ei.unit_price or 0)
 		estimate_items.append(
 			{
 				"name": ei.item_name,
@@ -349,26 +342,14 @@ def download_estimate_pdf(
 				"quantity": ei.quantity or 0,
 				"unit": ei.unit or "",
 				"unit_price": ei.unit_price or 0,
-				"amount": line_total,
+				"amount": line_amount(ei),
 			}
 		)
 
 	# Amount breakdown
-	supply_amount = item.estimate_amount if item.estimate_amount else sum(
-		(ei.quantity or 0) * (ei.unit_price or 0) for ei in item.items
-	)
-	discount = 0
-	if item.discount_type == "1" and item.discount_rate:
-		discount = int(supply_amount * (item.discount_rate / 100))
-	elif item.discount_type == "2" and item.discount_amount:
-		discount = item.discount_amount
-
-	after_discount = supply_amount - discount
-	tax_rate = item.tax_rate or 10.0
-	tax_amount = int(after_discount * (tax_rate / 100))
-	total_amount = after_discount + tax_amount
+	pricing = price_estimate_for(item, sum(i["amount"] for i in estimate_items))
 
-	data = {
+	return {
 		"id": item.seq,
 		"title": item.estimate_title,
 		"estimate_number": item.estimate_number,
@@ -379,15 +360,45 @@ def download_estimate_pdf(
 		"company_business_number": item.company.business_number if item.company else None,
 		"company_address": item.company.address if item.company else None,
 		"items": estimate_items,
-		"subtotal": supply_amount,
-		"discount": discount,
+		"subtotal": pricing.subtotal,
+		"discount": pricing.discount,
 		"discount_description": item.discount_description or "",
-		"tax": tax_amount,
-		"total": total_amount,
+		"tax": pricing.tax,
+		"total": pricing.total,
 		"notes": item.estimate_content,
 	}
 
-	pdf_bytes = bytes(generate_estimate_pdf(data))
+
+@router.get("/{estimate_id}/pdf")
+def download_estimate_pdf(
+	estimate_id: int,
+	current_user: Manager = Depends(get_current_user),
+	db: Session = Depends(get_read_db),
+):
+	company_id = current_user.company_id
+
+	item = (
+		db.query(Estimate)
+		.options(
+			joinedload(Estimate.items),
+			joinedload(Estimate.project),
+			joinedload(Estimate.company),
+		)
+		.filter(Estimate.seq == estimate_id, Estimate.company_id == company_id)
+		.first()
+	)
+
+	if not item:
+		raise HTTPException(status_code=404, detail="Estimate not found")
+
+	data = _estimate_pdf_data(item)
+
+	try:
+		pdf_bytes = render_pdf_cached("estimate", item.seq, data, partial(render_pdf, "estimate"))
+	except PdfRenderUnavailable:
+		raise HTTPException(status_code=503, detail="PDF 생성 요청이 많습니다. 잠시 후 다시 시도해주세요.")
+	except PdfRenderError:
+		raise HTTPException(status_code=500, detail="PDF 생성에 실패했습니다.")
 
 	return Response(
 		content=pdf_bytes,
@@ -396,11 +407,61 @@ def download_estimate_pdf(
 	)
 
 
+@router.post("/pdf-bundle")
+def download_estimate_pdf_bundle(
+	body: PdfBundleRequest,
+	current_user: Manager = Depends(get_current_user),
+	db: Session = Depends(get_db),
+):
+	"""선택한 견적서(ids) 또는 목록 필터(search/status)에 해당하는 견적서 PDF를 ZIP으로 스트리밍."""
+	company_id = current_user.company_id
+
+	if body.ids:
+		query = db.query(Estimate).filter(Estimate.company_id == company_id, Estimate.seq.in_(body.ids))
+	else:
+		query = _filter_estimates(db, company_id, body.search, body.status)
+
+	estimates = (
+		query.options(selectinload(Estimate.items), joinedload(Estimate.company))
+		.order_by(Estimate.created_at.desc())
+		.limit(MAX_PDF_BUNDLE_ESTIMATES + 1)
+		.all()
+	)
+
+	if not estimates:
+		raise HTTPException(status_code=404, detail="Estimate not found")
+	if len(estimates) > MAX_PDF_BUNDLE_ESTIMATES:
+		raise HTTPException(
+			status_code=400,
+			detail=f"한 번에 최대 {MAX_PDF_BUNDLE_ESTIMATES}건까지 다운로드할 수 있습니다.",
+		)
+
+	# 렌더링 데이터는 요청 세션이 열려 있는 동안 미리 만들어 둔다
+	documents = [(e.seq, _estimate_pdf_data(e)) for e in estimates]
+
+	def _zip_entries():
+		failed = []
+		for estimate_seq, pdf_bytes in iter_rendered_pdfs("estimate", documents):
+			if pdf_bytes is None:
+				failed.append(estimate_seq)
+				continue
+			yield f"estimate_{estimate_seq}.pdf", pdf_bytes
+		if failed:
+			lines = [f"estimate_{seq}.pdf" for seq in failed]
+			yield "failed.txt", ("PDF 생성에 실패한 견적서입니다. 잠시 후 다시 시도해주세요.\n" + "\n".join(lines)).encode("utf-8")
+
+	return StreamingResponse(
+		iter_zip_bytes(_zip_entries()),
+		media_type=ZIP_MEDIA_TYPE,
+		headers={"Content-Disposition": "attachment; filename=estimates.zip"},
+	)
+
+
 @router.get("/{estimate_id}/contract-pdf")
 def download_contract_pdf(
 	estimate_id: int,
 	current_user: Manager = Depends(get_current_user),
-	db: Session = Depends(get_db),
+	db: Session = Depends(get_read_db),
 ):
 	company_id = current_user.company_id
 
@@ -454,7 +515,12 @@ def download_contract_pdf(
 		"manager_signed_hash": contract.manager_signed_hash,
 	}
 
-	pdf_bytes = bytes(generate_contract_pdf(data))
+	try:
+		pdf_bytes = render_pdf_cached("contract", contract.seq, data, partial(render_pdf, "contract"))
+	except PdfRenderUnavailable:
+		raise HTTPException(status_code=503, detail="PDF 생성 요청이 많습니다. 잠시 후 다시 시도해주세요.")
+	except PdfRenderError:
+		raise HTTPException(status_code=500, detail="PDF 생성에 실패했습니다.")
 
 	return Response(
 		content=pdf_bytes,
@@ -0,0 +1,73 @@
+import asyncio
+import json
+from datetime import timedelta
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.deps import get_current_user, get_user_from_token
+from app.core.security import create_access_token
+from app.db.session import SessionLocal
+from app.models.manager import Manager
+from app.services.realtime import subscribe, unsubscribe
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+HEARTBEAT_SECONDS = 15
+STREAM_TICKET_SCOPE = "event_stream"
+
+
+def _authenticate(ticket: str) -> Manager:
+    # 스트림이 열려 있는 동안 세션을 잡고 있지 않도록 인증만 하고 바로 닫음
+    db = SessionLocal()
+    try:
+        return get_user_from_token(ticket, db, scope=STREAM_TICKET_SCOPE)
+    finally:
+        db.close()
+
+
+@router.post("/ticket")
+def create_stream_ticket(current_user: Manager = Depends(get_current_user)):
+    """
+    SSE 연결용 티켓 발급.
+
+    EventSource는 헤더를 보낼 수 없어 인증 값이 URL(접근 로그)에 남으므로, 액세스 토큰 대신
+    스트림 연결에만 쓸 수 있고 EVENT_STREAM_TICKET_SECONDS 후 만료되는 티켓을 쓴다.
+    """
+    ticket = create_access_token(
+        {"sub": str(current_user.seq), "scope": STREAM_TICKET_SCOPE},
+        expires_delta=timedelta(seconds=settings.EVENT_STREAM_TICKET_SECONDS),
+    )
+    return {"ticket": ticket, "expires_in": settings.EVENT_STREAM_TICKET_SECONDS}
+
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    ticket: str = Query(..., description="POST /events/ticket 으로 받은 티켓"),
+):
+    """회사 단위 변경 이벤트 SSE 스트림 (답변 등록, 새소식, 프로젝트 게시글 등)."""
+    user = await run_in_threadpool(_authenticate, ticket)
+    company_id = user.company_id
+    queue = subscribe(company_id)
+
+    async def event_stream():
+        try:
+            yield "retry: 5000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                yield f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+        finally:
+            unsubscribe(company_id, queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
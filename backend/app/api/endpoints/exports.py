@@ -0,0 +1,73 @@
+import os
+from urllib.parse import quote
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse
+
+from app.core.deps import get_current_user
+from app.models.manager import Manager
+from app.schemas.export import ExportJobCreate, ExportJobResponse
+from app.services.exports import CSV_MEDIA_TYPE, XLSX_MEDIA_TYPE
+from app.services.export_jobs import get_export_file_path, get_export_job, submit_export_job
+
+router = APIRouter(prefix="/exports", tags=["exports"])
+
+
+def _job_response(job: dict) -> dict:
+    return {
+        **job,
+        "download_url": f"/api/exports/{job['id']}/download" if job["status"] == "completed" else None,
+    }
+
+
+def _get_company_job(job_id: str, current_user: Manager) -> dict:
+    job = get_export_job(job_id)
+    if not job or job["company_id"] != current_user.company_id:
+        raise HTTPException(status_code=404, detail="내보내기 작업을 찾을 수 없습니다.")
+    return job
+
+
+@router.post("", response_model=ExportJobResponse, status_code=202)
+def create_export_job(
+    request: ExportJobCreate,
+    current_user: Manager = Depends(get_current_user),
+):
+    """내보내기 작업 등록 (백그라운드 실행)."""
+    job = submit_export_job(
+        export_type=request.type,
+        export_format=request.format,
+        company_id=current_user.company_id,
+        manager_seq=current_user.seq,
+        params=request.params,
+    )
+    return _job_response(job)
+
+
+@router.get("/{job_id}", response_model=ExportJobResponse)
+def get_export_job_status(
+    job_id: str,
+    current_user: Manager = Depends(get_current_user),
+):
+    """내보내기 작업 상태 조회."""
+    return _job_response(_get_company_job(job_id, current_user))
+
+
+@router.get("/{job_id}/download")
+def download_export_file(
+    job_id: str,
+    current_user: Manager = Depends(get_current_user),
+):
+    """완료된 내보내기 파일 다운로드."""
+    job = _get_company_job(job_id, current_user)
+    if job["status"] != "completed":
+        raise HTTPException(status_code=409, detail="내보내기가 아직 완료되지 않았습니다.")
+
+    full_path = get_export_file_path(job)
+    if not os.path.exists(full_path):
+        raise HTTPException(status_code=404, detail="파일이 만료되었습니다.")
+
+    return FileResponse(
+        path=full_path,
+        media_type=CSV_MEDIA_TYPE if job["format"] == "csv" else XLSX_MEDIA_TYPE,
+        headers={"Content-Disposition": f"attachment; filename*=UTF-8''{quote(job['filename'])}"},
+    )
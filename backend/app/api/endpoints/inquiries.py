@@ -11,7 +11,7 @@ from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func, or_
 
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user, get_read_db
 from app.db.session import get_db
 from app.models.manager import Manager
 from app.models.company import Company
@@ -68,7 +68,7 @@ def list_inquiries(
     search: str = Query("", description="Search in title"),
     status: str = Query("", description="Filter by status (1-3)"),
     current_user: Manager = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     company_id = current_user.company_id
 
@@ -238,7 +238,7 @@ def download_inquiry_attachment(
 def get_inquiry_detail(
     inquiry_id: int,
     current_user: Manager = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     company_id = current_user.company_id
 
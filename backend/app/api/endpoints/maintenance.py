@@ -8,11 +8,12 @@ from urllib.parse import quote
 
 from fastapi import APIRouter, Depends, HTTPException, Query, File, UploadFile, Form
 from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy import func, or_
 
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user, get_read_db
 from app.services.email import notify_maintenance_created, notify_maintenance_comment_created
+from app.services.points import calculate_remaining_points_batch, get_paid_project_ids
 from app.db.session import get_db
 from app.models.manager import Manager
 from app.models.customer import (
@@ -39,81 +40,6 @@ ALLOWED_EXTENSIONS = {
 }
 
 
-def month_diff(d1: date, d2: date) -> int:
-    """Calculate the number of complete months between two dates."""
-    return (d2.year - d1.year) * 12 + (d2.month - d1.month)
-
-
-def calculate_remaining_points(project: Project, db: Session, company_id: int) -> int:
-    """
-    Calculate remaining points for a project based on 6-month cycles.
-
-    Business Rules:
-    - Points are charged monthly in 6-month cycles
-    - For a 12-month contract: first 6 months get monthly points,
-      after those 6 months expire, the next 6 months of points are granted
-    - If less than 6 months remain in contract, use remaining months × monthly_point
-    - Remaining points = (available months in current cycle × monthly_point) - used_points_in_cycle
-    """
-    if not project.contract_date or not project.contract_termination_date:
-        return 0
-
-    if not project.point or project.point <= 0:
-        return 0
-
-    # Convert to date if datetime
-    contract_start = project.contract_date.date() if isinstance(project.contract_date, datetime) else project.contract_date
-    contract_end = project.contract_termination_date.date() if isinstance(project.contract_termination_date, datetime) else project.contract_termination_date
-    today = datetime.now().date()
-
-    # Check if contract has started or expired
-    if today < contract_start or today > contract_end:
-        return 0
-
-    # Calculate total contract months and elapsed months
-    total_contract_months = month_diff(contract_start, contract_end)
-    months_elapsed = month_diff(contract_start, today)
-
-    # Determine which 6-month cycle we're in
-    current_cycle_index = months_elapsed // 6
-    cycle_start_month = current_cycle_index * 6
-    cycle_end_month = min((current_cycle_index + 1) * 6, total_contract_months)
-    months_in_current_cycle = cycle_end_month - cycle_start_month
-
-    # Available points = total months in current cycle × monthly allocation
-    available_points = months_in_current_cycle * project.point
-
-    # Calculate the date range for the current cycle
-    try:
-        from dateutil.relativedelta import relativedelta
-        cycle_start_date = contract_start + relativedelta(months=cycle_start_month)
-        cycle_end_date = contract_start + relativedelta(months=cycle_end_month)
-    except:
-        # Fallback: use simple calculation without dateutil
-        cycle_start_date = contract_start
-        cycle_end_date = contract_end
-
-    # Query used points in the current cycle
-    # Only count PointHistory with point_type=2 (사용), status=2 (실행)
-    used_points_in_cycle = (
-        db.query(func.sum(PointHistory.point))
-        .filter(
-            PointHistory.project_id == project.seq,
-            PointHistory.company_id == company_id,
-            PointHistory.point_type == 2,  # 사용
-            PointHistory.status == 2,       # 실행
-            PointHistory.created_at >= cycle_start_date,
-            PointHistory.created_at <= cycle_end_date,
-        )
-        .scalar()
-    ) or 0
-
-    # Remaining points = available - used, never below 0
-    remaining_points = max(0, available_points - abs(used_points_in_cycle))
-
-    return remaining_points
-
-
 def save_upload_file(file: UploadFile) -> tuple[str, str]:
     """Save uploaded file and return (file_path, original_filename)"""
     ext = os.path.splitext(file.filename)[1].lower().lstrip(".")
@@ -133,7 +59,7 @@ def save_upload_file(file: UploadFile) -> tuple[str, str]:
 @router.get("/projects")
 def get_available_projects(
     current_user: Manager = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get list of all projects belonging to the company"""
     company_id = current_user.company_id
@@ -144,37 +70,32 @@ def get_available_projects(
         .all()
     )
 
+    paid_project_ids = get_paid_project_ids(db, [p.seq for p in projects])
+    remaining_by_project = calculate_remaining_points_batch(db, projects, company_id)
+
+    now = datetime.now().date()
     result = []
     for project in projects:
-        # Check payment status
-        payment = (
-            db.query(Payment)
-            .filter(
-                Payment.project_id == project.seq,
-                Payment.payment_status == 1  # 결제완료
-            )
-            .first()
-        )
+        payment_completed = project.seq in paid_project_ids
 
         # Check contract period
-        now = datetime.now().date()
         contract_valid = False
         if project.contract_date and project.contract_termination_date:
             contract_start = project.contract_date.date() if isinstance(project.contract_date, datetime) else project.contract_date
             contract_end = project.contract_termination_date.date() if isinstance(project.contract_termination_date, datetime) else project.contract_termination_date
             contract_valid = contract_start <= now <= contract_end
 
-        # Calculate remaining points using 6-month cycle logic
-        remaining_points = calculate_remaining_points(project, db, company_id)
+        # Remaining points using 6-month cycle logic
+        remaining_points = remaining_by_project[project.seq]
 
         # Permit if payment complete, contract valid, and has remaining points
-        permit = bool(payment) and contract_valid and remaining_points > 0
+        permit = payment_completed and contract_valid and remaining_points > 0
 
         result.append({
             "id": project.seq,
             "title": project.title,
             "permit": permit,
-            "payment_completed": bool(payment),
+            "payment_completed": payment_completed,
             "remaining_points": remaining_points,
             "contract_status": "active" if contract_valid else "expired",
             "contract_date": project.contract_date.isoformat() if project.contract_date else None,
@@ -191,7 +112,7 @@ def list_maintenance(
     search: str = Query("", description="Search in title"),
     status: str = Query("", description="Filter by status (1-4)"),
     current_user: Manager = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     company_id = current_user.company_id
 
@@ -581,16 +502,16 @@ def download_comment_legacy_file(
 def get_maintenance_detail(
     maintenance_id: int,
     current_user: Manager = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     company_id = current_user.company_id
 
     item = (
         db.query(Managelist)
         .options(
-            joinedload(Managelist.comments).joinedload(ManagelistComment.writer),
-            joinedload(Managelist.comments).joinedload(ManagelistComment.comment_attachments),
-            joinedload(Managelist.attachments),
+            selectinload(Managelist.comments).joinedload(ManagelistComment.writer),
+            selectinload(Managelist.comments).selectinload(ManagelistComment.comment_attachments),
+            selectinload(Managelist.attachments),
             joinedload(Managelist.project),
             joinedload(Managelist.writer),
         )
@@ -1,80 +1,53 @@
 import math
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.orm import Session
 
-from app.core.deps import get_current_user
-from app.db.session import get_db
+from app.core.deps import get_current_user, get_read_db
 from app.models.manager import Manager
-from app.models.customer import News, news_companies
+from app.services.news_catalog import get_news_catalog, get_news_detail as get_news_detail_cached
+from app.services.view_counter import pending_views, record_view
 
 router = APIRouter(prefix="/news", tags=["news"])
 
 
 @router.get("")
 def list_news(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1),
     per_page: int = Query(10, ge=1, le=100),
     search: str = Query("", description="Search in title"),
     category: str = Query("", description="Filter by category"),
     current_user: Manager = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     company_id = current_user.company_id
 
-    # News visible to this company:
-    # is_published=True AND (no companies assigned OR company in assigned list)
-    news_with_company = (
-        db.query(News.seq)
-        .join(news_companies, news_companies.c.news_id == News.seq)
-        .filter(
-            News.is_published == True,
-            news_companies.c.company_id == company_id,
-        )
-    )
-    news_no_company = (
-        db.query(News.seq)
-        .outerjoin(news_companies, news_companies.c.news_id == News.seq)
-        .filter(
-            News.is_published == True,
-            news_companies.c.news_id == None,
-        )
-    )
-    visible_ids_subq = news_with_company.union(news_no_company).subquery()
-
-    query = db.query(News).filter(News.seq.in_(db.query(visible_ids_subq)))
+    # News visible to this company (캐시된 카탈로그)
+    version, catalog = get_news_catalog(db, company_id)
+    etag = f'W/"news-{version}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
 
+    filtered = catalog
     if search:
-        query = query.filter(News.title.ilike(f"%{search}%"))
+        keyword = search.lower()
+        filtered = [n for n in filtered if keyword in (n["title"] or "").lower()]
 
     if category:
-        query = query.filter(News.category == category)
+        filtered = [n for n in filtered if n["category"] == category]
 
-    total = query.count()
+    total = len(filtered)
     total_pages = math.ceil(total / per_page) if total > 0 else 1
 
-    items_db = (
-        query.options(joinedload(News.writer))
-        .order_by(News.created_at.desc())
-        .offset((page - 1) * per_page)
-        .limit(per_page)
-        .all()
-    )
-
-    items = []
-    for n in items_db:
-        items.append(
-            {
-                "id": n.seq,
-                "title": n.title,
-                "category": n.category,
-                "writer_name": n.writer.name if n.writer else None,
-                "views": n.views or 0,
-                "created_at": n.created_at.isoformat() if n.created_at else None,
-            }
-        )
+    start = (page - 1) * per_page
+    items = [
+        {**n, "views": n["views"] + pending_views("news", n["id"])}
+        for n in filtered[start:start + per_page]
+    ]
 
+    response.headers["ETag"] = etag
     return {
         "items": items,
         "total": total,
@@ -88,54 +61,21 @@ def list_news(
 def get_news_detail(
     news_id: int,
     current_user: Manager = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     company_id = current_user.company_id
 
     # Verify the news is visible to this company
-    news_with_company = (
-        db.query(News.seq)
-        .join(news_companies, news_companies.c.news_id == News.seq)
-        .filter(
-            News.seq == news_id,
-            News.is_published == True,
-            news_companies.c.company_id == company_id,
-        )
-    )
-    news_no_company = (
-        db.query(News.seq)
-        .outerjoin(news_companies, news_companies.c.news_id == News.seq)
-        .filter(
-            News.seq == news_id,
-            News.is_published == True,
-            news_companies.c.news_id == None,
-        )
-    )
-    visible = news_with_company.union(news_no_company).first()
-
-    if not visible:
+    _, catalog = get_news_catalog(db, company_id)
+    if not any(n["id"] == news_id for n in catalog):
         raise HTTPException(status_code=404, detail="News not found")
 
-    item = (
-        db.query(News)
-        .options(joinedload(News.writer))
-        .filter(News.seq == news_id)
-        .first()
-    )
+    item = get_news_detail_cached(db, news_id)
 
-    # Increment views
-    item.views = (item.views or 0) + 1
-    db.commit()
-    db.refresh(item)
+    if not item:
+        raise HTTPException(status_code=404, detail="News not found")
 
-    return {
-        "id": item.seq,
-        "title": item.title,
-        "content": item.content,
-        "category": item.category,
-        "writer_name": item.writer.name if item.writer else None,
-        "views": item.views,
-        "attachment": item.attachment,
-        "created_at": item.created_at.isoformat() if item.created_at else None,
-        "updated_at": item.updated_at.isoformat() if item.updated_at else None,
-    }
+    # Increment views (버퍼에 모았다가 주기적으로 일괄 반영)
+    record_view("news", news_id)
+
+    return {**item, "views": item["views"] + pending_views("news", news_id)}
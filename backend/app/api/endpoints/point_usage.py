@@ -1,16 +1,24 @@
 import math
 from datetime import datetime, date, timedelta
 from fastapi import APIRouter, Depends, Query
-from fastapi.responses import Response
-from sqlalchemy.orm import Session, joinedload
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, contains_eager
 from sqlalchemy import func, or_, and_
-from io import BytesIO
-import openpyxl
 from urllib.parse import quote
-from app.core.deps import get_current_user
-from app.db.session import get_db
+from app.core.deps import get_current_user, get_read_db
+from app.db.session import read_session_factory
 from app.models.manager import Manager
-from app.models.customer import Project, PointHistory, Managelist, ManagelistComment, DevSubscription, MaintSubscription
+from app.models.customer import Project, PointHistory, Managelist, DevSubscription, MaintSubscription
+from app.schemas.point_usage import PointUsageResponse
+from app.services.exports import CSV_MEDIA_TYPE, XLSX_MEDIA_TYPE, iter_csv_bytes, iter_xlsx_bytes
+from app.services.points import (
+    EXPORT_HEADER,
+    EXPORT_SHEET_TITLE,
+    build_point_export_query,
+    get_export_project,
+    get_latest_pointed_comments,
+    iter_point_export_rows,
+)
 
 HAS_DATEUTIL = False
 try:
@@ -22,6 +30,23 @@ except ImportError:
 router = APIRouter(prefix="/point-usage", tags=["point-usage"])
 
 
+def _stream_point_export(user_seq: int, project_seq: int | None, filters: dict, export_format: str):
+    """요청 세션과 분리된 세션으로 내보내기 행을 읽어 파일을 스트리밍."""
+    session_factory = read_session_factory(user_seq)
+    db = session_factory()
+    lookup_db = session_factory()
+    try:
+        project = db.get(Project, project_seq) if project_seq else None
+        rows = iter_point_export_rows(build_point_export_query(db, project, **filters), lookup_db) if project else iter(())
+        if export_format == "csv":
+            yield from iter_csv_bytes(EXPORT_HEADER, rows)
+        else:
+            yield from iter_xlsx_bytes(EXPORT_SHEET_TITLE, EXPORT_HEADER, rows)
+    finally:
+        lookup_db.close()
+        db.close()
+
+
 @router.get("/export")
 def export_point_usage(
     project_id: int = Query(None),
@@ -29,119 +54,28 @@ def export_point_usage(
     date_from: str = Query(""),
     date_to: str = Query(""),
     point_type: str = Query(""),
+    export_format: str = Query("xlsx", alias="format", pattern="^(xlsx|csv)$"),
     current_user: Manager = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     now = datetime.now()
+    current_project = get_export_project(db, current_user.company_id, project_id)
 
-    maintenance_projects = (
-        db.query(Project)
-        .filter(Project.company_id == current_user.company_id, Project.point > 0, Project.contract_date <= now, Project.contract_termination_date >= now)
-        .order_by(Project.created_at.desc())
-        .all()
-    )
-
-    current_project = None
-    if maintenance_projects:
-        if project_id:
-            current_project = next((p for p in maintenance_projects if p.seq == project_id), maintenance_projects[0])
-        else:
-            current_project = maintenance_projects[0]
-
-    if not current_project:
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "포인트사용내역"
-        ws.append(["날짜", "구분", "상태", "담당유형", "내용", "관련 요청", "포인트", "포인트구분"])
-        buffer = BytesIO()
-        wb.save(buffer)
-        buffer.seek(0)
-        filename = f"포인트사용내역_없음_{datetime.now().strftime('%Y%m%d')}.xlsx"
-        return Response(
-            content=buffer.getvalue(),
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"}
-        )
-
-    contract_start = current_project.contract_date
-    contract_end = current_project.contract_termination_date
-
-    history_query = (
-        db.query(PointHistory)
-        .outerjoin(Managelist, PointHistory.managelist_id == Managelist.seq)
-        .filter(PointHistory.project_id == current_project.seq, PointHistory.created_at >= contract_start, PointHistory.created_at <= contract_end)
-    )
-
-    if search_text:
-        history_query = history_query.filter(or_(PointHistory.content.ilike(f"%{search_text}%"), Managelist.title.ilike(f"%{search_text}%")))
-    if date_from:
-        try:
-            history_query = history_query.filter(PointHistory.created_at >= datetime.strptime(date_from, "%Y-%m-%d"))
-        except ValueError:
-            pass
-    if date_to:
-        try:
-            date_to_end = datetime.strptime(date_to, "%Y-%m-%d") + timedelta(days=1) - timedelta(seconds=1)
-            history_query = history_query.filter(PointHistory.created_at <= date_to_end)
-        except ValueError:
-            pass
-    if point_type:
-        try:
-            history_query = history_query.filter(PointHistory.point_type == int(point_type))
-        except ValueError:
-            pass
-
-    point_histories = history_query.order_by(PointHistory.created_at.desc()).all()
-
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "포인트사용내역"
-    ws.append(["날짜", "구분", "상태", "담당유형", "내용", "관련 요청", "포인트", "포인트구분"])
-
-    point_type_map = {"1": "충전", "2": "사용", "3": "책정"}
-    status_map = {"1": "입력", "2": "실행"}
-    worker_type_map = {"1": "계약", "2": "기획", "3": "디자인", "4": "프론트엔드", "5": "백엔드", "6": "유지보수"}
-    point_category_map = {"1": "유지보수", "2": "개발"}
-
-    for ph in point_histories:
-        managelist_title = ""
-        actual_worker_type = ph.worker_type
-        if ph.managelist_id:
-            if ph.managelist:
-                managelist_title = ph.managelist.title or ""
-            comment = (
-                db.query(ManagelistComment)
-                .filter(ManagelistComment.managelist_id == ph.managelist_id, ManagelistComment.point > 0)
-                .order_by(ManagelistComment.created_at.desc())
-                .first()
-            )
-            if comment and comment.worker_type:
-                actual_worker_type = comment.worker_type
+    if current_project:
+        project_title = current_project.title or "프로젝트"
+        filename = f"포인트사용내역_{project_title}_{now.strftime('%Y%m%d')}.{export_format}"
+    else:
+        filename = f"포인트사용내역_없음_{now.strftime('%Y%m%d')}.{export_format}"
 
-        ws.append([
-            ph.created_at.strftime("%Y-%m-%d %H:%M:%S") if ph.created_at else "",
-            point_type_map.get(str(ph.point_type) if ph.point_type else "", ""),
-            status_map.get(str(ph.status) if ph.status else "", ""),
-            worker_type_map.get(str(actual_worker_type) if actual_worker_type else "", "") if actual_worker_type else "",
-            ph.content or "",
-            managelist_title,
-            abs(ph.point) if ph.point else 0,
-            point_category_map.get(ph.point_category or "1", "유지보수"),
-        ])
-
-    buffer = BytesIO()
-    wb.save(buffer)
-    buffer.seek(0)
-    project_title = current_project.title or "프로젝트"
-    filename = f"포인트사용내역_{project_title}_{datetime.now().strftime('%Y%m%d')}.xlsx"
-    return Response(
-        content=buffer.getvalue(),
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    filters = {"search_text": search_text, "date_from": date_from, "date_to": date_to, "point_type": point_type}
+    return StreamingResponse(
+        _stream_point_export(current_user.seq, current_project.seq if current_project else None, filters, export_format),
+        media_type=CSV_MEDIA_TYPE if export_format == "csv" else XLSX_MEDIA_TYPE,
         headers={"Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"}
     )
 
 
-@router.get("")
+@router.get("", response_model=PointUsageResponse)
 def get_point_usage(
     project_id: int = Query(None),
     search_text: str = Query(""),
@@ -152,7 +86,7 @@ def get_point_usage(
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
     current_user: Manager = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     now = datetime.now()
     company_id = current_user.company_id
@@ -280,12 +214,12 @@ def get_point_usage(
             PointHistory.status == 2, PointHistory.created_at >= contract_start, PointHistory.created_at <= contract_end
         ).all()
 
+        stats_comments = get_latest_pointed_comments(db, (ph.managelist_id for ph in point_histories_for_stats))
+
         worker_stats_dict = {}
         for ph in point_histories_for_stats:
             if ph.managelist_id:
-                comment = db.query(ManagelistComment).filter(
-                    ManagelistComment.managelist_id == ph.managelist_id, ManagelistComment.point > 0
-                ).order_by(ManagelistComment.created_at.desc()).first()
+                comment = stats_comments.get(ph.managelist_id)
                 if comment and comment.writer:
                     writer_name = comment.writer.name or comment.writer.username or "미지정"
                     worker_type = comment.worker_type or ph.worker_type or 0
@@ -365,7 +299,14 @@ def get_point_usage(
 
     total_count = history_query.count()
     total_pages = math.ceil(total_count / per_page)
-    point_histories = history_query.order_by(PointHistory.created_at.desc()).offset((page - 1) * per_page).limit(per_page).all()
+    point_histories = (
+        history_query.options(contains_eager(PointHistory.managelist))
+        .order_by(PointHistory.created_at.desc())
+        .offset((page - 1) * per_page)
+        .limit(per_page)
+        .all()
+    )
+    latest_comments = get_latest_pointed_comments(db, (ph.managelist_id for ph in point_histories))
 
     history_items = []
     for ph in point_histories:
@@ -374,9 +315,7 @@ def get_point_usage(
         if ph.managelist_id:
             if ph.managelist:
                 managelist_title = ph.managelist.title or ""
-            comment = db.query(ManagelistComment).filter(
-                ManagelistComment.managelist_id == ph.managelist_id, ManagelistComment.point > 0
-            ).order_by(ManagelistComment.created_at.desc()).first()
+            comment = latest_comments.get(ph.managelist_id)
             if comment and comment.worker_type:
                 actual_worker_type = comment.worker_type
         history_items.append({
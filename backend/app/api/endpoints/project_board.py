@@ -8,13 +8,14 @@ from urllib.parse import quote
 
 from fastapi import APIRouter, Depends, HTTPException, Query, File, UploadFile, Form
 from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy import func, or_
 
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user, get_read_db
 from app.db.session import get_db
 from app.models.manager import Manager
 from app.models.company import Company
+from app.services.view_counter import pending_views, record_view
 from app.services.email import (
     notify_project_board_created,
     notify_project_board_reply_created,
@@ -29,6 +30,7 @@ from app.models.customer import (
     ProjectBoardCommentAttachment,
     project_board_categories,
 )
+from app.schemas.project_board import ProjectBoardDetailResponse
 
 router = APIRouter(prefix="/project-board", tags=["project-board"])
 
@@ -74,7 +76,7 @@ def save_upload_file(file: UploadFile, upload_dir: str) -> tuple[str, str, int]:
 @router.get("/projects")
 def list_company_projects(
     current_user: Manager = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     company_id = current_user.company_id
     today = date.today()
@@ -113,7 +115,7 @@ def list_company_projects(
 def list_project_categories(
     project_seq: int,
     current_user: Manager = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     company_id = current_user.company_id
 
@@ -160,7 +162,7 @@ def list_project_boards(
     category_id: Optional[int] = Query(None),
     status: Optional[str] = Query(None),
     current_user: Manager = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     company_id = current_user.company_id
 
@@ -260,7 +262,7 @@ def list_project_boards(
             "status": board.status,
             "status_label": STATUS_LABELS.get(board.status, ""),
             "is_notice": board.is_notice,
-            "views": board.views or 0,
+            "views": (board.views or 0) + pending_views("project_board", board.seq),
             "reply_count": reply_count,
             "comment_count": comment_count,
             "has_attachment": attachment_count > 0,
@@ -276,11 +278,11 @@ def list_project_boards(
     }
 
 
-@router.get("/{seq}")
+@router.get("/{seq}", response_model=ProjectBoardDetailResponse)
 def get_project_board_detail(
     seq: int,
     current_user: Manager = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     company_id = current_user.company_id
 
@@ -288,13 +290,14 @@ def get_project_board_detail(
         db.query(ProjectBoard)
         .options(
             joinedload(ProjectBoard.project),
-            joinedload(ProjectBoard.categories),
             joinedload(ProjectBoard.admin_writer),
             joinedload(ProjectBoard.customer_writer),
-            joinedload(ProjectBoard.board_attachments),
-            joinedload(ProjectBoard.comments).joinedload(ProjectBoardComment.admin_writer),
-            joinedload(ProjectBoard.comments).joinedload(ProjectBoardComment.customer_writer),
-            joinedload(ProjectBoard.comments).joinedload(ProjectBoardComment.comment_attachments),
+            # 컬렉션은 selectinload로 따로 조회 (댓글 × 첨부 × 카테고리 카티전 곱 방지)
+            selectinload(ProjectBoard.categories),
+            selectinload(ProjectBoard.board_attachments),
+            selectinload(ProjectBoard.comments).joinedload(ProjectBoardComment.admin_writer),
+            selectinload(ProjectBoard.comments).joinedload(ProjectBoardComment.customer_writer),
+            selectinload(ProjectBoard.comments).selectinload(ProjectBoardComment.comment_attachments),
         )
         .filter(ProjectBoard.seq == seq, ProjectBoard.company_id == company_id)
         .first()
@@ -303,9 +306,8 @@ def get_project_board_detail(
     if not board:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
 
-    # 조회수 증가
-    board.views = (board.views or 0) + 1
-    db.commit()
+    # 조회수 증가 (버퍼에 모았다가 주기적으로 일괄 반영)
+    record_view("project_board", board.seq)
 
     # 답글 목록
     replies_db = (
@@ -313,7 +315,7 @@ def get_project_board_detail(
         .options(
             joinedload(ProjectBoard.admin_writer),
             joinedload(ProjectBoard.customer_writer),
-            joinedload(ProjectBoard.board_attachments),
+            selectinload(ProjectBoard.board_attachments),
         )
         .filter(ProjectBoard.parent_id == seq)
         .order_by(ProjectBoard.created_at.asc())
@@ -333,7 +335,7 @@ def get_project_board_detail(
                 "id": att.seq,
                 "name": att.filename,
                 "file_size": att.file_size or 0,
-                "uploaded_at": att.uploaded_at.isoformat() if att.uploaded_at else None,
+                "uploaded_at": att.uploaded_at,
             }
             for att in attachments
         ]
@@ -357,7 +359,7 @@ def get_project_board_detail(
                 }
                 for ca in comment.comment_attachments
             ],
-            "created_at": comment.created_at.isoformat() if comment.created_at else None,
+            "created_at": comment.created_at,
         }
 
     comments = [format_comment(c) for c in board.comments]
@@ -374,7 +376,7 @@ def get_project_board_detail(
             "status_label": STATUS_LABELS.get(r.status, ""),
             "is_mine": r.writer_type == "2" and r.customer_writer_id == current_user.seq,
             "attachments": format_attachments(r.board_attachments),
-            "created_at": r.created_at.isoformat() if r.created_at else None,
+            "created_at": r.created_at,
         })
 
     categories_list = [
@@ -399,13 +401,13 @@ def get_project_board_detail(
         "status": board.status,
         "status_label": STATUS_LABELS.get(board.status, ""),
         "is_notice": board.is_notice,
-        "views": board.views or 0,
+        "views": (board.views or 0) + pending_views("project_board", board.seq),
         "is_mine": board.writer_type == "2" and board.customer_writer_id == current_user.seq,
         "attachments": format_attachments(board.board_attachments),
         "comments": comments,
         "replies": replies,
-        "created_at": board.created_at.isoformat() if board.created_at else None,
-        "updated_at": board.updated_at.isoformat() if board.updated_at else None,
+        "created_at": board.created_at,
+        "updated_at": board.updated_at,
     }
 
 
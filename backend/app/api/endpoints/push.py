@@ -4,9 +4,10 @@ from sqlalchemy.orm import Session
 from app.core.deps import get_current_user
 from app.db.session import get_db
 from app.models.manager import Manager
-from app.schemas.push import PushTokenRegister, PushTokenResponse, PushSendRequest
+from app.schemas.push import PushTokenBatchRegister, PushTokenRegister, PushTokenResponse, PushSendRequest
 from app.services.push import (
     register_token,
+    register_tokens,
     unregister_token,
     get_active_tokens,
     send_push_to_user,
@@ -31,10 +32,31 @@ def register_push_token(
         manager_seq=current_user.seq,
         token=request.token,
         platform=request.platform,
+        device_id=request.device_id,
     )
     return token
 
 
+@router.post("/register/batch", response_model=list[PushTokenResponse])
+def register_push_tokens(
+    request: PushTokenBatchRegister,
+    current_user: Manager = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """한 기기의 푸시 토큰 여러 개를 한 번에 등록. 같은 기기의 이전 토큰은 비활성화."""
+    if any(t.platform not in ("ios", "android") for t in request.tokens):
+        raise HTTPException(status_code=400, detail="platform must be 'ios' or 'android'")
+
+    return register_tokens(
+        db=db,
+        manager_seq=current_user.seq,
+        tokens=[
+            {"token": t.token, "platform": t.platform, "device_id": t.device_id or request.device_id}
+            for t in request.tokens
+        ],
+    )
+
+
 @router.delete("/unregister")
 def unregister_push_token(
     request: PushTokenRegister,
@@ -11,7 +11,7 @@ from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func
 
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user, get_read_db
 from app.db.session import get_db
 from app.models.manager import Manager
 from app.models.customer import Inditask, InditaskComment
@@ -67,7 +67,7 @@ def list_tasks(
     status: str = Query("", description="Filter by task_status (1-4)"),
     task_type: str = Query("", description="Filter by task_type (1-7)"),
     current_user: Manager = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     company_id = current_user.company_id
 
@@ -222,7 +222,7 @@ def download_task_file(
 def get_task_detail(
     task_id: int,
     current_user: Manager = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     company_id = current_user.company_id
 
@@ -10,7 +10,10 @@ from app.core.config import settings
 from app.db.session import get_db
 from app.models.manager import Manager
 from app.models.push_token import PushToken
+from app.services.news_catalog import invalidate_news_catalog
+from app.services.news_visibility import refresh_news_visibility
 from app.services.push import send_push_notification
+from app.services.realtime import publish_event
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +96,14 @@ EVENT_PUSH_CONFIG = {
 }
 
 
+def _realtime_company_ids(event_type: str, data: WebhookData) -> list[int] | None:
+    """실시간 이벤트를 받을 회사 목록. 회사 지정이 없는 새소식은 전체(None)."""
+    if event_type == "news_register":
+        company_ids = [c.get("company_id") for c in data.companies or [] if c.get("company_id")]
+        return company_ids or None
+    return [data.company_id] if data.company_id else []
+
+
 def _verify_api_key(x_api_key: str = Header(...)):
     if not hmac.compare_digest(x_api_key, settings.WEBHOOK_API_KEY):
         raise HTTPException(status_code=403, detail="Invalid API key")
@@ -115,6 +126,29 @@ def receive_pacms_webhook(
         logger.warning(f"Unsupported event type: {event_type}")
         return {"status": "ignored", "reason": f"Unsupported event type: {event_type}"}
 
+    if event_type == "news_register":
+        if data.news_id:
+            try:
+                refresh_news_visibility(db, data.news_id)
+                db.commit()
+            except Exception as e:
+                # 노출 인덱스는 주기적 재구성으로 맞춰지므로 알림 발송은 계속
+                db.rollback()
+                logger.error(f"Failed to refresh news visibility for news {data.news_id}: {e}")
+        invalidate_news_catalog()
+
+    # 연결된 클라이언트에 변경 알림 (캐시 갱신 후 발행해야 클라이언트가 새 데이터를 받음)
+    target_id = getattr(data, config["id_field"], None)
+    publish_event(
+        _realtime_company_ids(event_type, data),
+        {
+            "type": event_type,
+            "target_id": str(target_id) if target_id else "",
+            "route": f"{config['route_prefix']}{target_id}" if target_id else "",
+            "title": data.title or "",
+        },
+    )
+
     if event_type == "news_register":
         companies_list = data.companies or []
         if not companies_list:
@@ -151,7 +185,6 @@ def receive_pacms_webhook(
     if event_type == "dev_request_comment":
         body = "개발 요청에 답변이 등록되었습니다."
 
-    target_id = getattr(data, config["id_field"], None)
     push_data = {
         "type": event_type,
         "target_id": str(target_id) if target_id else "",
@@ -0,0 +1,160 @@
+"""
+응답 압축 미들웨어.
+
+클라이언트가 Accept-Encoding으로 허용하면 brotli(패키지가 설치된 경우) 또는 gzip으로
+응답 본문을 압축한다. COMPRESSION_CONTENT_TYPES에 있는 타입만 대상이므로 PDF/XLSX/ZIP
+같은 이미 압축된 다운로드와 SSE(text/event-stream)는 그대로 보낸다. 한 번에 보내는
+응답은 COMPRESSION_MIN_SIZE보다 작으면 압축하지 않고, 스트리밍 응답은 청크마다
+flush해서 클라이언트가 도착한 만큼 바로 받을 수 있게 한다.
+"""
+
+import zlib
+
+from app.core.config import settings
+
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+GZIP_LEVEL = 6
+# 동적 응답용: 높은 품질은 CPU 대비 이득이 작음
+BROTLI_QUALITY = 4
+# 부분 응답/본문 없는 응답은 압축하지 않음
+SKIP_STATUS = {204, 206, 304}
+
+
+def _choose_encoding(accept_encoding: str) -> str | None:
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+    if HAS_BROTLI and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+class _Compressor:
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._gzip = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._br.process(data) + self._br.flush()
+        return self._gzip.compress(data) + self._gzip.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._br.finish()
+        return self._gzip.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """허용된 content-type 응답을 gzip/brotli로 압축."""
+
+    def __init__(self, app):
+        self.app = app
+        self.content_types = settings.compression_content_types
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = b""
+        for key, value in scope.get("headers", []):
+            if key == b"accept-encoding":
+                accept_encoding = value
+                break
+        encoding = _choose_encoding(accept_encoding.decode("latin-1"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        state = {"start": None, "compressor": None, "passthrough": False}
+
+        def eligible(message) -> bool:
+            if message["status"] in SKIP_STATUS:
+                return False
+            content_type = ""
+            for key, value in message.get("headers", []):
+                if key == b"content-encoding":
+                    return False
+                if key == b"content-type":
+                    content_type = value.decode("latin-1").split(";")[0].strip().lower()
+                if key == b"content-length" and int(value) < settings.COMPRESSION_MIN_SIZE:
+                    return False
+            return content_type in self.content_types
+
+        def compressed_headers(start, length: int | None) -> list:
+            headers = []
+            for key, value in start.get("headers", []):
+                if key in (b"content-length", b"content-encoding"):
+                    continue
+                if key == b"etag" and not value.startswith(b"W/"):
+                    # 표현이 달라지므로 강한 ETag는 약한 ETag로
+                    value = b"W/" + value
+                if key == b"vary":
+                    continue
+                headers.append((key, value))
+            vary = [v for k, v in start.get("headers", []) if k == b"vary"]
+            headers.append((b"vary", b", ".join(vary + [b"Accept-Encoding"]) if vary else b"Accept-Encoding"))
+            headers.append((b"content-encoding", encoding.encode()))
+            if length is not None:
+                headers.append((b"content-length", str(length).encode()))
+            return headers
+
+        async def send_compressed(message):
+            if message["type"] == "http.response.start":
+                if eligible(message):
+                    state["start"] = message
+                else:
+                    state["passthrough"] = True
+                    await send(message)
+                return
+            if message["type"] != "http.response.body" or state["passthrough"]:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            start = state["start"]
+
+            if state["compressor"] is None:
+                if not more_body:
+                    # 한 번에 보내는 응답: 작으면 그대로
+                    state["passthrough"] = True
+                    if len(body) < settings.COMPRESSION_MIN_SIZE:
+                        await send(start)
+                        await send(message)
+                        return
+                    compressor = _Compressor(encoding)
+                    data = compressor.compress(body) + compressor.finish()
+                    await send({**start, "headers": compressed_headers(start, len(data))})
+                    await send({"type": "http.response.body", "body": data})
+                    return
+                state["compressor"] = _Compressor(encoding)
+                await send({**start, "headers": compressed_headers(start, None)})
+
+            compressor = state["compressor"]
+            data = compressor.compress(body) if body else b""
+            if not more_body:
+                data += compressor.finish()
+            if data or not more_body:
+                await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
@@ -4,24 +4,25 @@ from jose import jwt, JWTError
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
-from app.db.session import get_db
+from app.db.session import ReadSessionLocal, get_db, use_replica
 from app.models.manager import Manager
 
 security = HTTPBearer()
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
-) -> Manager:
+def get_user_from_token(token: str, db: Session, scope: str | None = None) -> Manager:
+    """
+    토큰의 사용자 조회. scope를 주면 그 용도로 발급한 토큰만 받는다
+    (용도가 정해진 토큰은 일반 API 인증에 쓸 수 없음).
+    """
     try:
         payload = jwt.decode(
-            credentials.credentials,
+            token,
             settings.SECRET_KEY,
             algorithms=[settings.ALGORITHM],
         )
         user_seq: str = payload.get("sub")
-        if user_seq is None:
+        if user_seq is None or payload.get("scope") != scope:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token",
@@ -39,3 +40,28 @@ def get_current_user(
             detail="User not found",
         )
     return user
+
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db),
+) -> Manager:
+    user = get_user_from_token(credentials.credentials, db)
+    # 이 요청의 쓰기 커밋을 사용자에게 연결 (레플리카 read-your-writes)
+    db.info["user_seq"] = user.seq
+    return user
+
+
+def get_read_db(
+    current_user: Manager = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """읽기 전용 엔드포인트용 세션. 레플리카가 있고 이 사용자의 최근 쓰기가 없으면 레플리카."""
+    if not use_replica(current_user.seq):
+        yield db
+        return
+    read_db = ReadSessionLocal()
+    try:
+        yield read_db
+    finally:
+        read_db.close()
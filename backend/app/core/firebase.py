@@ -1,30 +1,48 @@
 import logging
-
-import firebase_admin
-from firebase_admin import credentials, messaging
+import threading
 
 from app.core.config import settings
+from app.core.metrics import push_messages_total
 
 logger = logging.getLogger(__name__)
 
 _firebase_app = None
+_init_attempted = False
+_init_lock = threading.Lock()
 
 
 def init_firebase():
-    """Firebase Admin SDK 초기화. FIREBASE_CREDENTIALS_PATH가 비어있으면 스킵."""
-    global _firebase_app
-    if _firebase_app:
+    """
+    Firebase Admin SDK 초기화. FIREBASE_CREDENTIALS_PATH가 비어있으면 스킵.
+
+    firebase_admin(과 google 클라이언트 라이브러리)은 무거우므로 워커 시작 시가 아니라
+    첫 푸시 발송 때 import 한다. 초기화는 프로세스당 한 번만 시도한다.
+    """
+    global _firebase_app, _init_attempted
+    if _init_attempted:
+        return _firebase_app
+
+    with _init_lock:
+        if _init_attempted:
+            return _firebase_app
+        _init_attempted = True
+        _firebase_app = _initialize()
         return _firebase_app
 
+
+def _initialize():
     if not settings.FIREBASE_CREDENTIALS_PATH:
         logger.warning("FIREBASE_CREDENTIALS_PATH not set. Push notifications disabled.")
         return None
 
     try:
+        import firebase_admin
+        from firebase_admin import credentials
+
         cred = credentials.Certificate(settings.FIREBASE_CREDENTIALS_PATH)
-        _firebase_app = firebase_admin.initialize_app(cred)
+        firebase_app = firebase_admin.initialize_app(cred)
         logger.info("Firebase Admin SDK initialized successfully.")
-        return _firebase_app
+        return firebase_app
     except Exception as e:
         logger.error(f"Failed to initialize Firebase: {e}")
         return None
@@ -32,13 +50,15 @@ def init_firebase():
 
 def send_push(tokens: list[str], title: str, body: str, data: dict | None = None) -> int:
     """FCM 메시지 전송. 성공한 메시지 수를 반환."""
-    if not _firebase_app:
-        logger.warning("Firebase not initialized. Skipping push notification.")
+    if not tokens:
         return 0
 
-    if not tokens:
+    if not init_firebase():
+        logger.warning("Firebase not initialized. Skipping push notification.")
         return 0
 
+    from firebase_admin import messaging
+
     notification = messaging.Notification(title=title, body=body)
     message = messaging.MulticastMessage(
         tokens=tokens,
@@ -49,6 +69,8 @@ def send_push(tokens: list[str], title: str, body: str, data: dict | None = None
     try:
         response = messaging.send_each_for_multicast(message)
         logger.info(f"Push sent: {response.success_count} success, {response.failure_count} failure")
+        push_messages_total.inc(response.success_count, result="success")
+        push_messages_total.inc(response.failure_count, result="failure")
 
         if response.failure_count > 0:
             for i, send_response in enumerate(response.responses):
@@ -61,4 +83,5 @@ def send_push(tokens: list[str], title: str, body: str, data: dict | None = None
         return response.success_count
     except Exception as e:
         logger.error(f"Failed to send push notification: {e}")
+        push_messages_total.inc(len(tokens), result="failure")
         return 0
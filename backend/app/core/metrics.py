@@ -0,0 +1,419 @@
+"""
+Prometheus 텍스트 형식 메트릭.
+
+카운터/게이지/히스토그램을 프로세스 메모리에 모으고, 워커 간 합산은 METRICS_DIR 아래
+워커별 JSON 스냅샷(METRICS_SNAPSHOT_SECONDS 주기)으로 한다. /metrics 를 받은 워커는
+자기 값과 같은 실행(_run_id)의 다른 워커 스냅샷을 합쳐 내보낸다. 종료된 워커의
+카운터/히스토그램은 실행별 합계 파일 하나로 합치고 스냅샷은 지우며, 게이지는 버린다.
+"""
+
+import atexit
+import fcntl
+import glob
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from typing import Callable
+
+from app.core.config import settings
+from app.db.session import engine
+
+logger = logging.getLogger(__name__)
+
+METRICS_DIR = "/tmp/hcms-metrics"
+RUN_ID_ENV = "HCMS_METRICS_RUN_ID"
+AGGREGATE_PREFIX = "aggregate-"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PDF_RENDER_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+
+_registry: dict[str, "_Metric"] = {}
+_lock = threading.Lock()
+_writer: threading.Thread | None = None
+# 이 프로세스의 워커 ID와 생존 표시 잠금 (fork 후 새로 만듦)
+_process: dict = {"pid": None, "id": "", "alive_lock": None}
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._values: dict[tuple, object] = {}
+        _registry[name] = self
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels.get(n, "")) for n in self.labelnames)
+
+    def samples(self) -> list[list]:
+        with _lock:
+            return [[list(k), v if not isinstance(v, list) else list(v)] for k, v in self._values.items()]
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with _lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """collect를 주면 스냅샷 시점에 값을 읽는다 (DB 풀 등)."""
+
+    type = "gauge"
+
+    def __init__(self, name, help, labelnames=(), collect: Callable[[], float] | None = None):
+        super().__init__(name, help, labelnames)
+        self._collect = collect
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with _lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def samples(self) -> list[list]:
+        if self._collect is not None:
+            try:
+                return [[[], self._collect()]]
+            except Exception:
+                return []
+        return super().samples()
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(self, name, help, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with _lock:
+            # 버킷별 개수(비누적) + [sum, count]
+            values = self._values.get(key)
+            if values is None:
+                values = self._values[key] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    values[i] += 1
+                    break
+            values[-2] += value
+            values[-1] += 1
+
+
+def _snapshot() -> dict:
+    return {name: metric.samples() for name, metric in _registry.items()}
+
+
+def _worker_id() -> str:
+    """프로세스별 고유 ID. fork 후 새로 만들며, PID가 재사용돼도 이전 워커의 파일을 덮어쓰지 않는다."""
+    if _process["pid"] != os.getpid():
+        _process.update(pid=os.getpid(), id=f"{os.getpid()}-{uuid.uuid4().hex[:12]}", alive_lock=None)
+    return _process["id"]
+
+
+def _run_id() -> str:
+    """
+    같은 서버 실행에 속한 워커가 공유하는 ID ("<실행 주체 pid>-<구분자>").
+
+    app.server 마스터는 fork 전에 RUN_ID_ENV를 설정하고, uvicorn --workers 워커는 부모 프로세스,
+    단일 프로세스는 자기 자신이 실행 주체다. 다른 실행의 스냅샷은 합산하지 않는다.
+    """
+    run_id = os.environ.get(RUN_ID_ENV)
+    if run_id:
+        return run_id
+    parent = multiprocessing.parent_process()
+    if parent is not None:
+        return f"{parent.pid}-mp"
+    return _worker_id()
+
+
+def _path(name: str, ext: str = "json") -> str:
+    return os.path.join(METRICS_DIR, f"{name}.{ext}")
+
+
+def _hold_alive_lock() -> None:
+    # 프로세스가 끝날 때까지 잡고 있는 잠금. 잠금을 잡을 수 있으면 그 워커는 종료된 것
+    if _process["alive_lock"] is None:
+        lock_file = open(_path(_worker_id(), "lock"), "a")
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        _process["alive_lock"] = lock_file
+
+
+def _worker_alive(worker_id: str) -> bool:
+    try:
+        fd = os.open(_path(worker_id, "lock"), os.O_RDWR)
+    except FileNotFoundError:
+        return False
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return True
+    finally:
+        os.close(fd)
+    return False
+
+
+def _run_alive(run_id: str) -> bool:
+    try:
+        return _pid_alive(int(run_id.split("-")[0]))
+    except ValueError:
+        return False
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _write_json(path: str, data: dict) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: str) -> dict | None:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_snapshot() -> None:
+    try:
+        os.makedirs(METRICS_DIR, exist_ok=True)
+        _hold_alive_lock()
+        _write_json(_path(_worker_id()), {"run": _run_id(), "metrics": _snapshot()})
+    except OSError as e:
+        logger.warning(f"Failed to write metrics snapshot: {e}")
+
+
+def _writer_loop() -> None:
+    while True:
+        time.sleep(settings.METRICS_SNAPSHOT_SECONDS)
+        write_snapshot()
+
+
+def ensure_snapshot_writer() -> None:
+    global _writer
+    if _writer is not None:
+        return
+    with _lock:
+        if _writer is None:
+            _writer = threading.Thread(target=_writer_loop, name="metrics-snapshot", daemon=True)
+            _writer.start()
+            atexit.register(write_snapshot)
+
+
+def _merge(merged: dict[str, dict[tuple, object]], snapshot: dict, counters_only: bool = False) -> None:
+    for name, samples in snapshot.items():
+        metric = _registry.get(name)
+        if metric is None or (counters_only and metric.type == "gauge"):
+            continue
+        values = merged.setdefault(name, {})
+        for labels, value in samples:
+            key = tuple(labels)
+            if isinstance(value, list):
+                current = values.get(key)
+                values[key] = value if current is None else [a + b for a, b in zip(current, value)]
+            else:
+                values[key] = values.get(key, 0) + value
+
+
+def _compact(run_id: str) -> None:
+    """
+    종료된 워커의 스냅샷을 실행별 합계 파일(aggregate-<run>.json)에 합치고 지움 (게이지는 버림).
+
+    다른 실행의 파일은 합치지 않고, 그 실행의 주체가 끝났으면 지운다. 디렉터리 잠금 안에서 호출.
+    """
+    aggregate_path = _path(f"{AGGREGATE_PREFIX}{run_id}")
+    folded: dict[str, dict[tuple, object]] | None = None
+    removable = []
+    for path in glob.glob(os.path.join(METRICS_DIR, "*.json")):
+        name = os.path.basename(path)[:-len(".json")]
+        if name.startswith(AGGREGATE_PREFIX):
+            other_run = name[len(AGGREGATE_PREFIX):]
+            if other_run != run_id and not _run_alive(other_run):
+                removable.append(path)
+            continue
+        if name == _worker_id() or _worker_alive(name):
+            continue
+        data = _read_json(path) or {}
+        if data.get("run") == run_id:
+            if folded is None:
+                folded = {}
+                _merge(folded, (_read_json(aggregate_path) or {}).get("metrics", {}))
+            _merge(folded, data.get("metrics", {}), counters_only=True)
+        elif _run_alive(data.get("run", "")):
+            # 진행 중인 다른 실행의 워커 파일은 그 실행의 워커가 합침
+            continue
+        removable += [path, _path(name, "lock")]
+
+    if folded is not None:
+        samples = {name: [[list(k), v] for k, v in values.items()] for name, values in folded.items()}
+        _write_json(aggregate_path, {"run": run_id, "metrics": samples})
+    # 합계를 기록한 뒤에 지워야 중간에 실패해도 값이 사라지지 않음
+    for path in removable:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _collect_all() -> dict[str, dict[tuple, object]]:
+    """
+    같은 실행의 워커 스냅샷(자기 것 포함) + 종료된 워커 합계.
+
+    자기 값도 먼저 파일로 기록한 뒤 파일만 합산한다. 어느 워커가 응답해도 각 워커의 값은 마지막으로
+    기록된 값이므로, 요청마다 다른 워커가 응답해도 카운터가 줄지 않는다.
+    """
+    run_id = _run_id()
+    merged: dict[str, dict[tuple, object]] = {name: {} for name in _registry}
+    try:
+        os.makedirs(METRICS_DIR, exist_ok=True)
+        # 합치는 도중의 파일을 두 번 세지 않도록 기록/정리/읽기를 한 잠금 안에서 함
+        with open(os.path.join(METRICS_DIR, ".compact.lock"), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            write_snapshot()
+            _compact(run_id)
+            for path in glob.glob(os.path.join(METRICS_DIR, "*.json")):
+                name = os.path.basename(path)[:-len(".json")]
+                data = _read_json(path)
+                if data is None or data.get("run") != run_id:
+                    continue
+                # 마지막 정리 후에 종료된 워커면 게이지만 버림
+                dead = not name.startswith(AGGREGATE_PREFIX) and name != _worker_id() and not _worker_alive(name)
+                _merge(merged, data.get("metrics", {}), counters_only=dead)
+    except OSError as e:
+        logger.warning(f"Failed to read metrics snapshots: {e}")
+        _merge(merged, _snapshot())
+    return merged
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names, values, extra: tuple[str, str] | None = None) -> str:
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in pairs) + "}"
+
+
+def render_metrics() -> str:
+    """모든 워커를 합산한 텍스트 exposition."""
+    lines = []
+    for name, values in _collect_all().items():
+        metric = _registry[name]
+        lines.append(f"# HELP {name} {metric.help}")
+        lines.append(f"# TYPE {name} {metric.type}")
+        for key, value in sorted(values.items()):
+            if metric.type == "histogram":
+                cumulative = 0
+                for bound, n in zip(metric.buckets, value):
+                    cumulative += n
+                    lines.append(f"{name}_bucket{_format_labels(metric.labelnames, key, ('le', str(bound)))} {cumulative}")
+                lines.append(f"{name}_bucket{_format_labels(metric.labelnames, key, ('le', '+Inf'))} {value[-1]}")
+                lines.append(f"{name}_sum{_format_labels(metric.labelnames, key)} {value[-2]}")
+                lines.append(f"{name}_count{_format_labels(metric.labelnames, key)} {value[-1]}")
+            else:
+                lines.append(f"{name}{_format_labels(metric.labelnames, key)} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def _pool_stat(attr: str) -> Callable[[], float]:
+    def collect() -> float:
+        # overflow()는 풀이 다 차기 전에는 음수
+        return max(0, getattr(engine.pool, attr)())
+    return collect
+
+
+# === 메트릭 정의 ===
+
+http_requests_total = Counter(
+    "hcms_http_requests_total", "HTTP requests by route and status.", ("method", "route", "status")
+)
+http_request_duration_seconds = Histogram(
+    "hcms_http_request_duration_seconds", "HTTP request latency by route.", ("method", "route")
+)
+http_requests_in_flight = Gauge("hcms_http_requests_in_flight", "HTTP requests currently being handled.")
+upload_bytes_total = Counter(
+    "hcms_upload_bytes_total", "Bytes received in multipart upload requests by route.", ("route",)
+)
+db_pool_size = Gauge("hcms_db_pool_size", "Configured DB connection pool size.", collect=_pool_stat("size"))
+db_pool_checked_out = Gauge(
+    "hcms_db_pool_checked_out", "DB connections currently checked out.", collect=_pool_stat("checkedout")
+)
+db_pool_overflow = Gauge("hcms_db_pool_overflow", "DB connections open beyond the pool size.", collect=_pool_stat("overflow"))
+email_queue_depth = Gauge("hcms_email_queue_depth", "Notification emails waiting to be sent.")
+emails_sent_total = Counter("hcms_emails_sent_total", "Notification email send attempts.", ("result",))
+push_messages_total = Counter("hcms_push_messages_total", "FCM push messages by result.", ("result",))
+pdf_render_seconds = Histogram(
+    "hcms_pdf_render_seconds", "PDF render time including queueing.", ("kind",), buckets=PDF_RENDER_BUCKETS
+)
+pdf_render_failures_total = Counter("hcms_pdf_render_failures_total", "PDF renders that failed or timed out.", ("kind",))
+
+
+class MetricsMiddleware:
+    """라우트별 요청 수/지연시간, 처리 중 요청 수, multipart 업로드 바이트 집계."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        ensure_snapshot_writer()
+        started = time.perf_counter()
+        status = {"code": 500}
+        received = {"bytes": 0}
+        is_upload = any(
+            k == b"content-type" and v.startswith(b"multipart/form-data") for k, v in scope.get("headers", [])
+        )
+
+        async def receive_counting():
+            message = await receive()
+            if message["type"] == "http.request":
+                received["bytes"] += len(message.get("body", b""))
+            return message
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        try:
+            await self.app(scope, receive_counting if is_upload else receive, send_with_status)
+        finally:
+            http_requests_in_flight.dec()
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            http_requests_total.inc(method=method, route=route_path, status=status["code"])
+            http_request_duration_seconds.observe(time.perf_counter() - started, method=method, route=route_path)
+            if is_upload:
+                upload_bytes_total.inc(received["bytes"], route=route_path)
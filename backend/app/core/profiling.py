@@ -0,0 +1,226 @@
+"""
+요청 단위 프로파일러.
+
+X-Profile-Token 헤더(SECRET_KEY로 서명한 만료시각)가 유효하거나 PROFILE_SAMPLE_RATE
+확률로 뽑힌 요청만 엔드포인트 함수를 cProfile로 감싸 실행한다. 동기 엔드포인트는
+스레드풀에서 실행되므로 미들웨어가 아니라 엔드포인트 호출(route.dependant.call)을
+감싸 그 스레드에서 프로파일한다. 결과는 PROFILE_DIR에 .prof(pstats)와 메타데이터
+JSON으로 저장하고 PROFILE_MAX_FILES / PROFILE_RETENTION_HOURS 기준으로 정리한다.
+"""
+
+import contextvars
+import cProfile
+import functools
+import glob
+import hashlib
+import hmac
+import inspect
+import io
+import json
+import logging
+import os
+import pstats
+import random
+import re
+import time
+import uuid
+from datetime import datetime
+
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.query_stats import current_query_stats
+
+logger = logging.getLogger(__name__)
+
+PROFILE_DIR = "/home/pacms/diagnostics/profiles"
+PROFILE_TOKEN_HEADER = b"x-profile-token"
+PROFILE_ID_PATTERN = re.compile(r"^[0-9]{8}-[0-9]{6}-[0-9a-f]{8}$")
+SUMMARY_LINES = 40
+
+
+class _ProfileTarget:
+    def __init__(self, trigger: str):
+        self.trigger = trigger
+        self.profile: cProfile.Profile | None = None
+
+
+_current: contextvars.ContextVar[_ProfileTarget | None] = contextvars.ContextVar("profile_target", default=None)
+
+
+def _sign(expires: int) -> str:
+    return hmac.new(settings.SECRET_KEY.encode(), f"profile:{expires}".encode(), hashlib.sha256).hexdigest()
+
+
+def create_profile_token(ttl_seconds: int = 600) -> str:
+    """X-Profile-Token 헤더 값 발급 (만료시각.서명)."""
+    expires = int(time.time()) + ttl_seconds
+    return f"{expires}.{_sign(expires)}"
+
+
+def _is_valid_token(token: str) -> bool:
+    expires, _, signature = token.partition(".")
+    if not expires.isdigit() or int(expires) < time.time():
+        return False
+    return hmac.compare_digest(signature, _sign(int(expires)))
+
+
+def _profiled(call):
+    """엔드포인트 함수를 프로파일 대상 요청일 때만 cProfile로 실행하도록 감쌈."""
+    if inspect.iscoroutinefunction(call):
+        @functools.wraps(call)
+        async def async_wrapper(*args, **kwargs):
+            target = _current.get()
+            if target is None:
+                return await call(*args, **kwargs)
+            # 비동기 엔드포인트는 이벤트 루프의 다른 작업이 섞여 측정될 수 있음
+            profile = cProfile.Profile()
+            profile.enable()
+            try:
+                return await call(*args, **kwargs)
+            finally:
+                profile.disable()
+                target.profile = profile
+        return async_wrapper
+
+    @functools.wraps(call)
+    def wrapper(*args, **kwargs):
+        target = _current.get()
+        if target is None:
+            return call(*args, **kwargs)
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            return call(*args, **kwargs)
+        finally:
+            profile.disable()
+            target.profile = profile
+    return wrapper
+
+
+def install_endpoint_profiling(app: FastAPI) -> None:
+    """등록된 모든 API 라우트의 엔드포인트 호출을 프로파일러로 감쌈. 라우터 등록 후 호출."""
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.dependant.call is not None:
+            route.dependant.call = _profiled(route.dependant.call)
+
+
+def _prune_profiles() -> None:
+    metas = sorted(glob.glob(os.path.join(PROFILE_DIR, "*.json")), key=os.path.getmtime, reverse=True)
+    cutoff = time.time() - settings.PROFILE_RETENTION_HOURS * 3600
+    for i, meta_path in enumerate(metas):
+        if i >= settings.PROFILE_MAX_FILES or os.path.getmtime(meta_path) < cutoff:
+            for path in (meta_path, meta_path[:-len(".json")] + ".prof"):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+def _save_profile(profile: cProfile.Profile, meta: dict) -> None:
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    profile_id = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+    summary = io.StringIO()
+    pstats.Stats(profile, stream=summary).sort_stats("cumulative").print_stats(SUMMARY_LINES)
+    profile.dump_stats(os.path.join(PROFILE_DIR, f"{profile_id}.prof"))
+    with open(os.path.join(PROFILE_DIR, f"{profile_id}.json"), "w") as f:
+        json.dump({"id": profile_id, **meta, "summary": summary.getvalue()}, f, ensure_ascii=False)
+
+    _prune_profiles()
+    logger.info(f"Saved request profile {profile_id}: {meta['method']} {meta['path']} {meta['duration_ms']}ms")
+
+
+def list_profiles() -> list[dict]:
+    """저장된 프로파일 메타데이터 (최신순, summary 제외)."""
+    profiles = []
+    for meta_path in glob.glob(os.path.join(PROFILE_DIR, "*.json")):
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            continue
+        meta.pop("summary", None)
+        profiles.append(meta)
+    return sorted(profiles, key=lambda m: m["created_at"], reverse=True)
+
+
+def get_profile(profile_id: str) -> dict | None:
+    if not PROFILE_ID_PATTERN.match(profile_id):
+        return None
+    try:
+        with open(os.path.join(PROFILE_DIR, f"{profile_id}.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def profile_stats_path(profile_id: str) -> str | None:
+    if not PROFILE_ID_PATTERN.match(profile_id):
+        return None
+    path = os.path.join(PROFILE_DIR, f"{profile_id}.prof")
+    return path if os.path.exists(path) else None
+
+
+class ProfilingMiddleware:
+    """서명된 헤더 또는 샘플링으로 선택된 요청을 프로파일하고 결과를 저장."""
+
+    def __init__(self, app):
+        self.app = app
+
+    def _select(self, scope) -> _ProfileTarget | None:
+        token = dict(scope.get("headers", [])).get(PROFILE_TOKEN_HEADER)
+        if token is not None:
+            if _is_valid_token(token.decode("latin-1")):
+                return _ProfileTarget("header")
+            logger.warning(f"Invalid profile token for {scope['path']}")
+        if settings.PROFILE_SAMPLE_RATE > 0 and random.random() < settings.PROFILE_SAMPLE_RATE:
+            return _ProfileTarget("sample")
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        target = self._select(scope)
+        if target is None:
+            await self.app(scope, receive, send)
+            return
+
+        status = {"code": 500}
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        token = _current.set(target)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            _current.reset(token)
+            duration_ms = round((time.perf_counter() - started) * 1000, 1)
+            # 샘플링된 요청은 느린 것만 보관
+            keep = target.trigger == "header" or duration_ms >= settings.PROFILE_SAMPLE_MIN_MS
+            if target.profile is not None and keep:
+                stats = current_query_stats()
+                route = scope.get("route")
+                meta = {
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "route": getattr(route, "path", None),
+                    "status": status["code"],
+                    "trigger": target.trigger,
+                    "duration_ms": duration_ms,
+                    "queries": stats.count if stats else None,
+                    "db_ms": round(stats.total_ms, 1) if stats else None,
+                    "created_at": datetime.now().isoformat(),
+                }
+                try:
+                    await run_in_threadpool(_save_profile, target.profile, meta)
+                except OSError as e:
+                    logger.error(f"Failed to save request profile: {e}")
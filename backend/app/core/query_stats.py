@@ -0,0 +1,123 @@
+"""
+요청별 SQL 계측.
+
+엔진 이벤트로 실행된 문장 수, DB 시간 합계, 가장 느린 문장을 현재 요청의
+RequestQueryStats에 모으고, QueryStatsMiddleware가 요청이 끝날 때 예산을 넘은
+요청을 로그로 남긴다. DEBUG 모드에서는 Server-Timing 헤더로도 내보낸다.
+요청 밖(백그라운드 스레드 등)에서 실행된 문장은 집계하지 않는다.
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+MAX_LOGGED_STATEMENT_CHARS = 500
+
+
+@dataclass
+class RequestQueryStats:
+    count: int = 0
+    total_ms: float = 0.0
+    slowest_ms: float = 0.0
+    slowest_statement: str | None = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, statement: str, elapsed_ms: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_ms += elapsed_ms
+            if elapsed_ms > self.slowest_ms:
+                self.slowest_ms = elapsed_ms
+                self.slowest_statement = statement
+
+
+_current: contextvars.ContextVar[RequestQueryStats | None] = contextvars.ContextVar(
+    "request_query_stats", default=None
+)
+
+
+def current_query_stats() -> RequestQueryStats | None:
+    return _current.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get("query_start_times")
+    if not start_times:
+        return
+    elapsed_ms = (time.perf_counter() - start_times.pop()) * 1000
+    stats = _current.get()
+    if stats is not None:
+        stats.add(statement, elapsed_ms)
+
+
+def install_query_instrumentation(engine: Engine) -> None:
+    """엔진에 문장 시간 측정 이벤트 등록."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _is_over_budget(stats: RequestQueryStats) -> bool:
+    return (
+        stats.count > settings.REQUEST_QUERY_BUDGET
+        or stats.total_ms > settings.REQUEST_DB_TIME_BUDGET_MS
+        or stats.slowest_ms > settings.SLOW_QUERY_MS
+    )
+
+
+def _server_timing(stats: RequestQueryStats, elapsed_ms: float) -> bytes:
+    return (
+        f'db;dur={stats.total_ms:.1f};desc="{stats.count} queries", '
+        f"db-slowest;dur={stats.slowest_ms:.1f}, "
+        f"app;dur={elapsed_ms:.1f}"
+    ).encode("latin-1")
+
+
+class QueryStatsMiddleware:
+    """요청마다 RequestQueryStats를 열고, 예산 초과 시 로그 / DEBUG 시 Server-Timing 헤더."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+
+        async def send_with_timing(message):
+            # 응답 시작 시점까지의 집계 (스트리밍 응답 본문 중의 문장은 로그에만 반영)
+            if message["type"] == "http.response.start" and settings.DEBUG:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", _server_timing(stats, elapsed_ms)))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            if _is_over_budget(stats):
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                statement = (stats.slowest_statement or "").replace("\n", " ")[:MAX_LOGGED_STATEMENT_CHARS]
+                logger.warning(
+                    f"Request over query budget: {scope['method']} {scope['path']} "
+                    f"queries={stats.count} db={stats.total_ms:.1f}ms total={elapsed_ms:.1f}ms "
+                    f"slowest={stats.slowest_ms:.1f}ms [{statement}]"
+                )
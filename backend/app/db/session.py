@@ -1,12 +1,37 @@
-from sqlalchemy import create_engine
+"""
+DB 엔진/세션.
+
+DATABASE_REPLICA_URL이 설정되면 읽기 전용 엔드포인트는 레플리카로 보낸다
+(app.core.deps.get_read_db). 고객이 직접 쓴 내용이 레플리카 지연 때문에 안 보이는 일이
+없도록, 사용자 세션이 쓰기를 커밋하면 READ_YOUR_WRITES_DIR에 사용자별 표시를 남기고
+REPLICA_STICKY_SECONDS 동안 그 사용자의 읽기는 primary로 보낸다. 표시는 파일이라
+어느 워커로 요청이 가도 같이 적용된다.
+"""
+
+import logging
+import os
+import time
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 from app.core.config import settings
+from app.core.query_stats import install_query_instrumentation
+
+logger = logging.getLogger(__name__)
+
+READ_YOUR_WRITES_DIR = "/tmp/hcms-read-your-writes"
 
 engine = create_engine(settings.DATABASE_URL)
+install_query_instrumentation(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+replica_engine = create_engine(settings.DATABASE_REPLICA_URL) if settings.DATABASE_REPLICA_URL else None
+if replica_engine is not None:
+    install_query_instrumentation(replica_engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine or engine)
+
 
 def get_db():
     db = SessionLocal()
@@ -14,3 +39,59 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def _marker_path(user_seq: int) -> str:
+    return os.path.join(READ_YOUR_WRITES_DIR, str(int(user_seq)))
+
+
+def mark_recent_write(user_seq: int) -> None:
+    path = _marker_path(user_seq)
+    try:
+        os.makedirs(READ_YOUR_WRITES_DIR, exist_ok=True)
+        with open(path, "a"):
+            pass
+        os.utime(path)
+    except OSError as e:
+        logger.warning(f"Failed to mark recent write for user {user_seq}: {e}")
+
+
+def wrote_recently(user_seq: int) -> bool:
+    try:
+        return time.time() - os.stat(_marker_path(user_seq)).st_mtime < settings.REPLICA_STICKY_SECONDS
+    except OSError:
+        return False
+
+
+def use_replica(user_seq: int | None) -> bool:
+    """이 사용자의 읽기를 레플리카로 보내도 되는지."""
+    if replica_engine is None:
+        return False
+    return user_seq is None or not wrote_recently(user_seq)
+
+
+def read_session_factory(user_seq: int | None) -> sessionmaker:
+    """요청 밖(스트리밍/백그라운드 작업)에서 읽기 세션을 열 때 쓸 팩토리."""
+    return ReadSessionLocal if use_replica(user_seq) else SessionLocal
+
+
+if replica_engine is not None:
+    # 사용자 세션(session.info["user_seq"], get_current_user가 설정)의 쓰기 커밋을 기록
+
+    @event.listens_for(SessionLocal, "after_flush")
+    def _flag_flush(session, flush_context):
+        session.info["wrote"] = True
+
+    @event.listens_for(SessionLocal, "do_orm_execute")
+    def _flag_dml(orm_execute_state):
+        if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+            orm_execute_state.session.info["wrote"] = True
+
+    @event.listens_for(SessionLocal, "after_commit")
+    def _mark_commit(session):
+        if session.info.pop("wrote", False) and session.info.get("user_seq") is not None:
+            mark_recent_write(session.info["user_seq"])
+
+    @event.listens_for(SessionLocal, "after_rollback")
+    def _clear_flag(session):
+        session.info.pop("wrote", None)
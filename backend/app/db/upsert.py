@@ -0,0 +1,80 @@
+"""
+유니크 키 기준 다건 upsert.
+
+MySQL은 INSERT … ON DUPLICATE KEY UPDATE, SQLite/PostgreSQL은 ON CONFLICT DO UPDATE 한 문장으로
+보낸다. 그 밖의 DB는 기존 키를 조회한 뒤 없는 행은 INSERT, 있는 행은 UPDATE 한다
+(한 문장이 아니라 동시에 같은 키가 들어오면 유니크 키 오류가 날 수 있다).
+"""
+
+from types import SimpleNamespace
+from typing import Any, Callable
+
+from sqlalchemy import insert, literal, tuple_
+from sqlalchemy.orm import Session
+
+UpdateSpec = Callable[[Any], dict]
+
+
+def upsert(db: Session, model, rows: list[dict], keys: list[str], set_: UpdateSpec) -> None:
+    """
+    rows를 keys(유니크 키 컬럼 이름) 기준으로 upsert (commit은 호출자).
+
+    set_(new)는 키가 이미 있을 때 갱신할 {컬럼 이름: 값/식}을 돌려준다. new.<컬럼>은 새로 넣으려던
+    값이고, model.<컬럼>을 쓰면 기존 값을 참조한다 (예: func.coalesce(new.device_id, Model.device_id)).
+    rows 안에 같은 키가 두 번 나오면 안 된다 (PostgreSQL 오류).
+    """
+    if not rows:
+        return
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        stmt = mysql_insert(model).values(rows)
+        db.execute(stmt.on_duplicate_key_update(**set_(stmt.inserted)))
+        return
+
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        stmt = dialect_insert(model).values(rows)
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[getattr(model, k) for k in keys],
+            set_=set_(stmt.excluded),
+        ))
+        return
+
+    _upsert_generic(db, model, rows, keys, set_)
+
+
+def _upsert_generic(db: Session, model, rows: list[dict], keys: list[str], set_: UpdateSpec) -> None:
+    """전용 문법이 없는 DB용: 기존 키 조회 후 INSERT / 행별 UPDATE."""
+    columns = model.__table__.c
+    key_columns = [getattr(model, k) for k in keys]
+
+    def key_of(row: dict) -> tuple:
+        return tuple(row[k] for k in keys)
+
+    wanted = {key_of(row) for row in rows}
+    if len(keys) == 1:
+        key_filter = key_columns[0].in_([k[0] for k in wanted])
+    else:
+        key_filter = tuple_(*key_columns).in_(wanted)
+    existing = {tuple(r) for r in db.query(*key_columns).filter(key_filter).all()}
+
+    missing = [row for row in rows if key_of(row) not in existing]
+    if missing:
+        db.execute(insert(model), missing)
+
+    for row in rows:
+        if key_of(row) not in existing:
+            continue
+        new = SimpleNamespace(**{name: literal(value, columns[name].type) for name, value in row.items()})
+        (
+            db.query(model)
+            .filter(*(col == value for col, value in zip(key_columns, key_of(row))))
+            .update(set_(new), synchronize_session=False)
+        )
@@ -2,9 +2,13 @@ import logging
 
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
-from app.core.firebase import init_firebase
+from app.core.metrics import MetricsMiddleware
+from app.core.profiling import ProfilingMiddleware, install_endpoint_profiling
+from app.core.query_stats import QueryStatsMiddleware
 from app.api.endpoints.auth import router as auth_router
 from app.api.endpoints.dashboard import router as dashboard_router
 from app.api.endpoints.maintenance import router as maintenance_router
@@ -18,12 +22,15 @@ from app.api.endpoints.webhook import router as webhook_router
 from app.api.endpoints.project_board import router as project_board_router
 from app.api.endpoints.dev_requests import router as dev_requests_router
 from app.api.endpoints.ai_dev_subscription import router as ai_dev_subscription_router
+from app.api.endpoints.exports import router as exports_router
+from app.api.endpoints.events import router as events_router
+from app.api.endpoints.bootstrap import router as bootstrap_router
+from app.api.endpoints.metrics import router as metrics_router
+from app.api.endpoints.diagnostics import router as diagnostics_router
 
 logging.basicConfig(level=logging.INFO)
 
-app = FastAPI(title="HCMS Customer API", version="1.0.0")
-
-init_firebase()
+app = FastAPI(title="HCMS Customer API", version="1.0.0", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -31,7 +38,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 api_router = APIRouter(prefix="/api")
 
@@ -54,5 +66,13 @@ api_router.include_router(webhook_router)
 api_router.include_router(project_board_router)
 api_router.include_router(dev_requests_router)
 api_router.include_router(ai_dev_subscription_router)
+api_router.include_router(exports_router)
+api_router.include_router(events_router)
+api_router.include_router(bootstrap_router)
+api_router.include_router(diagnostics_router)
 
 app.include_router(api_router)
+# 수집기 전용 (/api 프록시 밖)
+app.include_router(metrics_router)
+
+install_endpoint_profiling(app)
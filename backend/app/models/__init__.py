@@ -1,6 +1,7 @@
 from app.models.company import Company
 from app.models.manager import Manager
 from app.models.push_token import PushToken
+from app.models.news_visibility import NewsVisibility
 from app.models.customer import (
     CustomAuthUser,
     Project,
@@ -33,6 +34,7 @@ __all__ = [
     "Company",
     "Manager",
     "PushToken",
+    "NewsVisibility",
     "CustomAuthUser",
     "Project",
     "Managelist",
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, DateTime, Index, Integer, UniqueConstraint
+
+from app.db.session import Base
+
+# 회사 지정이 없는(전체 공개) 새소식은 company_id=0 으로 저장
+PUBLIC_COMPANY_ID = 0
+
+
+class NewsVisibility(Base):
+    """회사별로 볼 수 있는 게시된 새소식 목록 (News + News_companies에서 생성하는 파생 테이블)."""
+
+    __tablename__ = "news_visibility"
+    __table_args__ = (
+        UniqueConstraint("company_id", "news_id", name="uq_news_visibility_company_news"),
+        Index("ix_news_visibility_company_created", "company_id", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    company_id = Column(Integer, nullable=False)
+    news_id = Column(Integer, nullable=False, index=True)
+    created_at = Column(DateTime, nullable=True)
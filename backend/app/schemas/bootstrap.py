@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+from app.schemas.push import PushTokenRegister
+
+
+class BootstrapRequest(BaseModel):
+    # 클라이언트가 가진 섹션별 ETag. 같으면 해당 섹션 데이터를 생략
+    etags: dict[str, str] = {}
+    push: PushTokenRegister | None = None
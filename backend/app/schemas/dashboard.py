@@ -0,0 +1,104 @@
+from datetime import date, datetime
+
+from pydantic import BaseModel
+
+
+class DashboardUser(BaseModel):
+    name: str | None
+    company_name: str
+
+
+class DashboardStatCards(BaseModel):
+    maintenance_count: int
+    task_count: int
+    news_count: int
+    estimate_count: int
+
+
+class DashboardActivity(BaseModel):
+    id: int
+    title: str | None
+    date: datetime | None
+    type: str  # "maintenance" | "inquiry"
+    status: int | None
+
+
+class DashboardMaintenanceStats(BaseModel):
+    pending: int
+    in_progress: int
+    completed: int
+    monthly_requests: int
+
+
+class DashboardWorkerStat(BaseModel):
+    name: str
+    completed_count: int
+    in_progress_count: int
+
+
+class DashboardNews(BaseModel):
+    id: int
+    title: str | None
+    category: str | None
+    created_at: datetime | None
+
+
+class DashboardMonthlyPayment(BaseModel):
+    total_amount: int
+    count: int
+
+
+class DashboardPointSummary(BaseModel):
+    total_points: int
+    used_points: int
+    remaining_points: int
+    point_percent: int | float
+
+
+class DashboardProjectProgress(BaseModel):
+    id: int
+    title: str | None
+    status: str | None
+    total_tasks: int
+    completed_tasks: int
+    progress: int
+    contract_date: date | None
+    contract_termination_date: date | None
+    project_type: str | None
+    monthly_point: int
+
+
+class DashboardDevSubscription(BaseModel):
+    has_dev_subscription: bool
+    dev_plan_type: str | None
+    plan_label: str
+    dev_points_total: int | None
+    dev_points_used: int
+    dev_points_remaining: int
+    maint_points_total: int | None
+    maint_points_used: int
+    maint_points_remaining: int
+
+
+class DashboardMaintSubscription(BaseModel):
+    has_maint_subscription: bool
+    plan_type: str | None
+    plan_label: str
+    monthly_points: int | None
+    points_used: int
+    points_remaining: int
+
+
+class DashboardResponse(BaseModel):
+    user: DashboardUser
+    stat_cards: DashboardStatCards
+    recent_activities: list[DashboardActivity]
+    maintenance_stats: DashboardMaintenanceStats
+    response_rate: int | float
+    worker_stats: list[DashboardWorkerStat]
+    latest_news: list[DashboardNews]
+    monthly_payment: DashboardMonthlyPayment
+    point_summary: DashboardPointSummary
+    project_progress: list[DashboardProjectProgress]
+    dev_subscription: DashboardDevSubscription
+    maint_subscription: DashboardMaintSubscription
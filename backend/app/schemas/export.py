@@ -0,0 +1,71 @@
+from datetime import date
+from typing import Literal
+
+from pydantic import BaseModel, field_validator, model_validator
+
+
+class _ExportParams(BaseModel):
+    # 목록 화면의 검색 조건과 같이 빈 문자열은 필터 없음
+    @field_validator("*", mode="before")
+    @classmethod
+    def _blank_to_none(cls, value):
+        return None if value == "" else value
+
+
+class PointUsageExportParams(_ExportParams):
+    project_id: int | None = None
+    search_text: str | None = None
+    date_from: date | None = None
+    date_to: date | None = None
+    point_type: int | None = None
+
+
+class MaintenanceExportParams(_ExportParams):
+    search: str | None = None
+    status: int | None = None
+
+
+class TaskExportParams(_ExportParams):
+    search: str | None = None
+    status: int | None = None
+    task_type: int | None = None
+
+
+class ProjectBoardExportParams(_ExportParams):
+    project_id: int | None = None
+    search: str | None = None
+
+
+EXPORT_PARAMS: dict[str, type[_ExportParams]] = {
+    "point_usage": PointUsageExportParams,
+    "maintenance": MaintenanceExportParams,
+    "tasks": TaskExportParams,
+    "project_board": ProjectBoardExportParams,
+}
+
+
+class ExportJobCreate(BaseModel):
+    type: Literal["point_usage", "maintenance", "tasks", "project_board"]
+    format: Literal["xlsx", "csv"] = "xlsx"
+    params: dict = {}
+
+    @model_validator(mode="after")
+    def _validate_params(self):
+        # 작업 안에서 실패하지 않도록 종류별 조건을 등록 시점에 검증 (잘못된 값은 422)
+        params = EXPORT_PARAMS[self.type].model_validate(self.params)
+        self.params = params.model_dump(mode="json", exclude_none=True)
+        return self
+
+
+class ExportJobResponse(BaseModel):
+    id: str
+    type: str
+    format: str
+    status: str  # "pending" | "running" | "completed" | "failed"
+    created_at: str
+    started_at: str | None = None
+    finished_at: str | None = None
+    filename: str | None = None
+    file_size: int | None = None
+    error: str | None = None
+    download_url: str | None = None
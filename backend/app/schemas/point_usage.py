@@ -0,0 +1,76 @@
+from pydantic import BaseModel
+
+
+class PointProject(BaseModel):
+    id: int
+    title: str | None
+    monthly_point: int | None
+    contract_date: str  # YYYY-MM-DD
+    contract_termination_date: str
+
+
+class PointProjectBalance(BaseModel):
+    id: int
+    title: str | None
+    monthly_point: int | None
+    remaining_points: int
+    total_points: int
+
+
+class PointSummary(BaseModel):
+    total: int
+    used: int
+    remaining: int
+
+
+class PointWorkerStat(BaseModel):
+    writer_name: str
+    worker_type: int
+    total_used: int
+    usage_count: int
+
+
+class PointHistoryItem(BaseModel):
+    id: int
+    created_at: str  # YYYY-MM-DD HH:MM:SS
+    content: str
+    point_type: int | None
+    point_category: str
+    point: int
+    status: int | None
+    worker_type: int | None
+    managelist_title: str
+
+
+class PointHistoryPage(BaseModel):
+    items: list[PointHistoryItem]
+    total: int
+    page: int
+    per_page: int
+    total_pages: int
+
+
+class PointChartMonth(BaseModel):
+    month: str  # YYYY-MM
+    usage: int
+
+
+class PointUsageResponse(BaseModel):
+    maintenance_customer: bool
+    dev_customer: bool
+    current_project: PointProject | None
+    projects_with_balance: list[PointProjectBalance]
+    period_start: str
+    period_end: str
+    total_points: int
+    used_points: int
+    remaining_points: int
+    maintenance_summary: PointSummary
+    dev_summary: PointSummary
+    worker_stats: list[PointWorkerStat]
+    point_histories: PointHistoryPage
+    chart_data: list[PointChartMonth]
+    search_text: str
+    date_from: str
+    date_to: str
+    point_type_filter: str
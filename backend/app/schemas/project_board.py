@@ -0,0 +1,68 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class BoardAttachment(BaseModel):
+    id: int
+    name: str | None
+    file_size: int
+    uploaded_at: datetime | None
+
+
+class BoardCommentAttachment(BaseModel):
+    id: int
+    name: str | None
+    file_size: int
+
+
+class BoardComment(BaseModel):
+    id: int
+    content: str | None
+    writer_name: str | None
+    writer_type: str | None
+    parent_id: int | None
+    is_mine: bool
+    attachments: list[BoardCommentAttachment]
+    created_at: datetime | None
+
+
+class BoardReply(BaseModel):
+    id: int
+    title: str | None
+    content: str | None
+    writer_name: str | None
+    writer_type: str | None
+    status: str | None
+    status_label: str
+    is_mine: bool
+    attachments: list[BoardAttachment]
+    created_at: datetime | None
+
+
+class BoardCategory(BaseModel):
+    id: int
+    name: str | None
+    icon: str | None
+    color: str | None
+
+
+class ProjectBoardDetailResponse(BaseModel):
+    id: int
+    title: str | None
+    content: str | None
+    project_id: int | None
+    project_name: str | None
+    categories: list[BoardCategory]
+    writer_name: str | None
+    writer_type: str | None
+    status: str | None
+    status_label: str
+    is_notice: bool | None
+    views: int
+    is_mine: bool
+    attachments: list[BoardAttachment]
+    comments: list[BoardComment]
+    replies: list[BoardReply]
+    created_at: datetime | None
+    updated_at: datetime | None
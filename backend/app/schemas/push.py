@@ -1,9 +1,18 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+MAX_BATCH_TOKENS = 20
 
 
 class PushTokenRegister(BaseModel):
     token: str
     platform: str  # "ios" | "android"
+    device_id: str | None = None
+
+
+class PushTokenBatchRegister(BaseModel):
+    # 항목에 device_id가 없으면 이 값을 사용
+    device_id: str | None = None
+    tokens: list[PushTokenRegister] = Field(..., min_length=1, max_length=MAX_BATCH_TOKENS)
 
 
 class PushTokenResponse(BaseModel):
@@ -0,0 +1,241 @@
+"""
+운영 서버 실행기.
+
+    cd backend
+    python -m app.server                        # 설정값(WORKERS, HOST, PORT ...)으로 실행
+    python -m app.server --workers 8 --port 9011
+
+마스터 프로세스가 리슨 소켓을 열고 앱을 한 번 import(preload)한 뒤 워커를 fork 한다.
+워커는 같은 소켓으로 uvicorn을 돌리고, WORKER_MAX_REQUESTS(+지터)개 요청을 처리하면
+진행 중 요청을 마친 뒤 종료하며 마스터가 새 워커로 교체한다. SIGTERM/SIGINT를 받으면
+워커에 SIGTERM을 보내 새 연결을 멈추고 진행 중 요청을 WORKER_GRACEFUL_TIMEOUT초까지
+기다린 뒤 종료한다.
+
+DB 커넥션, 이벤트 루프, 백그라운드 스레드, Firebase 클라이언트는 fork 후 공유하면
+안 되므로 워커마다 처음 쓸 때 만든다. 마스터에서는 fork에 안전한 것만 한다
+(모듈 import, DB 접속 확인 후 풀 비우기, 이전 실행의 브로커 파일 정리).
+"""
+
+import argparse
+import gc
+import glob
+import logging
+import os
+import random
+import signal
+import socket
+import sys
+import time
+
+import uvicorn
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.server")
+
+# 워커가 이보다 빨리 죽으면 시작 실패로 보고 재시작 전에 대기
+MIN_WORKER_LIFETIME_SECONDS = 5
+RESPAWN_BACKOFF_SECONDS = 1
+SUPERVISE_INTERVAL_SECONDS = 0.5
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="HCMS production server")
+    parser.add_argument("--host", default=settings.HOST)
+    parser.add_argument("--port", type=int, default=settings.PORT)
+    parser.add_argument("--workers", type=int, default=settings.WORKERS)
+    parser.add_argument("--max-requests", type=int, default=settings.WORKER_MAX_REQUESTS, help="0이면 재시작 안 함")
+    parser.add_argument("--max-requests-jitter", type=int, default=settings.WORKER_MAX_REQUESTS_JITTER)
+    parser.add_argument("--graceful-timeout", type=int, default=settings.WORKER_GRACEFUL_TIMEOUT)
+    parser.add_argument("--no-preload", dest="preload", action="store_false", help="워커마다 앱을 따로 import")
+    return parser.parse_args(argv)
+
+
+def _bind(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _prepare_shared_state() -> None:
+    """fork 전에 마스터에서 한 번만 하는 준비."""
+    from app.db.session import engine
+    from app.services import realtime
+
+    # 이전 실행의 브로커 소켓 (pid 재사용 시 섞이지 않게). 메트릭 스냅샷은 실행 ID로 구분됨
+    for path in glob.glob(os.path.join(realtime.BROKER_DIR, "*.sock")):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    # 설정 오류는 워커를 띄우기 전에 드러나게 하고, 열린 커넥션은 fork 전에 닫음
+    with engine.connect():
+        pass
+    engine.dispose()
+
+
+def _load_app():
+    from app.main import app
+    return app
+
+
+def _run_worker(sock: socket.socket, args, app) -> None:
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    # fork로 복사된 난수 상태를 워커마다 다르게 (프로파일 샘플링 등)
+    random.seed()
+
+    if app is None:
+        app = _load_app()
+    else:
+        from app.db.session import engine
+        # 마스터에서 만든 커넥션을 이 프로세스에서 쓰거나 닫지 않음
+        engine.dispose(close=False)
+
+    max_requests = None
+    if args.max_requests > 0:
+        max_requests = args.max_requests + random.randint(0, max(0, args.max_requests_jitter))
+
+    config = uvicorn.Config(
+        app,
+        limit_max_requests=max_requests,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        server_header=False,
+    )
+    uvicorn.Server(config).run(sockets=[sock])
+
+    # os._exit로 끝나 atexit가 돌지 않으므로 마지막 메트릭 스냅샷을 직접 기록
+    from app.core.metrics import write_snapshot
+    write_snapshot()
+
+
+def _spawn(sock: socket.socket, args, app) -> int:
+    pid = os.fork()
+    if pid == 0:
+        code = 0
+        try:
+            _run_worker(sock, args, app)
+        except BaseException:
+            logger.exception("Worker crashed")
+            code = 1
+        finally:
+            logging.shutdown()
+            os._exit(code)
+    return pid
+
+
+class Supervisor:
+    def __init__(self, sock: socket.socket, args, app):
+        self.sock = sock
+        self.args = args
+        self.app = app
+        self.workers: dict[int, float] = {}  # pid -> started_at
+        self.stopping = False
+
+    def _handle_stop(self, sig, frame) -> None:
+        if not self.stopping:
+            logger.info(f"Received {signal.Signals(sig).name}, shutting down workers")
+        self.stopping = True
+
+    def _start_worker(self) -> None:
+        pid = _spawn(self.sock, self.args, self.app)
+        self.workers[pid] = time.monotonic()
+        logger.info(f"Started worker {pid}")
+
+    def _reap(self) -> list[tuple[int, int, float]]:
+        exited = []
+        while self.workers:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            started_at = self.workers.pop(pid, None)
+            if started_at is not None:
+                exited.append((pid, status, time.monotonic() - started_at))
+        return exited
+
+    def run(self) -> None:
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+
+        for _ in range(self.args.workers):
+            self._start_worker()
+
+        while not self.stopping:
+            time.sleep(SUPERVISE_INTERVAL_SECONDS)
+            for pid, status, lifetime in self._reap():
+                if self.stopping:
+                    break
+                if os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0:
+                    # max-requests 도달로 정상 종료한 워커
+                    logger.info(f"Worker {pid} exited after {lifetime:.0f}s, replacing")
+                else:
+                    logger.error(f"Worker {pid} died (status {status}) after {lifetime:.0f}s, replacing")
+                    if lifetime < MIN_WORKER_LIFETIME_SECONDS:
+                        time.sleep(RESPAWN_BACKOFF_SECONDS)
+                self._start_worker()
+
+        self._shutdown()
+
+    def _shutdown(self) -> None:
+        # 마스터의 소켓 사본도 닫아야 워커가 리스너를 닫은 뒤 새 연결이 거부됨
+        self.sock.close()
+        for pid in list(self.workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                self.workers.pop(pid, None)
+
+        # 워커는 graceful-timeout 후 남은 요청을 끊으므로 조금 더 기다렸다가 강제 종료
+        deadline = time.monotonic() + self.args.graceful_timeout + 5
+        while self.workers and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.1)
+        for pid in list(self.workers):
+            logger.warning(f"Worker {pid} did not stop in time, killing")
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        while self.workers:
+            try:
+                pid, _ = os.waitpid(-1, 0)
+            except ChildProcessError:
+                break
+            self.workers.pop(pid, None)
+        logger.info("All workers stopped")
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    if args.workers < 1:
+        print("--workers must be at least 1", file=sys.stderr)
+        return 2
+
+    sock = _bind(args.host, args.port)
+    # 이 실행의 워커끼리만 메트릭을 합산 (app.core.metrics.RUN_ID_ENV, 마스터에서는 앱을 import하지 않음)
+    os.environ["HCMS_METRICS_RUN_ID"] = f"{os.getpid()}-{int(time.time())}"
+    logger.info(f"Listening on {args.host}:{args.port} with {args.workers} workers (preload={args.preload})")
+
+    app = None
+    if args.preload:
+        app = _load_app()
+        _prepare_shared_state()
+        # preload한 객체를 GC 대상에서 빼서 워커에서 copy-on-write로 복사되지 않게 함
+        gc.freeze()
+
+    Supervisor(sock, args, app).run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
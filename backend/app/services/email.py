@@ -6,6 +6,7 @@ from email.mime.multipart import MIMEMultipart
 from typing import Optional
 from sqlalchemy.orm import Session
 
+from app.core.metrics import email_queue_depth, emails_sent_total
 from app.models.customer import CustomAuthUser
 
 logger = logging.getLogger(__name__)
@@ -37,12 +38,22 @@ def _send_email(to_emails: list[str], subject: str, html_body: str):
         with smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=10) as server:
             server.sendmail(FROM_EMAIL, to_emails, msg.as_string())
         logger.info(f"Email sent to {len(to_emails)} recipients: {subject}")
+        emails_sent_total.inc(result="success")
     except Exception as e:
         logger.error(f"Failed to send email: {e}")
+        emails_sent_total.inc(result="failure")
+
+
+def _send_email_queued(to_emails: list[str], subject: str, html_body: str):
+    try:
+        _send_email(to_emails, subject, html_body)
+    finally:
+        email_queue_depth.dec()
 
 
 def send_email_async(to_emails: list[str], subject: str, html_body: str):
-    thread = threading.Thread(target=_send_email, args=(to_emails, subject, html_body))
+    email_queue_depth.inc()
+    thread = threading.Thread(target=_send_email_queued, args=(to_emails, subject, html_body))
     thread.daemon = True
     thread.start()
 
@@ -0,0 +1,69 @@
+"""
+견적서 금액 계산 (공급가액 / 할인 / 부가세 / 합계).
+
+상세, PDF, 목록이 같은 규칙을 쓰도록 한 곳에서 계산한다.
+"""
+
+from typing import Iterable, NamedTuple
+
+from app.models.customer import Estimate, EstimateItem
+
+DEFAULT_TAX_RATE = 10.0
+
+
+class EstimatePricing(NamedTuple):
+    subtotal: int
+    discount: int
+    tax: int
+    total: int
+
+
+def price_estimate(
+    estimate_amount: int | None,
+    items_total: int,
+    discount_type: str | None,
+    discount_rate: float | None,
+    discount_amount: int | None,
+    tax_rate: float | None,
+) -> EstimatePricing:
+    # 공급가액: estimate_amount가 있으면 우선, 없으면 항목 합계
+    supply_amount = estimate_amount if estimate_amount else items_total
+
+    discount = 0
+    if discount_type == "1" and discount_rate:
+        discount = int(supply_amount * (discount_rate / 100))
+    elif discount_type == "2" and discount_amount:
+        discount = discount_amount
+
+    after_discount = supply_amount - discount
+    tax_amount = int(after_discount * ((tax_rate or DEFAULT_TAX_RATE) / 100))
+    return EstimatePricing(supply_amount, discount, tax_amount, after_discount + tax_amount)
+
+
+def line_amount(item: EstimateItem) -> int:
+    return (item.quantity or 0) * (item.unit_price or 0)
+
+
+def items_total(items: Iterable[EstimateItem]) -> int:
+    return sum(line_amount(item) for item in items)
+
+
+def price_estimate_for(estimate: Estimate, estimate_items_total: int | None = None) -> EstimatePricing:
+    """
+    Estimate 객체의 금액 계산.
+
+    estimate_items_total을 넘기지 않으면 estimate_amount가 비어 있을 때만 로드된 items로 합계를 구한다.
+    """
+    if estimate.estimate_amount:
+        estimate_items_total = 0
+    elif estimate_items_total is None:
+        estimate_items_total = items_total(estimate.items)
+
+    return price_estimate(
+        estimate.estimate_amount,
+        estimate_items_total or 0,
+        estimate.discount_type,
+        estimate.discount_rate,
+        estimate.discount_amount,
+        estimate.tax_rate,
+    )
@@ -0,0 +1,421 @@
+"""
+백그라운드 내보내기 작업.
+
+무거운 XLSX/CSV 내보내기를 API 워커 밖의 제한된 스레드풀에서 실행하고,
+결과 파일은 EXPORT_DIR 아래에 저장한다. 작업 상태는 결과 파일 옆의 JSON
+파일로 관리하므로 어느 uvicorn 워커로 폴링해도 같은 상태를 본다.
+작업을 맡은 워커는 끝날 때까지 상태 파일을 주기적으로 갱신(heartbeat)하며, 워커가 종료되어
+EXPORT_JOB_STALE_SECONDS 넘게 갱신이 멈춘 대기/실행 중 작업은 조회나 정리 시 실패로 바꾼다.
+"""
+
+import json
+import logging
+import os
+import re
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Iterator
+
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session, contains_eager, joinedload
+
+from app.core.config import settings
+from app.db.session import read_session_factory
+from app.models.manager import Manager
+from app.models.customer import (
+    CustomAuthUser,
+    Inditask,
+    InditaskComment,
+    Managelist,
+    ManagelistComment,
+    Project,
+    ProjectBoard,
+    ProjectBoardComment,
+)
+from app.services.exports import iter_chunks, iter_csv_bytes, iter_xlsx_bytes
+from app.services.points import (
+    EXPORT_HEADER as POINT_EXPORT_HEADER,
+    EXPORT_SHEET_TITLE as POINT_EXPORT_SHEET_TITLE,
+    build_point_export_query,
+    get_export_project,
+    iter_point_export_rows,
+)
+
+logger = logging.getLogger(__name__)
+
+EXPORT_DIR = "/home/pacms/media/exports"
+JOB_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+MAINTENANCE_STATUS_LABELS = {1: "접수", 2: "알림", 3: "처리중", 4: "완료"}
+TASK_TYPE_LABELS = {1: "계약", 2: "기획", 3: "디자인", 4: "프론트엔드", 5: "백엔드", 6: "유지보수", 7: "기타"}
+TASK_STATUS_LABELS = {1: "접수", 2: "진행중", 3: "검수", 4: "완료"}
+BOARD_STATUS_LABELS = {"1": "진행중", "2": "완료", "3": "보류"}
+
+_executor: ThreadPoolExecutor | None = None
+# 이 프로세스가 맡은 대기/실행 중 작업 (heartbeat 대상)
+_active_jobs: set[str] = set()
+_active_lock = threading.Lock()
+_heartbeat: threading.Thread | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=settings.EXPORT_JOB_WORKERS, thread_name_prefix="export-job")
+    return _executor
+
+
+def _fmt_dt(value) -> str:
+    return value.strftime("%Y-%m-%d %H:%M:%S") if value else ""
+
+
+# === 내보내기 종류별 행 생성 ===
+
+
+def _point_usage_export(db: Session, lookup_db: Session, company_id: int, params: dict):
+    project = get_export_project(db, company_id, params.get("project_id"))
+    if not project:
+        return POINT_EXPORT_SHEET_TITLE, POINT_EXPORT_HEADER, iter(()), "포인트사용내역_없음"
+
+    query = build_point_export_query(
+        db,
+        project,
+        search_text=params.get("search_text", ""),
+        date_from=params.get("date_from", ""),
+        date_to=params.get("date_to", ""),
+        point_type=params.get("point_type", ""),
+    )
+    rows = iter_point_export_rows(query, lookup_db)
+    return POINT_EXPORT_SHEET_TITLE, POINT_EXPORT_HEADER, rows, f"포인트사용내역_{project.title or '프로젝트'}"
+
+
+def _maintenance_export(db: Session, lookup_db: Session, company_id: int, params: dict):
+    query = (
+        db.query(Managelist)
+        .outerjoin(Project, Managelist.project_id == Project.seq)
+        .options(contains_eager(Managelist.project))
+        .filter(Managelist.company_id == company_id)
+    )
+    search = params.get("search", "")
+    if search:
+        query = query.filter(or_(Managelist.title.ilike(f"%{search}%"), Managelist.contents.ilike(f"%{search}%")))
+    if params.get("status"):
+        query = query.filter(Managelist.status == params["status"])
+    query = query.order_by(Managelist.created_at.desc(), Managelist.seq.desc())
+
+    def rows() -> Iterator[list]:
+        for chunk in iter_chunks(query):
+            comment_counts = dict(
+                lookup_db.query(ManagelistComment.managelist_id, func.count(ManagelistComment.seq))
+                .filter(ManagelistComment.managelist_id.in_([m.seq for m in chunk]))
+                .group_by(ManagelistComment.managelist_id)
+                .all()
+            )
+            for m in chunk:
+                yield [
+                    m.seq,
+                    m.title or "",
+                    m.project.title if m.project else "",
+                    MAINTENANCE_STATUS_LABELS.get(m.status, ""),
+                    _fmt_dt(m.request_date),
+                    _fmt_dt(m.complete_date),
+                    m.points_used or 0,
+                    comment_counts.get(m.seq, 0),
+                ]
+
+    header = ["번호", "제목", "프로젝트", "상태", "요청일", "완료일", "사용포인트", "답변수"]
+    return "유지보수내역", header, rows(), "유지보수내역"
+
+
+def _task_export(db: Session, lookup_db: Session, company_id: int, params: dict):
+    query = (
+        db.query(Inditask)
+        .outerjoin(Project, Inditask.project_id == Project.seq)
+        .options(contains_eager(Inditask.project))
+        .filter(Inditask.company_id == company_id)
+    )
+    if params.get("search"):
+        query = query.filter(Inditask.title.ilike(f"%{params['search']}%"))
+    if params.get("status"):
+        query = query.filter(Inditask.task_status == params["status"])
+    if params.get("task_type"):
+        query = query.filter(Inditask.task_type == params["task_type"])
+    query = query.order_by(Inditask.created_at.desc(), Inditask.seq.desc())
+
+    def rows() -> Iterator[list]:
+        for chunk in iter_chunks(query):
+            comment_counts = dict(
+                lookup_db.query(InditaskComment.inditask_id, func.count(InditaskComment.seq))
+                .filter(InditaskComment.inditask_id.in_([t.seq for t in chunk]))
+                .group_by(InditaskComment.inditask_id)
+                .all()
+            )
+            for t in chunk:
+                yield [
+                    t.seq,
+                    t.title or "",
+                    TASK_TYPE_LABELS.get(t.task_type, ""),
+                    TASK_STATUS_LABELS.get(t.task_status, ""),
+                    t.project.title if t.project else "",
+                    _fmt_dt(t.created_at),
+                    _fmt_dt(t.deadline),
+                    comment_counts.get(t.seq, 0),
+                ]
+
+    header = ["번호", "제목", "유형", "상태", "프로젝트", "등록일", "마감일", "답변수"]
+    return "건별의뢰내역", header, rows(), "건별의뢰내역"
+
+
+def _board_writer_name(item) -> str:
+    if item.writer_type == "1" and item.admin_writer:
+        return item.admin_writer.name or ""
+    if item.writer_type == "2" and item.customer_writer:
+        return item.customer_writer.name or ""
+    return ""
+
+
+def _project_board_export(db: Session, lookup_db: Session, company_id: int, params: dict):
+    query = (
+        db.query(ProjectBoard)
+        .outerjoin(Project, ProjectBoard.project_id == Project.seq)
+        .outerjoin(CustomAuthUser, ProjectBoard.writer_id == CustomAuthUser.id)
+        .outerjoin(Manager, ProjectBoard.customer_writer_id == Manager.seq)
+        .options(
+            contains_eager(ProjectBoard.project),
+            contains_eager(ProjectBoard.admin_writer),
+            contains_eager(ProjectBoard.customer_writer),
+        )
+        .filter(ProjectBoard.company_id == company_id, ProjectBoard.parent_id == None)
+    )
+    if params.get("project_id"):
+        query = query.filter(ProjectBoard.project_id == params["project_id"])
+    if params.get("search"):
+        search = params["search"]
+        query = query.filter(or_(ProjectBoard.title.ilike(f"%{search}%"), ProjectBoard.content.ilike(f"%{search}%")))
+    query = query.order_by(ProjectBoard.created_at.desc(), ProjectBoard.seq.desc())
+
+    def rows() -> Iterator[list]:
+        for chunk in iter_chunks(query, 100):
+            board_ids = [b.seq for b in chunk]
+            replies = (
+                lookup_db.query(ProjectBoard)
+                .options(joinedload(ProjectBoard.admin_writer), joinedload(ProjectBoard.customer_writer))
+                .filter(ProjectBoard.parent_id.in_(board_ids))
+                .order_by(ProjectBoard.created_at.asc())
+                .all()
+            )
+            comments = (
+                lookup_db.query(ProjectBoardComment)
+                .options(joinedload(ProjectBoardComment.admin_writer), joinedload(ProjectBoardComment.customer_writer))
+                .filter(ProjectBoardComment.board_id.in_(board_ids + [r.seq for r in replies]))
+                .order_by(ProjectBoardComment.created_at.asc())
+                .all()
+            )
+            replies_by_parent: dict[int, list] = {}
+            for r in replies:
+                replies_by_parent.setdefault(r.parent_id, []).append(r)
+            comments_by_board: dict[int, list] = {}
+            for c in comments:
+                comments_by_board.setdefault(c.board_id, []).append(c)
+
+            for board in chunk:
+                project_title = board.project.title if board.project else ""
+                yield [board.seq, "게시글", project_title, board.title or "", _board_writer_name(board),
+                       BOARD_STATUS_LABELS.get(board.status, ""), board.content or "", _fmt_dt(board.created_at)]
+                for c in comments_by_board.get(board.seq, []):
+                    yield [board.seq, "댓글", project_title, "", _board_writer_name(c), "", c.content or "", _fmt_dt(c.created_at)]
+                for r in replies_by_parent.get(board.seq, []):
+                    yield [board.seq, "답글", project_title, r.title or "", _board_writer_name(r),
+                           BOARD_STATUS_LABELS.get(r.status, ""), r.content or "", _fmt_dt(r.created_at)]
+                    for c in comments_by_board.get(r.seq, []):
+                        yield [board.seq, "댓글", project_title, "", _board_writer_name(c), "", c.content or "", _fmt_dt(c.created_at)]
+
+    header = ["게시글번호", "구분", "프로젝트", "제목", "작성자", "상태", "내용", "작성일"]
+    return "프로젝트게시판", header, rows(), "프로젝트게시판"
+
+
+EXPORTERS: dict[str, Callable] = {
+    "point_usage": _point_usage_export,
+    "maintenance": _maintenance_export,
+    "tasks": _task_export,
+    "project_board": _project_board_export,
+}
+
+
+# === 작업 상태 관리 ===
+
+
+def _meta_path(job_id: str) -> str:
+    return os.path.join(EXPORT_DIR, f"{job_id}.json")
+
+
+def _write_meta(job: dict) -> None:
+    tmp_path = _meta_path(job["id"]) + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(job, f, ensure_ascii=False)
+    os.replace(tmp_path, _meta_path(job["id"]))
+
+
+def _heartbeat_loop() -> None:
+    while True:
+        time.sleep(settings.EXPORT_JOB_STALE_SECONDS / 4)
+        with _active_lock:
+            job_ids = list(_active_jobs)
+        for job_id in job_ids:
+            try:
+                os.utime(_meta_path(job_id))
+            except OSError:
+                pass
+
+
+def _ensure_heartbeat() -> None:
+    global _heartbeat
+    if _heartbeat is not None:
+        return
+    with _active_lock:
+        if _heartbeat is None:
+            _heartbeat = threading.Thread(target=_heartbeat_loop, name="export-job-heartbeat", daemon=True)
+            _heartbeat.start()
+
+
+def _fail_if_stale(job: dict) -> dict:
+    """맡은 워커가 종료되어 heartbeat가 멈춘 대기/실행 중 작업을 실패로 기록."""
+    if job["status"] not in ("pending", "running"):
+        return job
+    try:
+        updated_at = os.path.getmtime(_meta_path(job["id"]))
+    except OSError:
+        return job
+    if time.time() - updated_at <= settings.EXPORT_JOB_STALE_SECONDS:
+        return job
+
+    logger.warning(f"Export job {job['id']} ({job['type']}) stalled on worker {job.get('worker')}, marking failed")
+    job["status"] = "failed"
+    job["error"] = "내보내기 작업이 중단되었습니다. 다시 시도해 주세요."
+    job["finished_at"] = datetime.now().isoformat()
+    _write_meta(job)
+    return job
+
+
+def _read_job(job_id: str) -> dict | None:
+    try:
+        with open(_meta_path(job_id), encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def get_export_job(job_id: str) -> dict | None:
+    if not JOB_ID_PATTERN.match(job_id):
+        return None
+    job = _read_job(job_id)
+    return _fail_if_stale(job) if job else None
+
+
+def get_export_file_path(job: dict) -> str:
+    return os.path.join(EXPORT_DIR, f"{job['id']}.{job['format']}")
+
+
+def cleanup_expired_exports() -> int:
+    """멈춘 작업을 실패로 바꾸고, TTL이 지난 결과 파일과 상태 파일 삭제. 삭제한 파일 수를 반환."""
+    if not os.path.isdir(EXPORT_DIR):
+        return 0
+    expire_before = time.time() - settings.EXPORT_JOB_TTL_HOURS * 3600
+    removed = 0
+    for name in os.listdir(EXPORT_DIR):
+        path = os.path.join(EXPORT_DIR, name)
+        job_id, ext = os.path.splitext(name)
+        if ext == ".json" and JOB_ID_PATTERN.match(job_id):
+            job = _read_job(job_id)
+            if job:
+                _fail_if_stale(job)
+        try:
+            if os.path.getmtime(path) < expire_before:
+                os.remove(path)
+                removed += 1
+        except OSError:
+            continue
+    return removed
+
+
+def _run_export_job(job_id: str) -> None:
+    try:
+        _export(job_id)
+    finally:
+        with _active_lock:
+            _active_jobs.discard(job_id)
+
+
+def _export(job_id: str) -> None:
+    job = _read_job(job_id)
+    if not job:
+        return
+
+    job["status"] = "running"
+    job["started_at"] = datetime.now().isoformat()
+    _write_meta(job)
+
+    file_path = get_export_file_path(job)
+    part_path = file_path + ".part"
+    session_factory = read_session_factory(job.get("manager_seq"))
+    db = session_factory()
+    lookup_db = session_factory()
+    try:
+        sheet_title, header, rows, filename_stem = EXPORTERS[job["type"]](db, lookup_db, job["company_id"], job["params"])
+        chunks = iter_csv_bytes(header, rows) if job["format"] == "csv" else iter_xlsx_bytes(sheet_title, header, rows)
+        with open(part_path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(part_path, file_path)
+
+        job["status"] = "completed"
+        job["filename"] = f"{filename_stem}_{datetime.now().strftime('%Y%m%d')}.{job['format']}"
+        job["file_size"] = os.path.getsize(file_path)
+    except Exception as e:
+        logger.error(f"Export job {job_id} ({job['type']}) failed: {e}")
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        job["status"] = "failed"
+        job["error"] = "내보내기 중 오류가 발생했습니다."
+    finally:
+        lookup_db.close()
+        db.close()
+
+    job["finished_at"] = datetime.now().isoformat()
+    _write_meta(job)
+
+
+def submit_export_job(export_type: str, export_format: str, company_id: int, manager_seq: int, params: dict) -> dict:
+    """내보내기 작업을 등록하고 스레드풀에 제출."""
+    if export_type not in EXPORTERS:
+        raise ValueError(f"Unsupported export type: {export_type}")
+
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    cleanup_expired_exports()
+
+    job = {
+        "id": uuid.uuid4().hex,
+        "type": export_type,
+        "format": export_format,
+        "status": "pending",
+        "company_id": company_id,
+        "manager_seq": manager_seq,
+        "params": params,
+        "worker": f"{socket.gethostname()}:{os.getpid()}",
+        "created_at": datetime.now().isoformat(),
+        "started_at": None,
+        "finished_at": None,
+        "filename": None,
+        "file_size": None,
+        "error": None,
+    }
+    _write_meta(job)
+    with _active_lock:
+        _active_jobs.add(job["id"])
+    _ensure_heartbeat()
+    _get_executor().submit(_run_export_job, job["id"])
+    return job
@@ -0,0 +1,95 @@
+import csv
+import io
+import zipfile
+from typing import Iterable, Iterator
+
+from sqlalchemy.orm import Query
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+CSV_MEDIA_TYPE = "text/csv; charset=utf-8"
+ZIP_MEDIA_TYPE = "application/zip"
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def iter_chunks(query: Query, chunk_size: int = 500) -> Iterator[list]:
+    """yield_per로 읽은 ORM 객체를 chunk_size 단위 리스트로 묶어 반환."""
+    chunk = []
+    for obj in query.yield_per(chunk_size):
+        chunk.append(obj)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_xlsx_bytes(sheet_title: str, header: list, rows: Iterable[list]) -> Iterator[bytes]:
+    """
+    write_only 워크북으로 행을 순차 기록하고, 저장 결과를 _ZipSink로 받아 청크 단위로 전송.
+
+    행은 openpyxl이 시트 임시파일에 바로 기록하므로 행 수와 무관하게 메모리가 일정하다. 다만 XLSX 패키지는
+    저장 시점에 만들어지므로 첫 바이트는 모든 행을 기록한 뒤에 나가고, 그동안 압축된 파일 크기만큼 메모리를 쓴다.
+    첫 바이트 지연이 문제되는 대용량은 CSV나 비동기 내보내기(export_jobs)를 쓴다.
+    """
+    # openpyxl은 import가 무거워 내보내기 때만 로드
+    import openpyxl
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet(title=sheet_title)
+    ws.append(header)
+    for row in rows:
+        # 메모 등에 섞인 제어 문자는 셀에 쓸 수 없어 제거
+        ws.append([ILLEGAL_CHARACTERS_RE.sub("", v) if isinstance(v, str) else v for v in row])
+    sink = _ZipSink()
+    wb.save(sink)
+    data = sink.drain()
+    for offset in range(0, len(data), STREAM_CHUNK_SIZE):
+        yield data[offset:offset + STREAM_CHUNK_SIZE]
+
+
+def iter_csv_bytes(header: list, rows: Iterable[list], flush_rows: int = 500) -> Iterator[bytes]:
+    """엑셀 호환 UTF-8(BOM) CSV를 행 단위로 스트리밍."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write("\ufeff")
+    writer.writerow(header)
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= flush_rows:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue().encode("utf-8")
+
+
+class _ZipSink:
+    """ZipFile 출력 대상. seek/tell이 없으므로 ZipFile이 스트리밍(data descriptor) 모드로 기록한다."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def iter_zip_bytes(files: Iterable[tuple[str, bytes]]) -> Iterator[bytes]:
+    """(파일명, 내용)을 받는 즉시 ZIP 엔트리로 기록해 전송 (아카이브 전체를 메모리에 두지 않음)."""
+    sink = _ZipSink()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, content in files:
+            zf.writestr(name, content)
+            yield sink.drain()
+    yield sink.drain()
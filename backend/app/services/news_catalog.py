@@ -0,0 +1,175 @@
+"""
+새소식 카탈로그 캐시.
+
+새소식은 PACMS에서 게시할 때만 바뀌므로 회사별 노출 목록과 상세를 직렬화된 dict로
+메모리에 보관하고 검색/카테고리/페이지 처리는 캐시에서 한다. news_register 웹훅에서
+무효화하면 INVALIDATION_PATH 파일의 수정 시각이 바뀌고, 각 워커는 캐시를 쓰기 전에 이를
+확인해 자기 캐시도 비운다. 카탈로그 버전(조회수를 제외한 내용의 해시)은 목록 응답의
+ETag로 쓰인다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter
+
+from sqlalchemy.orm import Session, joinedload
+
+from app.core.config import settings
+from app.models.customer import News
+from app.models.news_visibility import NewsVisibility
+from app.services.news_visibility import on_news_visibility_changed, visible_news_query
+from app.services.view_counter import on_views_flushed
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_PATH = "/tmp/hcms-news-catalog.invalidated"
+
+# company_id -> (built_at, version, items)
+_catalogs: dict[int, tuple[float, str, list[dict]]] = {}
+# news_id -> (built_at, detail)
+_details: dict[int, tuple[float, dict]] = {}
+_generation = 0
+# 마지막으로 확인한 INVALIDATION_PATH 수정 시각
+_seen_invalidation: int | None = None
+_lock = threading.Lock()
+
+
+def _is_fresh(built_at: float) -> bool:
+    return time.monotonic() - built_at < settings.NEWS_CACHE_TTL_SECONDS
+
+
+def _clear_locked() -> None:
+    global _generation
+    _generation += 1
+    _catalogs.clear()
+    _details.clear()
+
+
+def _check_invalidation_locked() -> None:
+    """다른 워커가 무효화했으면 이 프로세스의 캐시도 비움 (_lock 안에서 호출)."""
+    global _seen_invalidation
+    try:
+        mtime = os.stat(INVALIDATION_PATH).st_mtime_ns
+    except OSError:
+        mtime = None
+    if mtime != _seen_invalidation:
+        _seen_invalidation = mtime
+        _clear_locked()
+
+
+def _summary(n: News) -> dict:
+    return {
+        "id": n.seq,
+        "title": n.title,
+        "category": n.category,
+        "writer_name": n.writer.name if n.writer else None,
+        "views": n.views or 0,
+        "created_at": n.created_at.isoformat() if n.created_at else None,
+    }
+
+
+def _detail(n: News) -> dict:
+    return {
+        "id": n.seq,
+        "title": n.title,
+        "content": n.content,
+        "category": n.category,
+        "writer_name": n.writer.name if n.writer else None,
+        "views": n.views or 0,
+        "attachment": n.attachment,
+        "created_at": n.created_at.isoformat() if n.created_at else None,
+        "updated_at": n.updated_at.isoformat() if n.updated_at else None,
+    }
+
+
+def _catalog_version(items: list[dict]) -> str:
+    # 조회수는 계속 바뀌므로 버전(ETag)에서 제외
+    payload = json.dumps([{k: v for k, v in item.items() if k != "views"} for item in items], ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def get_news_catalog(db: Session, company_id: int) -> tuple[str, list[dict]]:
+    """회사에 노출되는 게시 새소식 요약 목록(최신순)과 카탈로그 버전."""
+    with _lock:
+        _check_invalidation_locked()
+        entry = _catalogs.get(company_id)
+        generation = _generation
+    if entry and _is_fresh(entry[0]):
+        return entry[1], entry[2]
+
+    news = (
+        visible_news_query(db, company_id)
+        .options(joinedload(News.writer))
+        .order_by(NewsVisibility.created_at.desc())
+        .all()
+    )
+    items = [_summary(n) for n in news]
+    version = _catalog_version(items)
+
+    with _lock:
+        # 조회 중에 무효화됐다면 오래된 결과를 저장하지 않음
+        _check_invalidation_locked()
+        if generation == _generation:
+            _catalogs[company_id] = (time.monotonic(), version, items)
+    return version, items
+
+
+def get_news_detail(db: Session, news_id: int) -> dict | None:
+    with _lock:
+        _check_invalidation_locked()
+        entry = _details.get(news_id)
+        generation = _generation
+    if entry and _is_fresh(entry[0]):
+        return entry[1]
+
+    item = db.query(News).options(joinedload(News.writer)).filter(News.seq == news_id).first()
+    if not item:
+        return None
+    detail = _detail(item)
+
+    with _lock:
+        _check_invalidation_locked()
+        if generation == _generation:
+            _details[news_id] = (time.monotonic(), detail)
+    return detail
+
+
+def invalidate_news_catalog() -> None:
+    """모든 워커의 카탈로그 캐시 무효화."""
+    global _seen_invalidation
+    with _lock:
+        try:
+            with open(INVALIDATION_PATH, "a"):
+                pass
+            os.utime(INVALIDATION_PATH, ns=(time.time_ns(), time.time_ns()))
+            _seen_invalidation = os.stat(INVALIDATION_PATH).st_mtime_ns
+        except OSError as e:
+            logger.warning(f"Failed to publish news catalog invalidation: {e}")
+        _clear_locked()
+
+
+def _apply_flushed_views(counts: Counter, flush_started_at: float) -> None:
+    """
+    이 프로세스에서 DB에 반영한 조회수를 캐시에도 더해, 버퍼가 비워진 뒤에도 조회수가 줄어 보이지 않게 함.
+
+    flush 시작 후에 만든 캐시는 이미 반영된 값을 읽었을 수 있으므로 건드리지 않는다.
+    """
+    with _lock:
+        for built_at, _, items in _catalogs.values():
+            if built_at >= flush_started_at:
+                continue
+            for item in items:
+                if item["id"] in counts:
+                    item["views"] += counts[item["id"]]
+        for news_id, n in counts.items():
+            entry = _details.get(news_id)
+            if entry and entry[0] < flush_started_at:
+                entry[1]["views"] += n
+
+
+on_views_flushed("news", _apply_flushed_views)
+on_news_visibility_changed(invalidate_news_catalog)
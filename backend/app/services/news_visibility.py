@@ -0,0 +1,166 @@
+"""
+회사별 새소식 노출 인덱스 (news_visibility).
+
+게시된 새소식이 어느 회사에 보이는지를 미리 계산해 두어, 목록/상세/대시보드가
+News_companies UNION 대신 (company_id, created_at) 인덱스 범위 조회 한 번으로 처리한다.
+news_register 웹훅에서 해당 새소식만 갱신하고, PACMS에서 웹훅 없이 바뀐 경우를 위해
+NEWS_VISIBILITY_REBUILD_MINUTES 주기로 전체를 다시 맞춘다.
+
+주기적 재구성은 호스트당 한 프로세스만 한다 (REBUILD_LOCK_PATH 파일 잠금을 먼저 잡은
+워커가 종료될 때까지 맡음). 웹훅 갱신이나 다른 호스트의 재구성과 겹쳐도 유니크 키
+충돌이 나지 않도록 행 추가/갱신은 upsert 한 문장으로 한다.
+"""
+
+import fcntl
+import logging
+import threading
+import time
+from typing import Callable
+
+from sqlalchemy import literal
+from sqlalchemy.orm import Query, Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.db.upsert import upsert
+from app.models.customer import News, news_companies
+from app.models.news_visibility import PUBLIC_COMPANY_ID, NewsVisibility
+
+logger = logging.getLogger(__name__)
+
+REBUILD_LOCK_PATH = "/tmp/hcms-news-visibility.lock"
+
+_rebuilder: threading.Thread | None = None
+_leader_lock_file = None
+_rebuilder_lock = threading.Lock()
+_change_listeners: list[Callable[[], None]] = []
+
+
+def _visible_company_ids(company_id: int) -> tuple[int, int]:
+    return (PUBLIC_COMPANY_ID, company_id)
+
+
+def visible_news_query(db: Session, company_id: int) -> Query:
+    """회사에 노출되는 게시 새소식 쿼리. 최신순 정렬은 NewsVisibility.created_at으로."""
+    _ensure_rebuilder()
+    return (
+        db.query(News)
+        .join(NewsVisibility, NewsVisibility.news_id == News.seq)
+        .filter(NewsVisibility.company_id.in_(_visible_company_ids(company_id)))
+    )
+
+
+def count_visible_news(db: Session, company_id: int) -> int:
+    _ensure_rebuilder()
+    return (
+        db.query(NewsVisibility.id)
+        .filter(NewsVisibility.company_id.in_(_visible_company_ids(company_id)))
+        .count()
+    )
+
+
+def _desired_rows(db: Session, news_ids: list[int] | None) -> dict[tuple[int, int], object]:
+    """News/News_companies 기준으로 있어야 할 (company_id, news_id) -> created_at."""
+    assigned = (
+        db.query(news_companies.c.company_id, News.seq, News.created_at)
+        .join(news_companies, news_companies.c.news_id == News.seq)
+        .filter(News.is_published == True)
+    )
+    public = (
+        db.query(literal(PUBLIC_COMPANY_ID), News.seq, News.created_at)
+        .outerjoin(news_companies, news_companies.c.news_id == News.seq)
+        .filter(News.is_published == True, news_companies.c.news_id == None)
+    )
+    if news_ids is not None:
+        assigned = assigned.filter(News.seq.in_(news_ids))
+        public = public.filter(News.seq.in_(news_ids))
+
+    return {(company_id, news_id): created_at for company_id, news_id, created_at in assigned.union(public).all()}
+
+
+def _sync(db: Session, news_ids: list[int] | None = None) -> bool:
+    """노출 인덱스를 원본에 맞추고 변경이 있었는지 반환."""
+    desired = _desired_rows(db, news_ids)
+
+    existing_query = db.query(NewsVisibility.id, NewsVisibility.company_id, NewsVisibility.news_id, NewsVisibility.created_at)
+    if news_ids is not None:
+        existing_query = existing_query.filter(NewsVisibility.news_id.in_(news_ids))
+
+    stale_ids = []
+    for row_id, company_id, news_id, created_at in existing_query.all():
+        key = (company_id, news_id)
+        if key not in desired:
+            stale_ids.append(row_id)
+        elif created_at == desired[key]:
+            desired.pop(key)
+
+    if stale_ids:
+        db.query(NewsVisibility).filter(NewsVisibility.id.in_(stale_ids)).delete(synchronize_session=False)
+    if desired:
+        # 없는 행 추가 + created_at이 바뀐 행 갱신
+        rows = [
+            {"company_id": company_id, "news_id": news_id, "created_at": created_at}
+            for (company_id, news_id), created_at in desired.items()
+        ]
+        upsert(db, NewsVisibility, rows, ["company_id", "news_id"], lambda new: {"created_at": new.created_at})
+    return bool(stale_ids or desired)
+
+
+def refresh_news_visibility(db: Session, news_id: int) -> None:
+    """새소식 한 건의 노출 대상을 현재 News/News_companies 상태로 갱신 (commit은 호출자)."""
+    _sync(db, [news_id])
+
+
+def on_news_visibility_changed(callback: Callable[[], None]) -> None:
+    """주기적 재구성에서 변경이 생겼을 때 호출할 콜백 등록 (노출 목록을 캐시하는 곳에서 사용)."""
+    _change_listeners.append(callback)
+
+
+def rebuild_news_visibility() -> None:
+    db = SessionLocal()
+    try:
+        changed = _sync(db)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to rebuild news visibility: {e}")
+        return
+    finally:
+        db.close()
+
+    if changed:
+        for callback in _change_listeners:
+            callback()
+
+
+def _is_rebuild_leader() -> bool:
+    """이 프로세스가 호스트의 주기적 재구성 담당인지. 잡은 잠금은 프로세스가 끝날 때까지 유지."""
+    global _leader_lock_file
+    if _leader_lock_file is not None:
+        return True
+    lock_file = open(REBUILD_LOCK_PATH, "a")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+    _leader_lock_file = lock_file
+    return True
+
+
+def _rebuild_loop() -> None:
+    while True:
+        time.sleep(settings.NEWS_VISIBILITY_REBUILD_MINUTES * 60)
+        # 담당 워커가 종료되면 다음 주기에 다른 워커가 잠금을 이어받음
+        if _is_rebuild_leader():
+            rebuild_news_visibility()
+
+
+def _ensure_rebuilder() -> None:
+    global _rebuilder
+    if _rebuilder is not None:
+        return
+    with _rebuilder_lock:
+        if _rebuilder is None:
+            _rebuilder = threading.Thread(target=_rebuild_loop, name="news-visibility", daemon=True)
+            _rebuilder.start()
@@ -0,0 +1,184 @@
+"""
+PDF 렌더링 프로세스 풀.
+
+견적서/계약서 PDF를 API 워커 밖의 프로세스에서 생성한다. 각 워커는 시작 시
+check_fonts()로 CJK 폰트를 확인해 폰트가 없으면 바로 실패하고, 대기 작업 수(PDF_RENDER_MAX_PENDING)와
+렌더링 시간(PDF_RENDER_TIMEOUT)을 제한해 PDF 요청이 몰려도 JSON API가 밀리지 않게 한다.
+API 요청은 빈 슬롯이 없으면 기다리지 않고 바로 실패한다. 렌더링 자체가 제한 시간을 넘기면
+워커 프로세스가 스스로 종료하고, 깨진 풀은 다음 요청에서 새로 만든다.
+대기열/시간 초과는 PdfRenderUnavailable(다시 시도하면 되는 상황), 폰트 누락이나 렌더러
+예외처럼 다시 시도해도 안 되는 실패는 PdfRenderError로 구분한다.
+"""
+
+import faulthandler
+import logging
+import multiprocessing
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Iterable, Iterator
+
+from app.core.config import settings
+from app.core.metrics import pdf_render_failures_total, pdf_render_seconds
+from app.utils.pdf_cache import render_pdf_cached
+
+logger = logging.getLogger(__name__)
+
+# kind -> app.utils.pdf_generator 함수 이름. fpdf는 렌더링 워커 프로세스에서만 import
+RENDERERS = {
+    "estimate": "generate_estimate_pdf",
+    "contract": "generate_contract_pdf",
+}
+
+
+class PdfRenderUnavailable(Exception):
+    """렌더링 대기열이 가득 찼거나 제한 시간 내에 PDF가 생성되지 않음."""
+
+
+class PdfRenderError(Exception):
+    """렌더러 예외나 워커 초기화(폰트 로드) 실패로 PDF를 만들지 못함."""
+
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+_slots = threading.BoundedSemaphore(settings.PDF_RENDER_MAX_PENDING)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.PDF_RENDER_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return _pool
+
+
+def _reset_pool(broken: ProcessPoolExecutor) -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is broken:
+            _pool = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def _on_render_done(pool: ProcessPoolExecutor, future) -> None:
+    global _pool
+    # 시간 초과로 응답한 뒤에도 워커는 렌더링을 계속하므로, 슬롯은 작업이 실제로 끝날 때(워커 종료 포함) 반환
+    _slots.release()
+    # 기다리는 요청이 없어도 깨진 풀은 다음 요청 전에 버림 (종료 처리는 풀이 스스로 함)
+    if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+        with _pool_lock:
+            if _pool is pool:
+                _pool = None
+
+
+def _init_worker() -> None:
+    from app.utils.pdf_generator import check_fonts
+    check_fonts()
+
+
+def _render_in_worker(kind: str, data: dict, timeout: float) -> bytes:
+    from app.utils import pdf_generator
+
+    # 렌더링이 멈추면(C 확장 안에서 멈춘 경우 포함) 스택을 남기고 워커를 종료해 슬롯을 돌려받음.
+    # 풀 대기열에서 기다린 시간은 포함하지 않으므로 몰린 요청 때문에 정상 렌더링이 종료되지는 않는다
+    faulthandler.dump_traceback_later(timeout, exit=True)
+    try:
+        return bytes(getattr(pdf_generator, RENDERERS[kind])(data))
+    finally:
+        faulthandler.cancel_dump_traceback_later()
+
+
+def render_pdf(kind: str, data: dict, queue_timeout: float = 0) -> bytes:
+    """
+    워커 프로세스에서 PDF를 생성. 대기열 초과/시간 초과 시 PdfRenderUnavailable, 생성 실패 시 PdfRenderError.
+
+    빈 슬롯을 queue_timeout초까지 기다린다. API 스레드에서는 기본값 0으로 호출해 바로 503을 돌려준다.
+    """
+    if kind not in RENDERERS:
+        raise ValueError(f"Unknown PDF kind: {kind}")
+
+    started = time.perf_counter()
+    try:
+        pdf = _render(kind, data, queue_timeout)
+    except Exception:
+        pdf_render_failures_total.inc(kind=kind)
+        raise
+    pdf_render_seconds.observe(time.perf_counter() - started, kind=kind)
+    return pdf
+
+
+def _render(kind: str, data: dict, queue_timeout: float) -> bytes:
+    acquired = _slots.acquire(timeout=queue_timeout) if queue_timeout > 0 else _slots.acquire(blocking=False)
+    if not acquired:
+        raise PdfRenderUnavailable("PDF render queue is full")
+    pool = _get_pool()
+    try:
+        future = pool.submit(_render_in_worker, kind, data, settings.PDF_RENDER_TIMEOUT)
+    except BrokenProcessPool as e:
+        _slots.release()
+        logger.error(f"PDF render pool is broken, restarting: {e}")
+        _reset_pool(pool)
+        raise PdfRenderError("PDF render worker failed to start") from e
+    except RuntimeError as e:
+        # 다른 요청이 풀을 재시작하는 중 (shutdown된 풀에 제출)
+        _slots.release()
+        raise PdfRenderUnavailable("PDF render pool is restarting") from e
+    except BaseException:
+        _slots.release()
+        raise
+    future.add_done_callback(partial(_on_render_done, pool))
+
+    try:
+        return future.result(timeout=settings.PDF_RENDER_TIMEOUT)
+    except FutureTimeoutError:
+        future.cancel()
+        logger.error(f"PDF render timed out: {kind}")
+        raise PdfRenderUnavailable("PDF render timed out")
+    except BrokenProcessPool as e:
+        # 워커가 죽었거나(멈춘 렌더링의 자체 종료 포함) 초기화(폰트 로드)에 실패
+        logger.error(f"PDF render pool crashed while rendering {kind}, restarting: {e}")
+        _reset_pool(pool)
+        raise PdfRenderError("PDF render worker crashed") from e
+    except Exception as e:
+        logger.exception(f"PDF render failed: {kind}")
+        raise PdfRenderError(f"PDF render failed: {e}") from e
+
+
+def iter_rendered_pdfs(kind: str, documents: Iterable[tuple[int, dict]]) -> Iterator[tuple[int, bytes | None]]:
+    """
+    (object_id, data) 목록의 PDF를 캐시 또는 워커 풀에서 병렬로 가져와 입력 순서대로 반환.
+
+    동시에 진행하는 문서는 워커 수의 두 배로 제한해 메모리에 쌓이는 PDF 수를 묶어둔다.
+    생성에 실패한 문서는 (object_id, None)으로 반환.
+    """
+    window = max(1, settings.PDF_RENDER_WORKERS * 2)
+    # 묶음은 자체 스레드에서 렌더링하므로 API 스레드와 달리 빈 슬롯을 기다림
+    render = partial(render_pdf, kind, queue_timeout=settings.PDF_RENDER_TIMEOUT)
+    pending = deque()
+
+    def _next_result() -> tuple[int, bytes | None]:
+        object_id, future = pending.popleft()
+        try:
+            return object_id, future.result()
+        except PdfRenderUnavailable as e:
+            logger.warning(f"Skipping {kind} {object_id} in PDF bundle: {e}")
+            return object_id, None
+        except Exception:
+            # 스트리밍 중인 ZIP이 잘리지 않도록 실패 목록(failed.txt)으로 넘김
+            logger.exception(f"Failed to render {kind} {object_id} for PDF bundle")
+            return object_id, None
+
+    with ThreadPoolExecutor(max_workers=window) as executor:
+        for object_id, data in documents:
+            pending.append((object_id, executor.submit(render_pdf_cached, kind, object_id, data, render)))
+            if len(pending) >= window:
+                yield _next_result()
+        while pending:
+            yield _next_result()
@@ -0,0 +1,260 @@
+from datetime import date, datetime, timedelta
+from typing import Iterator
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session, Query, contains_eager, joinedload
+
+from app.models.customer import Managelist, ManagelistComment, Payment, PointHistory, Project
+from app.services.exports import iter_chunks
+
+HAS_DATEUTIL = False
+try:
+    from dateutil.relativedelta import relativedelta
+    HAS_DATEUTIL = True
+except ImportError:
+    pass
+
+EXPORT_SHEET_TITLE = "포인트사용내역"
+EXPORT_HEADER = ["날짜", "구분", "상태", "담당유형", "내용", "관련 요청", "포인트", "포인트구분"]
+
+POINT_TYPE_MAP = {"1": "충전", "2": "사용", "3": "책정"}
+STATUS_MAP = {"1": "입력", "2": "실행"}
+WORKER_TYPE_MAP = {"1": "계약", "2": "기획", "3": "디자인", "4": "프론트엔드", "5": "백엔드", "6": "유지보수"}
+POINT_CATEGORY_MAP = {"1": "유지보수", "2": "개발"}
+
+
+def month_diff(d1: date, d2: date) -> int:
+    """Calculate the number of complete months between two dates."""
+    return (d2.year - d1.year) * 12 + (d2.month - d1.month)
+
+
+def _as_date(value) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _current_point_cycle(project: Project, today: date) -> tuple[int, date, date] | None:
+    """
+    Return (available_points, cycle_start_date, cycle_end_date) for the project's
+    current 6-month cycle, or None if the project has no active point allocation.
+
+    Business Rules:
+    - Points are charged monthly in 6-month cycles
+    - For a 12-month contract: first 6 months get monthly points,
+      after those 6 months expire, the next 6 months of points are granted
+    - If less than 6 months remain in contract, use remaining months × monthly_point
+    """
+    if not project.contract_date or not project.contract_termination_date:
+        return None
+
+    if not project.point or project.point <= 0:
+        return None
+
+    contract_start = _as_date(project.contract_date)
+    contract_end = _as_date(project.contract_termination_date)
+
+    # Check if contract has started or expired
+    if today < contract_start or today > contract_end:
+        return None
+
+    total_contract_months = month_diff(contract_start, contract_end)
+    months_elapsed = month_diff(contract_start, today)
+
+    # Determine which 6-month cycle we're in
+    current_cycle_index = months_elapsed // 6
+    cycle_start_month = current_cycle_index * 6
+    cycle_end_month = min((current_cycle_index + 1) * 6, total_contract_months)
+    months_in_current_cycle = cycle_end_month - cycle_start_month
+
+    available_points = months_in_current_cycle * project.point
+
+    if HAS_DATEUTIL:
+        cycle_start_date = contract_start + relativedelta(months=cycle_start_month)
+        cycle_end_date = contract_start + relativedelta(months=cycle_end_month)
+    else:
+        # Fallback: use simple calculation without dateutil
+        cycle_start_date = contract_start
+        cycle_end_date = contract_end
+
+    return available_points, cycle_start_date, cycle_end_date
+
+
+def calculate_remaining_points_batch(db: Session, projects: list[Project], company_id: int) -> dict[int, int]:
+    """
+    Remaining points of each project's current 6-month cycle, keyed by project seq.
+
+    Used points for every project are summed in a single grouped query, each
+    project filtered to its own cycle window.
+    Remaining points = (available months in current cycle × monthly_point) - used_points_in_cycle
+    """
+    today = datetime.now().date()
+    cycles = {}
+    for project in projects:
+        cycle = _current_point_cycle(project, today)
+        if cycle:
+            cycles[project.seq] = cycle
+
+    result = {project.seq: 0 for project in projects}
+    if not cycles:
+        return result
+
+    # Only count PointHistory with point_type=2 (사용), status=2 (실행)
+    used_by_project = dict(
+        db.query(PointHistory.project_id, func.sum(PointHistory.point))
+        .filter(
+            PointHistory.company_id == company_id,
+            PointHistory.point_type == 2,  # 사용
+            PointHistory.status == 2,       # 실행
+            or_(*[
+                and_(
+                    PointHistory.project_id == project_seq,
+                    PointHistory.created_at >= cycle_start_date,
+                    PointHistory.created_at <= cycle_end_date,
+                )
+                for project_seq, (_, cycle_start_date, cycle_end_date) in cycles.items()
+            ]),
+        )
+        .group_by(PointHistory.project_id)
+        .all()
+    )
+
+    for project_seq, (available_points, _, _) in cycles.items():
+        used_points_in_cycle = used_by_project.get(project_seq) or 0
+        # Remaining points = available - used, never below 0
+        result[project_seq] = max(0, available_points - abs(used_points_in_cycle))
+    return result
+
+
+def get_paid_project_ids(db: Session, project_ids: list[int]) -> set[int]:
+    """결제완료(payment_status=1) 내역이 있는 프로젝트 seq 집합."""
+    if not project_ids:
+        return set()
+    rows = (
+        db.query(Payment.project_id)
+        .filter(Payment.project_id.in_(project_ids), Payment.payment_status == 1)
+        .distinct()
+        .all()
+    )
+    return {project_id for (project_id,) in rows}
+
+
+def get_latest_pointed_comments(db: Session, managelist_ids) -> dict[int, ManagelistComment]:
+    """managelist_id별 포인트가 책정된 최신 댓글(작성자 포함)을 한 번에 조회."""
+    ids = {mid for mid in managelist_ids if mid}
+    if not ids:
+        return {}
+
+    ranked = (
+        db.query(
+            ManagelistComment.seq.label("seq"),
+            func.row_number()
+            .over(
+                partition_by=ManagelistComment.managelist_id,
+                order_by=(ManagelistComment.created_at.desc(), ManagelistComment.seq.desc()),
+            )
+            .label("rn"),
+        )
+        .filter(ManagelistComment.managelist_id.in_(ids), ManagelistComment.point > 0)
+        .subquery()
+    )
+
+    comments = (
+        db.query(ManagelistComment)
+        .join(ranked, ranked.c.seq == ManagelistComment.seq)
+        .filter(ranked.c.rn == 1)
+        .options(joinedload(ManagelistComment.writer))
+        .all()
+    )
+    return {c.managelist_id: c for c in comments}
+
+
+def get_export_project(db: Session, company_id: int, project_id: int | None = None) -> Project | None:
+    """포인트가 있는 계약기간 내 프로젝트 중 내보내기 대상 선택 (미지정/불일치 시 최신 프로젝트)."""
+    now = datetime.now()
+    maintenance_projects = (
+        db.query(Project)
+        .filter(Project.company_id == company_id, Project.point > 0, Project.contract_date <= now, Project.contract_termination_date >= now)
+        .order_by(Project.created_at.desc())
+        .all()
+    )
+    if not maintenance_projects:
+        return None
+    if project_id:
+        return next((p for p in maintenance_projects if p.seq == project_id), maintenance_projects[0])
+    return maintenance_projects[0]
+
+
+def build_point_export_query(
+    db: Session,
+    project: Project,
+    search_text: str = "",
+    date_from: str = "",
+    date_to: str = "",
+    point_type: str = "",
+) -> Query:
+    """엑셀 내보내기 대상 PointHistory 쿼리 (계약기간 + 검색 조건)."""
+    query = (
+        db.query(PointHistory)
+        .outerjoin(Managelist, PointHistory.managelist_id == Managelist.seq)
+        .options(contains_eager(PointHistory.managelist))
+        .filter(
+            PointHistory.project_id == project.seq,
+            PointHistory.created_at >= project.contract_date,
+            PointHistory.created_at <= project.contract_termination_date,
+        )
+    )
+
+    if search_text:
+        query = query.filter(or_(PointHistory.content.ilike(f"%{search_text}%"), Managelist.title.ilike(f"%{search_text}%")))
+    if date_from:
+        try:
+            query = query.filter(PointHistory.created_at >= datetime.strptime(date_from, "%Y-%m-%d"))
+        except ValueError:
+            pass
+    if date_to:
+        try:
+            date_to_end = datetime.strptime(date_to, "%Y-%m-%d") + timedelta(days=1) - timedelta(seconds=1)
+            query = query.filter(PointHistory.created_at <= date_to_end)
+        except ValueError:
+            pass
+    if point_type:
+        try:
+            query = query.filter(PointHistory.point_type == int(point_type))
+        except ValueError:
+            pass
+
+    return query.order_by(PointHistory.created_at.desc(), PointHistory.seq.desc())
+
+
+def _point_export_rows(lookup_db: Session, histories: list[PointHistory]) -> Iterator[list]:
+    latest_comments = get_latest_pointed_comments(lookup_db, (ph.managelist_id for ph in histories))
+    for ph in histories:
+        managelist_title = ""
+        actual_worker_type = ph.worker_type
+        if ph.managelist_id:
+            if ph.managelist:
+                managelist_title = ph.managelist.title or ""
+            comment = latest_comments.get(ph.managelist_id)
+            if comment and comment.worker_type:
+                actual_worker_type = comment.worker_type
+
+        yield [
+            ph.created_at.strftime("%Y-%m-%d %H:%M:%S") if ph.created_at else "",
+            POINT_TYPE_MAP.get(str(ph.point_type) if ph.point_type else "", ""),
+            STATUS_MAP.get(str(ph.status) if ph.status else "", ""),
+            WORKER_TYPE_MAP.get(str(actual_worker_type) if actual_worker_type else "", "") if actual_worker_type else "",
+            ph.content or "",
+            managelist_title,
+            abs(ph.point) if ph.point else 0,
+            POINT_CATEGORY_MAP.get(ph.point_category or "1", "유지보수"),
+        ]
+
+
+def iter_point_export_rows(query: Query, lookup_db: Session, chunk_size: int = 500) -> Iterator[list]:
+    """
+    PointHistory를 yield_per 청크로 읽어 엑셀 행을 생성.
+
+    yield_per는 서버사이드 커서를 사용하므로 (MySQL에서는 커서가 열린 동안
+    같은 커넥션으로 다른 쿼리를 보낼 수 없음) 댓글 조회는 별도 세션(lookup_db)으로 한다.
+    """
+    for chunk in iter_chunks(query, chunk_size):
+        yield from _point_export_rows(lookup_db, chunk)
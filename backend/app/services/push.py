@@ -2,37 +2,80 @@ import logging
 
 from datetime import datetime
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from app.db.upsert import upsert
 from app.models.push_token import PushToken
 from app.core.firebase import send_push
 
 logger = logging.getLogger(__name__)
 
 
-def register_token(db: Session, manager_seq: int, token: str, platform: str) -> PushToken:
-    """토큰 등록 (upsert). 이미 존재하면 갱신."""
-    existing = db.query(PushToken).filter(PushToken.token == token).first()
-
-    if existing:
-        existing.manager_seq = manager_seq
-        existing.platform = platform
-        existing.is_active = True
-        existing.updated_at = datetime.now()
-        db.commit()
-        db.refresh(existing)
-        return existing
-
-    new_token = PushToken(
-        manager_seq=manager_seq,
-        token=token,
-        platform=platform,
-        is_active=True,
-    )
-    db.add(new_token)
+def register_tokens(db: Session, manager_seq: int, tokens: list[dict]) -> list:
+    """
+    토큰 여러 개를 한 문장으로 upsert 하고 같은 기기(device_id)의 이 유저의 다른 토큰은 비활성화.
+
+    tokens: [{"token", "platform", "device_id"}]. 등록된 토큰 행(id, token, platform, is_active)을
+    입력 순서대로 반환.
+    """
+    now = datetime.now()
+    # 한 문장 안에서 같은 토큰이 두 번 나오면 PostgreSQL은 오류이므로 마지막 값만 사용
+    by_token = {
+        t["token"]: {
+            "manager_seq": manager_seq,
+            "token": t["token"],
+            "platform": t["platform"],
+            "device_id": t.get("device_id"),
+            "is_active": True,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for t in tokens
+    }
+    rows = list(by_token.values())
+    if not rows:
+        return []
+
+    # device_id를 보내지 않은 등록은 기존 device_id를 유지
+    upsert(db, PushToken, rows, ["token"], lambda new: {
+        "manager_seq": new.manager_seq,
+        "platform": new.platform,
+        "device_id": func.coalesce(new.device_id, PushToken.device_id),
+        "is_active": True,
+        "updated_at": new.updated_at,
+    })
+
+    device_ids = {r["device_id"] for r in rows if r["device_id"]}
+    if device_ids:
+        stale = (
+            db.query(PushToken)
+            .filter(
+                PushToken.manager_seq == manager_seq,
+                PushToken.device_id.in_(device_ids),
+                PushToken.token.notin_(by_token.keys()),
+                PushToken.is_active == True,
+            )
+            .update({PushToken.is_active: False, PushToken.updated_at: now}, synchronize_session=False)
+        )
+        if stale:
+            logger.info(f"Deactivated {stale} stale push token(s) for manager {manager_seq}")
+
+    # ORM 객체가 아닌 행으로 읽어 커밋 후 다시 조회(refresh)하지 않음
+    registered = {
+        row.token: row
+        for row in db.execute(
+            select(PushToken.id, PushToken.token, PushToken.platform, PushToken.is_active)
+            .where(PushToken.token.in_(by_token.keys()))
+        )
+    }
     db.commit()
-    db.refresh(new_token)
-    return new_token
+    return [registered[token] for token in by_token]
+
+
+def register_token(db: Session, manager_seq: int, token: str, platform: str, device_id: str | None = None):
+    """토큰 등록 (upsert). 이미 존재하면 갱신."""
+    return register_tokens(db, manager_seq, [{"token": token, "platform": platform, "device_id": device_id}])[0]
 
 
 def unregister_token(db: Session, token: str) -> bool:
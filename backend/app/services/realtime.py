@@ -0,0 +1,134 @@
+"""
+실시간 변경 이벤트 pub/sub.
+
+웹훅으로 들어온 변경을 회사별 구독자(SSE 연결)에게 전달한다. 구독자는 각 워커
+프로세스의 이벤트 루프에 있으므로, 워커 간 전달은 로컬 브로커 대용으로
+BROKER_DIR 아래 프로세스별 Unix 데이터그램 소켓을 쓴다. 발행하면 자기 프로세스
+구독자에게 바로 넣고 디렉터리의 다른 소켓들로 보내며, 각 프로세스의 수신 스레드가
+받은 이벤트를 자기 구독자에게 넘긴다.
+"""
+
+import asyncio
+import glob
+import json
+import logging
+import os
+import socket
+import threading
+
+logger = logging.getLogger(__name__)
+
+BROKER_DIR = "/tmp/hcms-realtime"
+SUBSCRIBER_QUEUE_SIZE = 100
+MAX_MESSAGE_BYTES = 64 * 1024
+
+# company_id -> {queue: loop}
+_subscribers: dict[int, dict[asyncio.Queue, asyncio.AbstractEventLoop]] = {}
+_lock = threading.Lock()
+
+_broker_path: str | None = None
+_broker_lock = threading.Lock()
+_send_sock: socket.socket | None = None
+
+
+def _put(queue: asyncio.Queue, event: dict) -> None:
+    try:
+        queue.put_nowait(event)
+    except asyncio.QueueFull:
+        # 느린 클라이언트는 이벤트를 건너뜀 (재연결 시 목록을 다시 불러옴)
+        pass
+
+
+def _deliver_local(company_ids: list[int] | None, event: dict) -> None:
+    with _lock:
+        if company_ids is None:
+            targets = [item for subs in _subscribers.values() for item in subs.items()]
+        else:
+            targets = [item for cid in company_ids for item in _subscribers.get(cid, {}).items()]
+    for queue, loop in targets:
+        try:
+            loop.call_soon_threadsafe(_put, queue, event)
+        except RuntimeError:
+            # 이벤트 루프가 이미 종료됨
+            pass
+
+
+def _receive_loop(sock: socket.socket) -> None:
+    while True:
+        try:
+            data = sock.recv(MAX_MESSAGE_BYTES)
+            message = json.loads(data)
+            _deliver_local(message["company_ids"], message["event"])
+        except Exception as e:
+            logger.warning(f"Dropped realtime broker message: {e}")
+
+
+def _ensure_broker() -> None:
+    """이 프로세스의 브로커 소켓을 만들고 수신 스레드를 시작."""
+    global _broker_path, _send_sock
+    if _broker_path is not None:
+        return
+    with _broker_lock:
+        if _broker_path is not None:
+            return
+        os.makedirs(BROKER_DIR, exist_ok=True)
+        path = os.path.join(BROKER_DIR, f"{os.getpid()}.sock")
+        if os.path.exists(path):
+            os.remove(path)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.bind(path)
+        threading.Thread(target=_receive_loop, args=(sock,), name="realtime-broker", daemon=True).start()
+        _send_sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        _broker_path = path
+
+
+def _broadcast(company_ids: list[int] | None, event: dict) -> None:
+    data = json.dumps({"company_ids": company_ids, "event": event}, ensure_ascii=False).encode("utf-8")
+    if len(data) > MAX_MESSAGE_BYTES:
+        logger.warning(f"Realtime event too large to broadcast: {event.get('type')}")
+        return
+    for path in glob.glob(os.path.join(BROKER_DIR, "*.sock")):
+        if path == _broker_path:
+            continue
+        try:
+            _send_sock.sendto(data, path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            # 종료된 워커의 소켓
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        except OSError as e:
+            logger.warning(f"Failed to send realtime event to {path}: {e}")
+
+
+def publish_event(company_ids: list[int] | None, event: dict) -> None:
+    """회사들(None이면 전체)에 이벤트 발행. 모든 워커의 구독자에게 전달된다."""
+    try:
+        _ensure_broker()
+    except OSError as e:
+        logger.error(f"Realtime broker unavailable: {e}")
+    _deliver_local(company_ids, event)
+    if _broker_path is not None:
+        _broadcast(company_ids, event)
+
+
+def subscribe(company_id: int) -> asyncio.Queue:
+    """현재 이벤트 루프에서 회사 이벤트를 받을 큐 등록."""
+    try:
+        _ensure_broker()
+    except OSError as e:
+        logger.error(f"Realtime broker unavailable: {e}")
+    queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+    with _lock:
+        _subscribers.setdefault(company_id, {})[queue] = asyncio.get_running_loop()
+    return queue
+
+
+def unsubscribe(company_id: int, queue: asyncio.Queue) -> None:
+    with _lock:
+        subs = _subscribers.get(company_id)
+        if subs is not None:
+            subs.pop(queue, None)
+            if not subs:
+                del _subscribers[company_id]
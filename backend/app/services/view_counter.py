@@ -0,0 +1,113 @@
+"""
+조회수 write-behind 버퍼.
+
+상세 조회 시 바로 UPDATE/commit 하지 않고 프로세스 메모리에 증가분을 모았다가
+VIEW_COUNT_FLUSH_SECONDS 주기로 `UPDATE ... SET views = views + n` 를 일괄 실행한다.
+조회 API는 읽기 전용이 되고, 인기 게시글 한 행에 락이 몰리지 않는다.
+아직 반영되지 않은 증가분은 pending_views()로 응답에 더해 보여준다.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Callable
+
+from sqlalchemy import func
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.customer import News, ProjectBoard
+
+logger = logging.getLogger(__name__)
+
+VIEW_COUNTED_MODELS = {
+    "news": News,
+    "project_board": ProjectBoard,
+}
+
+_pending: dict[str, Counter] = defaultdict(Counter)
+_flush_listeners: dict[str, list[Callable[[Counter, float], None]]] = defaultdict(list)
+_lock = threading.Lock()
+_flusher: threading.Thread | None = None
+_stop = threading.Event()
+
+
+def _flush_loop() -> None:
+    while not _stop.wait(settings.VIEW_COUNT_FLUSH_SECONDS):
+        flush_views()
+
+
+def _ensure_flusher() -> None:
+    global _flusher
+    if _flusher is not None:
+        return
+    with _lock:
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flush_loop, name="view-counter", daemon=True)
+            _flusher.start()
+            atexit.register(_shutdown)
+
+
+def _shutdown() -> None:
+    _stop.set()
+    flush_views()
+
+
+def record_view(kind: str, seq: int) -> None:
+    """조회수 1 증가를 버퍼에 기록."""
+    with _lock:
+        _pending[kind][seq] += 1
+    _ensure_flusher()
+
+
+def pending_views(kind: str, seq: int) -> int:
+    """아직 DB에 반영되지 않은 조회수 증가분."""
+    with _lock:
+        return _pending[kind].get(seq, 0)
+
+
+def on_views_flushed(kind: str, callback: Callable[[Counter, float], None]) -> None:
+    """
+    DB에 반영된 증가분(seq -> n)과 flush 시작 시각(time.monotonic)을 받을 콜백 등록
+    (조회수를 캐시하는 곳에서 사용).
+    """
+    _flush_listeners[kind].append(callback)
+
+
+def flush_views() -> None:
+    """버퍼의 증가분을 증가량별로 묶어 한 번의 UPDATE로 반영. 실패 시 버퍼로 되돌린다."""
+    with _lock:
+        batch = {kind: counts for kind, counts in _pending.items() if counts}
+        _pending.clear()
+    if not batch:
+        return
+
+    started_at = time.monotonic()
+    db = SessionLocal()
+    try:
+        for kind, counts in batch.items():
+            model = VIEW_COUNTED_MODELS[kind]
+            by_increment = defaultdict(list)
+            for seq, n in counts.items():
+                by_increment[n].append(seq)
+            for n, seqs in by_increment.items():
+                db.query(model).filter(model.seq.in_(seqs)).update(
+                    {model.views: func.coalesce(model.views, 0) + n},
+                    synchronize_session=False,
+                )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to flush view counts: {e}")
+        with _lock:
+            for kind, counts in batch.items():
+                _pending[kind].update(counts)
+        return
+    finally:
+        db.close()
+
+    for kind, counts in batch.items():
+        for callback in _flush_listeners.get(kind, []):
+            callback(counts, started_at)
@@ -0,0 +1,93 @@
+"""
+Disk cache for rendered estimate/contract PDFs.
+
+Entries are keyed by document kind, id and a fingerprint of the exact data
+dict passed to the generator, so any change to items, amounts or signature
+fields produces a new key. Cache hits bump the file mtime; when the cache
+grows past PDF_CACHE_MAX_MB the least recently used files are evicted.
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import uuid
+from typing import Callable
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PDF_CACHE_DIR = "/home/pacms/media/pdf_cache"
+
+# Bump when the PDF layout in pdf_generator changes so old renders are not served.
+PDF_TEMPLATE_VERSION = "1"
+
+
+def pdf_fingerprint(data: dict) -> str:
+    payload = json.dumps(data, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(f"{PDF_TEMPLATE_VERSION}:{payload}".encode("utf-8")).hexdigest()
+
+
+def _cache_path(kind: str, object_id: int, fingerprint: str) -> str:
+    return os.path.join(PDF_CACHE_DIR, f"{kind}_{object_id}_{fingerprint}.pdf")
+
+
+def get_cached_pdf(kind: str, object_id: int, data: dict) -> bytes | None:
+    path = _cache_path(kind, object_id, pdf_fingerprint(data))
+    try:
+        with open(path, "rb") as f:
+            content = f.read()
+        os.utime(path)
+        return content
+    except OSError:
+        return None
+
+
+def _evict_lru(max_bytes: int) -> None:
+    entries = []
+    for path in glob.glob(os.path.join(PDF_CACHE_DIR, "*.pdf")):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            continue
+
+
+def store_pdf(kind: str, object_id: int, data: dict, content: bytes) -> None:
+    """Write a rendered PDF to the cache, replacing older renders of the same document."""
+    path = _cache_path(kind, object_id, pdf_fingerprint(data))
+    try:
+        os.makedirs(PDF_CACHE_DIR, exist_ok=True)
+        for stale in glob.glob(os.path.join(PDF_CACHE_DIR, f"{kind}_{object_id}_*.pdf")):
+            if stale != path:
+                os.remove(stale)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+        _evict_lru(settings.PDF_CACHE_MAX_MB * 1024 * 1024)
+    except OSError as e:
+        logger.warning(f"Failed to write PDF cache for {kind} {object_id}: {e}")
+
+
+def render_pdf_cached(kind: str, object_id: int, data: dict, render: Callable[[dict], bytes]) -> bytes:
+    """Return the cached PDF for this exact data, rendering and storing it on a miss."""
+    cached = get_cached_pdf(kind, object_id, data)
+    if cached is not None:
+        return cached
+
+    content = bytes(render(data))
+    store_pdf(kind, object_id, data, content)
+    return content
@@ -82,6 +82,17 @@ def _safe(value, default: str = "") -> str:
 # Base PDF class with Korean font support
 # ---------------------------------------------------------------------------
 
+def check_fonts() -> None:
+    """
+    Load the NotoSansCJK fonts once so that a render worker with missing or
+    unreadable font files fails at startup instead of on every document.
+    Intended as the initializer of the PDF render worker processes.
+    """
+    pdf = FPDF()
+    pdf.add_font("NotoSans", "", FONT_REGULAR)
+    pdf.add_font("NotoSans", "B", FONT_BOLD)
+
+
 class _KoreanPDF(FPDF):
     """FPDF subclass pre-configured with NotoSansCJK fonts."""
 
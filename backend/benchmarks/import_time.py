@@ -0,0 +1,83 @@
+"""
+워커 시작(import) 시간 측정.
+
+새 인터프리터에서 `python -X importtime -c "import app.main"`을 여러 번 실행해
+가장 빠른 회차의 총 import 시간과 누적 시간이 큰 모듈을 보고한다. 첫 사용 시에만
+로드해야 하는 무거운 패키지(LAZY_MODULES)가 시작 시 import 되면 종료 코드 1로 끝난다.
+
+    cd backend
+    python -m benchmarks.import_time                  # 5회 측정, 상위 20개 모듈
+    python -m benchmarks.import_time --budget-ms 2000 # 총 시간이 넘으면 실패
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+TARGET_MODULE = "app.main"
+# 푸시/엑셀/PDF 사용 시점에만 import 되어야 하는 패키지
+LAZY_MODULES = ("firebase_admin", "google.cloud", "openpyxl", "fpdf")
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="HCMS worker import-time benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=20, help="누적 시간 상위 모듈 수")
+    parser.add_argument("--budget-ms", type=float, default=0, help="총 import 시간 상한 (0이면 검사 안 함)")
+    return parser.parse_args(argv)
+
+
+def _measure() -> dict[str, tuple[int, int]]:
+    """모듈별 (self us, cumulative us). 한 번의 새 인터프리터 실행."""
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {TARGET_MODULE}"],
+        cwd=backend_dir,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {TARGET_MODULE} failed:\n{result.stderr[-2000:]}")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+
+    runs = [_measure() for _ in range(args.runs)]
+    # 디스크 캐시/스케줄링 잡음을 줄이려고 가장 빠른 회차를 사용
+    best = min(runs, key=lambda m: m[TARGET_MODULE][1])
+    total_ms = best[TARGET_MODULE][1] / 1000
+
+    print(f"{'module':<60}{'cumulative ms':>15}{'self ms':>10}")
+    ranked = sorted(best.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (self_us, cumulative_us) in ranked[:args.top]:
+        print(f"{name:<60}{cumulative_us / 1000:>15.1f}{self_us / 1000:>10.1f}")
+    print(f"\nimport {TARGET_MODULE}: {total_ms:.1f}ms (best of {args.runs}, {len(best)} modules)")
+
+    problems = []
+    eager = sorted(n for n in best if any(n == m or n.startswith(m + ".") for m in LAZY_MODULES))
+    if eager:
+        problems.append(f"heavy modules imported at startup: {', '.join(eager[:10])}")
+    if args.budget_ms and total_ms > args.budget_ms:
+        problems.append(f"import time {total_ms:.1f}ms exceeds budget {args.budget_ms:.0f}ms")
+
+    if problems:
+        print("\nREGRESSIONS:", file=sys.stderr)
+        for problem in problems:
+            print(f"  {problem}", file=sys.stderr)
+        return 1
+    print("no heavy modules imported at startup")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+"""
+API 벤치마크 실행기.
+
+시드된 로컬 DB(기본 SQLite)에 대해 주요 엔드포인트를 ASGI 클라이언트로 반복 호출하고
+시나리오별 p50/p95/p99 지연시간과 SQL 문장 수를 보고한다. 저장된 기준값과 비교해
+p50/p95가 허용치 이상 느려지거나 SQL 문장 수가 늘면 종료 코드 1로 끝난다.
+
+    cd backend
+    python -m benchmarks.run                      # 기준값과 비교
+    python -m benchmarks.run --save-baseline      # 현재 결과를 기준값으로 저장
+    python -m benchmarks.run --scale small -k pdf # 작은 데이터, 이름에 pdf가 든 시나리오만
+
+기준값의 지연시간은 기록한 머신에 따라 다르므로, 다른 머신에서는 먼저 --save-baseline
+으로 기준값을 다시 만든다. SQL 문장 수는 머신과 무관하다.
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+DEFAULT_DATABASE_URL = "sqlite:///" + os.path.join(tempfile.gettempdir(), "hcms-bench.db")
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="HCMS API benchmark")
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--scale", default="default", choices=["small", "default"])
+    parser.add_argument("--reseed", action="store_true", help="기존 DB가 있어도 다시 생성")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("-k", dest="keyword", default="", help="이름에 이 문자열이 든 시나리오만 실행")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="p50 허용 증가율")
+    parser.add_argument("--tail-tolerance", type=float, default=1.0, help="p95 허용 증가율")
+    parser.add_argument("--min-delta-ms", type=float, default=5.0, help="이보다 작은 증가는 무시")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    return parser.parse_args(argv)
+
+
+def _configure_environment(args) -> None:
+    """app 모듈을 import 하기 전에 설정을 환경변수로 고정."""
+    os.environ["DATABASE_URL"] = args.database_url
+    # 측정 중에 백그라운드 작업이 끼어들지 않게 함
+    os.environ["VIEW_COUNT_FLUSH_SECONDS"] = "3600"
+    os.environ["NEWS_VISIBILITY_REBUILD_MINUTES"] = "1440"
+    os.environ["PROFILE_SAMPLE_RATE"] = "0"
+    os.environ["REQUEST_QUERY_BUDGET"] = "100000"
+    os.environ["REQUEST_DB_TIME_BUDGET_MS"] = "100000"
+    os.environ["SLOW_QUERY_MS"] = "100000"
+
+
+def _needs_seed(args) -> bool:
+    if args.reseed:
+        return True
+    if args.database_url.startswith("sqlite:///"):
+        return not os.path.exists(args.database_url[len("sqlite:///"):])
+    return False
+
+
+def _calibrate() -> float:
+    """고정된 순수 파이썬 작업의 소요 시간(ms, 5회 중 최소). 머신 속도 차이 보정용."""
+    payload = [{"seq": i, "title": f"제목 {i}", "views": i * 3, "tags": ["a", "b", "c"]} for i in range(2000)]
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(20):
+            json.loads(json.dumps(payload, ensure_ascii=False))
+        best = min(best, (time.perf_counter() - started) * 1000)
+    return round(best, 2)
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    index = max(0, math.ceil(q / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def _run_scenario(client, scenario, args, query_counter) -> dict:
+    for _ in range(args.warmup):
+        if scenario.before:
+            scenario.before()
+        scenario.run(client)
+
+    timings = []
+    queries = []
+    for _ in range(args.iterations):
+        if scenario.before:
+            scenario.before()
+        # 이전 반복의 가비지 수거가 측정 구간에 끼지 않게 함
+        gc.collect()
+        query_counter["n"] = 0
+        started = time.perf_counter()
+        scenario.run(client)
+        timings.append((time.perf_counter() - started) * 1000)
+        queries.append(query_counter["n"])
+
+    timings.sort()
+    return {
+        "p50_ms": round(_percentile(timings, 50), 2),
+        "p95_ms": round(_percentile(timings, 95), 2),
+        "p99_ms": round(_percentile(timings, 99), 2),
+        "queries": max(queries),
+    }
+
+
+def _compare(results: dict, baseline: dict, calibration_ms: float, args) -> list[str]:
+    problems = []
+    if baseline.get("scale") != args.scale:
+        return [f"baseline was recorded with scale '{baseline.get('scale')}', this run used '{args.scale}'"]
+    # 이번 실행의 머신이 기준값 기록 때보다 느리면 그만큼 허용치를 늘림 (빠르면 그대로)
+    speed = max(1.0, calibration_ms / baseline["calibration_ms"]) if baseline.get("calibration_ms") else 1.0
+    for name, result in results.items():
+        base = baseline["scenarios"].get(name)
+        if "error" in result:
+            problems.append(f"{name}: {result['error']}")
+            continue
+        if base is None:
+            continue
+        if result["queries"] > base["queries"]:
+            problems.append(f"{name}: queries {base['queries']} -> {result['queries']}")
+        for key, tolerance in (("p50_ms", args.tolerance), ("p95_ms", args.tail_tolerance)):
+            limit = base[key] * speed * (1 + tolerance)
+            if result[key] > limit and result[key] - base[key] > args.min_delta_ms:
+                problems.append(f"{name}: {key[:3]} {base[key]}ms -> {result[key]}ms (limit {limit:.2f}ms)")
+    return problems
+
+
+def _print_table(results: dict, baseline: dict | None) -> None:
+    print(f"{'scenario':<30}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'queries':>9}{'base p50':>10}{'base p95':>10}{'base q':>8}")
+    for name, result in results.items():
+        base = (baseline or {}).get("scenarios", {}).get(name, {})
+        if "error" in result:
+            print(f"{name:<30}  ERROR: {result['error']}")
+            continue
+        print(
+            f"{name:<30}{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+            f"{result['queries']:>9}{base.get('p50_ms', '-'):>10}{base.get('p95_ms', '-'):>10}{base.get('queries', '-'):>8}"
+        )
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    _configure_environment(args)
+
+    if not args.database_url.startswith("sqlite") and "bench" not in args.database_url.rsplit("/", 1)[-1]:
+        # 시드는 테이블을 지우고 다시 만든다
+        print("refusing to use a non-SQLite database whose name does not contain 'bench'", file=sys.stderr)
+        return 2
+
+    from sqlalchemy import event
+
+    from app.core.security import create_access_token
+    from app.db.session import engine
+    from app.services import export_jobs
+    from app.utils import pdf_cache
+    from benchmarks.scenarios import SCENARIOS
+    from benchmarks.seed import MANAGER_SEQ, seed_database
+
+    if _needs_seed(args):
+        started = time.perf_counter()
+        counts = seed_database(args.scale)
+        print(f"seeded {sum(counts.values())} rows ({args.scale}) in {time.perf_counter() - started:.1f}s")
+
+    work_dir = tempfile.mkdtemp(prefix="hcms-bench-")
+    pdf_cache.PDF_CACHE_DIR = os.path.join(work_dir, "pdf_cache")
+    export_jobs.EXPORT_DIR = os.path.join(work_dir, "exports")
+
+    query_counter = {"n": 0}
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count_query(*_):
+        query_counter["n"] += 1
+
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    client = TestClient(app)
+    client.headers["Authorization"] = f"Bearer {create_access_token({'sub': str(MANAGER_SEQ)})}"
+
+    calibration_ms = _calibrate()
+    results = {}
+    try:
+        for scenario in SCENARIOS:
+            if args.keyword and args.keyword not in scenario.name:
+                continue
+            try:
+                results[scenario.name] = _run_scenario(client, scenario, args, query_counter)
+            except Exception as e:
+                results[scenario.name] = {"error": str(e)}
+    finally:
+        # PDF 캐시/내보내기 파일 정리
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    _print_table(results, baseline)
+    print(f"\ncalibration: {calibration_ms}ms (baseline {(baseline or {}).get('calibration_ms', '-')}ms)")
+    report = {"scale": args.scale, "iterations": args.iterations, "calibration_ms": calibration_ms, "scenarios": results}
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if args.save_baseline:
+        failed = [name for name, r in results.items() if "error" in r]
+        if failed:
+            print(f"not saving baseline, failed scenarios: {', '.join(failed)}", file=sys.stderr)
+            return 1
+        if baseline and baseline.get("scale") == args.scale:
+            # -k로 일부만 돌린 경우 나머지 기준값은 유지
+            report["scenarios"] = {**baseline["scenarios"], **results}
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"baseline saved to {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print("no baseline found; run with --save-baseline to create one")
+        return 0
+
+    problems = _compare(results, baseline, calibration_ms, args)
+    if problems:
+        print("\nREGRESSIONS:", file=sys.stderr)
+        for problem in problems:
+            print(f"  {problem}", file=sys.stderr)
+        return 1
+    print("\nno regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+벤치마크 시나리오.
+
+각 시나리오는 인증된 TestClient로 한 번의 사용자 동작(요청 또는 요청 묶음)을 실행한다.
+응답이 기대 상태가 아니면 예외를 던져 해당 시나리오를 실패로 기록한다.
+"""
+
+import shutil
+import time
+from typing import Callable, NamedTuple
+
+from sqlalchemy import event
+
+from app.db.session import engine
+from app.services import export_jobs
+from app.utils import pdf_cache
+from benchmarks.seed import BOARD_ID, ESTIMATE_ID, MANAGELIST_ID, SCALING_THREAD_IDS
+
+EXPORT_POLL_SECONDS = 0.01
+EXPORT_TIMEOUT_SECONDS = 120
+
+
+class Scenario(NamedTuple):
+    name: str
+    run: Callable
+    before: Callable[[], None] | None = None
+
+
+class ScenarioError(Exception):
+    pass
+
+
+# 시나리오 안에서 요청별로 세는 SQL 문장 수 (실행기의 카운터는 시나리오 전체 합계)
+_statements = {"n": 0}
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _count_statement(*_):
+    _statements["n"] += 1
+
+
+def _check(response, expected: int = 200):
+    if response.status_code != expected:
+        raise ScenarioError(f"{response.request.method} {response.request.url.path} -> {response.status_code}: {response.text[:200]}")
+    return response
+
+
+def _get(path: str) -> Callable:
+    return lambda client: _check(client.get(path))
+
+
+def _post(path: str, body: dict) -> Callable:
+    return lambda client: _check(client.post(path, json=body))
+
+
+def _export_job(export_type: str) -> Callable:
+    """내보내기 작업 등록부터 완료까지."""
+    def run(client):
+        job = _check(client.post("/api/exports", json={"type": export_type, "format": "xlsx"}), 202).json()
+        deadline = time.monotonic() + EXPORT_TIMEOUT_SECONDS
+        while job["status"] in ("pending", "running"):
+            if time.monotonic() > deadline:
+                raise ScenarioError(f"export {export_type} did not finish in {EXPORT_TIMEOUT_SECONDS}s")
+            time.sleep(EXPORT_POLL_SECONDS)
+            # 상태 API 대신 작업 저장소를 직접 확인 (폴링 횟수만큼 인증 쿼리가 늘지 않게)
+            job = export_jobs.get_export_job(job["id"])
+        if job["status"] != "completed":
+            raise ScenarioError(f"export {export_type} failed: {job.get('error')}")
+        _check(client.get(f"/api/exports/{job['id']}/download"))
+    return run
+
+
+def _thread_scaling(client):
+    """댓글 수가 다른 스레드의 상세 조회가 같은 수의 SQL 문장으로 끝나는지 확인."""
+    counts = {}
+    for size, board_id in SCALING_THREAD_IDS.items():
+        _statements["n"] = 0
+        response = client.get(f"/api/project-board/{board_id}")
+        if response.status_code == 404:
+            raise ScenarioError(f"thread {board_id} not found; re-create the benchmark DB with --reseed")
+        _check(response)
+        counts[size] = _statements["n"]
+    if len(set(counts.values())) > 1:
+        raise ScenarioError(f"board detail queries grow with thread size (comments -> queries): {counts}")
+
+
+def _clear_pdf_cache() -> None:
+    # 캐시 적중이 아닌 실제 렌더링 시간을 측정
+    shutil.rmtree(pdf_cache.PDF_CACHE_DIR, ignore_errors=True)
+
+
+SCENARIOS = [
+    Scenario("dashboard", _get("/api/dashboard")),
+    Scenario("bootstrap", _post("/api/bootstrap", {})),
+    Scenario("maintenance_list", _get("/api/maintenance?page=1&per_page=10")),
+    Scenario("maintenance_search", _get("/api/maintenance?search=요청 1&page=2")),
+    Scenario("maintenance_detail", _get(f"/api/maintenance/{MANAGELIST_ID}")),
+    Scenario("point_usage", _get("/api/point-usage?page=1&per_page=20")),
+    Scenario("point_usage_filtered", _get("/api/point-usage?point_type=2&page=3&per_page=50")),
+    Scenario("project_board_list", _get("/api/project-board?page=1")),
+    Scenario("project_board_thread", _get(f"/api/project-board/{BOARD_ID}")),
+    *(
+        Scenario(f"project_board_thread_{size}", _get(f"/api/project-board/{board_id}"))
+        for size, board_id in SCALING_THREAD_IDS.items()
+    ),
+    Scenario("project_board_thread_scaling", _thread_scaling),
+    Scenario("news_list", _get("/api/news")),
+    Scenario("estimates_list", _get("/api/estimates")),
+    Scenario("estimate_detail", _get(f"/api/estimates/{ESTIMATE_ID}")),
+    Scenario("estimate_pdf_render", _get(f"/api/estimates/{ESTIMATE_ID}/pdf"), before=_clear_pdf_cache),
+    Scenario("estimate_pdf_cached", _get(f"/api/estimates/{ESTIMATE_ID}/pdf")),
+    Scenario("point_usage_export", _get("/api/point-usage/export?format=xlsx")),
+    Scenario("export_job_maintenance", _export_job("maintenance")),
+]
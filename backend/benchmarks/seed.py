@@ -0,0 +1,290 @@
+"""
+벤치마크용 픽스처 생성.
+
+회사마다 유지보수 요청/포인트 내역/프로젝트 게시판/댓글을 실제 규모로 넣는다.
+행 수는 SCALES로 조절하며, 같은 scale이면 항상 같은 데이터가 만들어진다.
+회사 1의 게시글 1은 답글/댓글이 많은 긴 스레드(상세 조회 측정용)이다. 스레드 길이에
+따른 상세 조회 변화를 보기 위해 댓글 수만 다른 스레드(SCALING_THREAD_IDS)도 넣는다.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+from app.db.session import Base, SessionLocal, engine
+from app.models import (
+    Company,
+    CustomAuthUser,
+    DevSubscription,
+    Estimate,
+    EstimateItem,
+    Inditask,
+    Inquiry,
+    Managelist,
+    ManagelistComment,
+    Manager,
+    News,
+    Payment,
+    PointHistory,
+    Project,
+    ProjectBoard,
+    ProjectBoardAttachment,
+    ProjectBoardCategory,
+    ProjectBoardComment,
+    ProjectBoardCommentAttachment,
+    news_companies,
+)
+from app.models.ai_dev_subscription import AIDevSubscription  # noqa: F401 (테이블 생성용)
+from app.models.customer import project_board_categories
+from app.services.news_visibility import rebuild_news_visibility
+
+SCALES = {
+    "small": {
+        "companies": 2,
+        "projects": 3,
+        "managelists": 300,
+        "point_histories": 300,
+        "boards": 200,
+        "comments_per_board": 3,
+        "estimates": 30,
+        "news": 30,
+        "thread_replies": 20,
+        "thread_comments": 60,
+    },
+    "default": {
+        "companies": 3,
+        "projects": 5,
+        "managelists": 3000,
+        "point_histories": 3000,
+        "boards": 2000,
+        "comments_per_board": 3,
+        "estimates": 200,
+        "news": 100,
+        "thread_replies": 50,
+        "thread_comments": 300,
+    },
+}
+
+BATCH_SIZE = 2000
+
+# 시나리오에서 쓰는 고정 ID
+MANAGER_SEQ = 1
+COMPANY_ID = 1
+MANAGELIST_ID = 1
+BOARD_ID = 1
+ESTIMATE_ID = 1
+
+# 댓글 수 -> 게시글 ID. 순차 ID와 겹치지 않는 범위를 쓰고, 작성일을 과거로 두어 목록 첫 페이지에는 나오지 않음
+THREAD_SCALING_SIZES = (10, 50, 200)
+SCALING_THREAD_IDS = {size: 900001 + i for i, size in enumerate(THREAD_SCALING_SIZES)}
+
+
+def _insert(db, table, rows: list[dict]) -> None:
+    for i in range(0, len(rows), BATCH_SIZE):
+        db.execute(table.insert(), rows[i:i + BATCH_SIZE])
+
+
+def seed_database(scale_name: str = "default") -> dict:
+    """스키마를 새로 만들고 픽스처를 넣는다. 만든 행 수를 반환."""
+    scale = SCALES[scale_name]
+    rng = random.Random(42)
+    now = datetime(2026, 1, 15, 12, 0, 0)
+
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    companies = range(1, scale["companies"] + 1)
+    projects = []
+    rows: dict[str, list[dict]] = {name: [] for name in (
+        "company", "manager", "project", "payment", "dev_subscription", "managelist", "managelist_comment",
+        "point_history", "board_category", "board", "board_category_link", "board_attachment", "board_comment",
+        "board_comment_attachment", "estimate", "estimate_item", "news", "news_company", "task", "inquiry",
+    )}
+
+    admins = [
+        {"id": i, "username": f"admin{i}", "name": f"관리자{i}", "email": f"admin{i}@example.com", "is_active": True}
+        for i in range(1, 6)
+    ]
+
+    for company_id in companies:
+        rows["company"].append({"seq": company_id, "name": f"회사{company_id}", "ceo_email": "ceo@example.com", "site_key": f"key{company_id}"})
+        rows["manager"].append({"seq": company_id, "login_id": f"user{company_id}", "name": f"담당자{company_id}", "company_id": company_id, "login_permit_tf": "1"})
+        rows["dev_subscription"].append({
+            "company_id": company_id, "plan_type": "starter", "status": "active", "start_date": now.date(),
+            "next_charge_date": now.date(), "dev_points_per_month": 100, "maintenance_points_per_month": 10,
+        })
+        for p in range(scale["projects"]):
+            project_id = len(projects) + 1
+            projects.append((project_id, company_id))
+            rows["project"].append({
+                "seq": project_id, "company_id": company_id, "title": f"프로젝트{project_id}", "point": 1000,
+                "contract_date": (now - timedelta(days=300)).date(),
+                "contract_termination_date": (now + timedelta(days=60 + p * 30)).date(),
+                "created_at": now - timedelta(days=p), "project_status": "진행",
+            })
+            rows["payment"].append({"project_id": project_id, "company_id": company_id, "payment_status": 1})
+            for c in range(3):
+                rows["board_category"].append({"project_id": project_id, "name": f"분류{c}", "is_active": True})
+
+    company_projects = {cid: [pid for pid, c in projects if c == cid] for cid in companies}
+
+    managelist_seq = comment_seq = point_seq = board_seq = board_comment_seq = estimate_seq = 0
+    for company_id in companies:
+        for i in range(scale["managelists"]):
+            managelist_seq += 1
+            created = now - timedelta(hours=i * 3)
+            rows["managelist"].append({
+                "seq": managelist_seq, "company_id": company_id, "project_id": rng.choice(company_projects[company_id]),
+                "title": f"유지보수 요청 {i}", "content": "내용 " * 20, "status": rng.randint(1, 4),
+                "created_at": created, "writer_id": company_id,
+            })
+            for j in range(3):
+                comment_seq += 1
+                rows["managelist_comment"].append({
+                    "seq": comment_seq, "managelist_id": managelist_seq, "writer_id": rng.randint(1, 5),
+                    "content": "처리 내용", "worker_type": j + 1, "point": rng.choice([0, 1, 2, 5]),
+                    "created_at": created + timedelta(hours=j + 1),
+                })
+
+        for i in range(scale["point_histories"]):
+            point_seq += 1
+            charge = i % 10 == 0
+            rows["point_history"].append({
+                "seq": point_seq, "company_id": company_id, "project_id": rng.choice(company_projects[company_id]),
+                "managelist_id": None if charge else rng.randint(1, managelist_seq), "content": f"포인트 내역 {i}",
+                "point": 100 if charge else -rng.randint(1, 10), "point_type": 1 if charge else 2, "status": 2,
+                "point_category": rng.choice(["1", "2"]), "worker_type": None if charge else rng.randint(1, 6),
+                "created_at": now - timedelta(hours=i * 5),
+            })
+
+        for i in range(scale["boards"]):
+            board_seq += 1
+            project_id = rng.choice(company_projects[company_id])
+            rows["board"].append({
+                "seq": board_seq, "company_id": company_id, "project_id": project_id, "title": f"게시글 {i}",
+                "content": "본문 " * 50, "writer_type": rng.choice(["1", "2"]), "writer_id": rng.randint(1, 5),
+                "customer_writer_id": company_id, "views": rng.randint(0, 100), "status": "1",
+                "created_at": now - timedelta(hours=i * 4),
+            })
+            rows["board_category_link"].append({
+                "projectboard_id": board_seq, "projectboardcategory_id": (project_id - 1) * 3 + rng.randint(1, 3),
+            })
+            for _ in range(scale["comments_per_board"]):
+                board_comment_seq += 1
+                rows["board_comment"].append({
+                    "seq": board_comment_seq, "board_id": board_seq, "content": "댓글",
+                    "writer_type": rng.choice(["1", "2"]), "writer_id": rng.randint(1, 5),
+                    "customer_writer_id": company_id, "created_at": now - timedelta(hours=i * 4 - 1),
+                })
+
+        for i in range(scale["estimates"]):
+            estimate_seq += 1
+            rows["estimate"].append({
+                "seq": estimate_seq, "company_id": company_id, "project_id": rng.choice(company_projects[company_id]),
+                "estimate_title": f"견적서 {i}", "estimate_status": rng.randint(1, 3), "discount_type": "1",
+                "discount_rate": 10, "tax_rate": 10, "created_at": now - timedelta(days=i),
+            })
+            for k in range(rng.randint(3, 15)):
+                rows["estimate_item"].append({
+                    "estimate_id": estimate_seq, "item_order": k, "item_name": f"항목 {k}",
+                    "quantity": rng.randint(1, 5), "unit_price": rng.randint(1, 100) * 10000,
+                })
+
+        rows["task"].append({"company_id": company_id, "project_id": company_projects[company_id][0], "title": "작업", "task_type": 1, "task_status": 1, "created_at": now})
+        rows["inquiry"].append({"company_id": company_id, "title": "문의", "status": 1, "created_at": now, "writer_id": company_id})
+
+    # 회사 1의 게시글 1: 답글/댓글/첨부가 많은 긴 스레드
+    for i in range(scale["thread_replies"]):
+        board_seq += 1
+        rows["board"].append({
+            "seq": board_seq, "company_id": COMPANY_ID, "project_id": company_projects[COMPANY_ID][0], "parent_id": BOARD_ID,
+            "title": f"답글 {i}", "content": "답글 본문", "writer_type": rng.choice(["1", "2"]),
+            "writer_id": rng.randint(1, 5), "customer_writer_id": COMPANY_ID, "views": 0, "status": "1",
+            "created_at": now + timedelta(minutes=i),
+        })
+        rows["board_attachment"].append({"board_id": board_seq, "file": f"reply{i}.pdf", "filename": f"reply{i}.pdf", "file_size": 1024})
+    for i in range(scale["thread_comments"]):
+        board_comment_seq += 1
+        rows["board_comment"].append({
+            "seq": board_comment_seq, "board_id": BOARD_ID, "content": f"스레드 댓글 {i}",
+            "writer_type": rng.choice(["1", "2"]), "writer_id": rng.randint(1, 5), "customer_writer_id": COMPANY_ID,
+            "created_at": now + timedelta(minutes=i),
+        })
+        if i % 5 == 0:
+            rows["board_comment_attachment"].append({"comment_id": board_comment_seq, "file": f"c{i}.png", "filename": f"c{i}.png", "file_size": 2048})
+    rows["board_attachment"].append({"board_id": BOARD_ID, "file": "spec.pdf", "filename": "spec.pdf", "file_size": 4096})
+
+    for i in range(scale["news"]):
+        news_id = i + 1
+        rows["news"].append({
+            "seq": news_id, "title": f"새소식 {i}", "content": "새소식 본문 " * 30, "category": rng.choice(["공지", "업데이트"]),
+            "is_published": i % 10 != 9, "views": rng.randint(0, 500), "writer_id": 1, "created_at": now - timedelta(days=i),
+        })
+        if i % 3 == 0:
+            rows["news_company"].append({"news_id": news_id, "company_id": rng.choice(list(companies))})
+
+    # 크기별 스레드: 댓글 N개(댓글마다 첨부 3개), 답글 N/10개(첨부 1개), 게시글 첨부 3개, 분류 2개
+    thread_project_id = company_projects[COMPANY_ID][0]
+    for size, thread_id in SCALING_THREAD_IDS.items():
+        thread_created = now - timedelta(days=3650)
+        rows["board"].append({
+            "seq": thread_id, "company_id": COMPANY_ID, "project_id": thread_project_id, "parent_id": None,
+            "title": f"스레드 {size}", "content": "본문 " * 50, "writer_type": "2", "writer_id": 1, "customer_writer_id": COMPANY_ID,
+            "views": 0, "status": "1", "created_at": thread_created,
+        })
+        for c in range(2):
+            rows["board_category_link"].append({
+                "projectboard_id": thread_id, "projectboardcategory_id": (thread_project_id - 1) * 3 + c + 1,
+            })
+        for k in range(3):
+            rows["board_attachment"].append({"board_id": thread_id, "file": f"t{thread_id}_{k}.pdf", "filename": f"첨부{k}.pdf", "file_size": 1024})
+        for i in range(size // 10):
+            board_seq += 1
+            rows["board"].append({
+                "seq": board_seq, "company_id": COMPANY_ID, "project_id": thread_project_id, "parent_id": thread_id,
+                "title": f"답글 {i}", "content": "답글 본문", "writer_type": "1", "writer_id": 1 + i % 5,
+                "customer_writer_id": COMPANY_ID, "views": 0, "status": "1", "created_at": thread_created + timedelta(minutes=i),
+            })
+            rows["board_attachment"].append({"board_id": board_seq, "file": f"r{board_seq}.pdf", "filename": f"r{board_seq}.pdf", "file_size": 1024})
+        for i in range(size):
+            board_comment_seq += 1
+            rows["board_comment"].append({
+                "seq": board_comment_seq, "board_id": thread_id, "content": f"댓글 {i}", "writer_type": "1" if i % 2 else "2",
+                "writer_id": 1 + i % 5, "customer_writer_id": COMPANY_ID, "created_at": thread_created + timedelta(minutes=i),
+            })
+            for k in range(3):
+                rows["board_comment_attachment"].append({
+                    "comment_id": board_comment_seq, "file": f"c{board_comment_seq}_{k}.png", "filename": f"c{k}.png", "file_size": 2048,
+                })
+
+    db = SessionLocal()
+    try:
+        _insert(db, CustomAuthUser.__table__, admins)
+        for name, table in (
+            ("company", Company.__table__),
+            ("manager", Manager.__table__),
+            ("project", Project.__table__),
+            ("payment", Payment.__table__),
+            ("dev_subscription", DevSubscription.__table__),
+            ("board_category", ProjectBoardCategory.__table__),
+            ("managelist", Managelist.__table__),
+            ("managelist_comment", ManagelistComment.__table__),
+            ("point_history", PointHistory.__table__),
+            ("board", ProjectBoard.__table__),
+            ("board_category_link", project_board_categories),
+            ("board_attachment", ProjectBoardAttachment.__table__),
+            ("board_comment", ProjectBoardComment.__table__),
+            ("board_comment_attachment", ProjectBoardCommentAttachment.__table__),
+            ("estimate", Estimate.__table__),
+            ("estimate_item", EstimateItem.__table__),
+            ("news", News.__table__),
+            ("news_company", news_companies),
+            ("task", Inditask.__table__),
+            ("inquiry", Inquiry.__table__),
+        ):
+            _insert(db, table, rows[name])
+        db.commit()
+    finally:
+        db.close()
+
+    rebuild_news_visibility()
+    return {name: len(r) for name, r in rows.items()}
@@ -9,6 +9,8 @@ import { PageSpinner } from "@/components/common/page-spinner";
 import { ToastProvider } from "@/components/common/app-toast";
 import { NavigationSpinnerProvider } from "@/components/common/navigation-spinner";
 import { usePushNotifications } from "@/hooks/use-push-notifications";
+import { useRealtimeEvents } from "@/hooks/use-realtime-events";
+import { useAppBootstrap } from "@/hooks/use-app-bootstrap";
 
 export default function AuthenticatedLayout({
   children,
@@ -19,6 +21,8 @@ export default function AuthenticatedLayout({
   const router = useRouter();
   const [isLoading, setIsLoading] = useState(true);
   usePushNotifications();
+  useRealtimeEvents();
+  const isBootstrapped = useAppBootstrap();
 
   useEffect(() => {
     const token = localStorage.getItem("access_token");
@@ -29,7 +33,8 @@ export default function AuthenticatedLayout({
     }
   }, [isAuthenticated, router]);
 
-  if (isLoading) return <PageSpinner />;
+  // /bootstrap이 채울 쿼리를 화면들이 따로 요청하지 않도록 응답을 기다림
+  if (isLoading || !isBootstrapped) return <PageSpinner />;
 
   return (
     <ToastProvider>
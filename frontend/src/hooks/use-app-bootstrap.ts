@@ -0,0 +1,123 @@
+"use client";
+
+import { useEffect, useState } from "react";
+import { useQueryClient, type QueryKey } from "@tanstack/react-query";
+import { Capacitor } from "@capacitor/core";
+import api from "@/lib/axios";
+import {
+  PUSH_TOKEN_KEY,
+  PUSH_TOKEN_REGISTERED_KEY,
+  sendTokenToServer,
+} from "@/hooks/use-push-notifications";
+
+export const BOOTSTRAP_CACHE_KEY = "bootstrap_sections";
+
+// 서버 섹션 이름 → 채워 넣을 쿼리 키
+const SECTION_QUERY_KEYS: Record<string, QueryKey> = {
+  dashboard: ["dashboard"],
+  maintenance_projects: ["maintenance", "projects"],
+  project_board_projects: ["project-board", "projects"],
+  ai_dev_subscriptions: ["ai-dev-subscriptions", "list"],
+};
+
+interface BootstrapSection {
+  etag?: string;
+  data?: unknown;
+  not_modified?: boolean;
+  error?: string;
+  status_code?: number;
+}
+
+interface BootstrapResponse {
+  sections: Record<string, BootstrapSection>;
+  push?: { id: number } | null;
+}
+
+type CachedSections = Record<string, { etag: string; data: unknown }>;
+
+function loadCachedSections(): CachedSections {
+  try {
+    return JSON.parse(localStorage.getItem(BOOTSTRAP_CACHE_KEY) || "{}");
+  } catch {
+    return {};
+  }
+}
+
+/**
+ * 인증 레이아웃에서 호출.
+ * 앱 시작에 필요한 목록들을 /bootstrap 한 번으로 받아 react-query 캐시에 채운다.
+ * 지난번 받은 섹션은 ETag와 함께 저장해 두었다가 요청 전에 먼저 캐시에 넣고,
+ * 바뀌지 않은 섹션은 저장본을 그대로 쓴다.
+ * 서버에 등록되지 않은 푸시 토큰이 있으면 같은 요청에 실어 보낸다.
+ *
+ * 반환값이 true가 되기 전까지 화면을 그리지 않아야 각 화면의 쿼리가 /bootstrap과
+ * 따로 요청하지 않는다. 모든 섹션의 저장본이 있으면 바로 true, 아니면 응답(또는 실패) 후 true.
+ */
+export function useAppBootstrap(): boolean {
+  const queryClient = useQueryClient();
+  const [isReady, setIsReady] = useState(false);
+
+  useEffect(() => {
+    if (!localStorage.getItem("access_token")) return;
+
+    const cached = loadCachedSections();
+    Object.entries(SECTION_QUERY_KEYS).forEach(([name, queryKey]) => {
+      if (cached[name]) queryClient.setQueryData(queryKey, cached[name].data);
+    });
+    if (Object.keys(SECTION_QUERY_KEYS).every((name) => cached[name])) {
+      setIsReady(true);
+    }
+    const etags = Object.fromEntries(
+      Object.entries(cached).map(([name, section]) => [name, section.etag])
+    );
+
+    const isNative = Capacitor.isNativePlatform();
+    const pushToken = isNative ? localStorage.getItem(PUSH_TOKEN_KEY) : null;
+    const pushPending =
+      !!pushToken && localStorage.getItem(PUSH_TOKEN_REGISTERED_KEY) !== "true";
+    const platform = Capacitor.getPlatform() as "ios" | "android";
+
+    let cancelled = false;
+
+    api
+      .post<BootstrapResponse>("/bootstrap", {
+        etags,
+        push: pushPending ? { token: pushToken, platform } : null,
+      })
+      .then(({ data }) => {
+        if (pushPending) {
+          if (data.push) {
+            localStorage.setItem(PUSH_TOKEN_REGISTERED_KEY, "true");
+          } else {
+            sendTokenToServer(pushToken!, platform);
+          }
+        }
+        if (cancelled) return;
+
+        const nextCache: CachedSections = {};
+        Object.entries(data.sections).forEach(([name, section]) => {
+          const queryKey = SECTION_QUERY_KEYS[name];
+          if (!queryKey || !section.etag) return;
+          const payload = section.not_modified ? cached[name]?.data : section.data;
+          if (payload === undefined) return;
+          queryClient.setQueryData(queryKey, payload);
+          nextCache[name] = { etag: section.etag, data: payload };
+        });
+        localStorage.setItem(BOOTSTRAP_CACHE_KEY, JSON.stringify(nextCache));
+      })
+      .catch((err) => {
+        // 실패해도 각 화면이 개별 API로 불러오므로 푸시 등록만 따로 재시도
+        console.error("[Bootstrap] failed:", err);
+        if (pushPending) sendTokenToServer(pushToken!, platform);
+      })
+      .finally(() => {
+        if (!cancelled) setIsReady(true);
+      });
+
+    return () => {
+      cancelled = true;
+    };
+  }, [queryClient]);
+
+  return isReady;
+}
@@ -6,12 +6,12 @@ import { Capacitor } from "@capacitor/core";
 import { FirebaseMessaging } from "@capacitor-firebase/messaging";
 import api from "@/lib/axios";
 
-const PUSH_TOKEN_KEY = "push_token";
-const PUSH_TOKEN_REGISTERED_KEY = "push_token_registered";
+export const PUSH_TOKEN_KEY = "push_token";
+export const PUSH_TOKEN_REGISTERED_KEY = "push_token_registered";
 const MAX_RETRIES = 3;
 const BASE_DELAY_MS = 2000;
 
-async function sendTokenToServer(
+export async function sendTokenToServer(
   token: string,
   platform: "ios" | "android",
   retries = MAX_RETRIES
@@ -79,7 +79,8 @@ export async function requestAndRegisterPushToken(): Promise<void> {
 
 /**
  * 인증 레이아웃에서 호출.
- * 미등록 토큰 재시도 + 알림 리스너 설정 + 토큰 갱신 처리.
+ * 알림 리스너 설정 + 토큰 갱신 처리.
+ * (미등록 토큰 재시도는 useAppBootstrap 요청에 실어 보낸다)
  */
 export function usePushNotifications() {
   const router = useRouter();
@@ -87,16 +88,6 @@ export function usePushNotifications() {
   useEffect(() => {
     if (!Capacitor.isNativePlatform()) return;
 
-    const savedToken = localStorage.getItem(PUSH_TOKEN_KEY);
-    const isRegistered =
-      localStorage.getItem(PUSH_TOKEN_REGISTERED_KEY) === "true";
-
-    if (savedToken && !isRegistered) {
-      console.log("[Push] Hook: retrying server registration for saved token");
-      const platform = Capacitor.getPlatform() as "ios" | "android";
-      sendTokenToServer(savedToken, platform);
-    }
-
     FirebaseMessaging.addListener(
       "notificationReceived",
       (notification) => {
@@ -0,0 +1,100 @@
+"use client";
+
+import { useEffect } from "react";
+import { useQueryClient, type QueryKey } from "@tanstack/react-query";
+import api from "@/lib/axios";
+
+const STREAM_STALE_TIME = 5 * 60 * 1000;
+const DEFAULT_STALE_TIME = 60 * 1000;
+const RECONNECT_DELAY_MS = 5000;
+
+// 서버 이벤트 타입 → 갱신할 쿼리 키
+const EVENT_QUERY_KEYS: Record<string, QueryKey[]> = {
+  managelist_comment: [["maintenance"], ["point-usage"], ["dashboard"]],
+  dev_request_comment: [["dev-requests"], ["dashboard"]],
+  inditask_comment: [["tasks"], ["dashboard"]],
+  inquiry_answer: [["inquiries"], ["dashboard"]],
+  news_register: [["news"], ["dashboard"]],
+  project_board_post: [["project-board"]],
+};
+
+/**
+ * 인증 레이아웃에서 호출.
+ * 회사 단위 변경 이벤트(SSE)를 구독해 해당 목록/상세 쿼리만 무효화한다.
+ * 연결되어 있는 동안은 staleTime을 늘려 화면 전환/포커스마다 다시 불러오지 않는다.
+ * 액세스 토큰이 URL(접근 로그)에 남지 않도록 연결할 때마다 짧게 유효한 스트림 티켓을
+ * 받아 쓴다. 티켓은 금방 만료되므로 EventSource 자체 재연결 대신 새 티켓으로 다시 연결한다.
+ */
+export function useRealtimeEvents() {
+  const queryClient = useQueryClient();
+
+  useEffect(() => {
+    if (!localStorage.getItem("access_token") || typeof EventSource === "undefined") return;
+
+    const setStaleTime = (staleTime: number) => {
+      const defaults = queryClient.getDefaultOptions();
+      queryClient.setDefaultOptions({
+        ...defaults,
+        queries: { ...defaults.queries, staleTime },
+      });
+    };
+
+    let source: EventSource | null = null;
+    let reconnectTimer: ReturnType<typeof setTimeout> | null = null;
+    let wasConnected = false;
+    let stopped = false;
+
+    const scheduleReconnect = () => {
+      if (stopped || reconnectTimer) return;
+      reconnectTimer = setTimeout(() => {
+        reconnectTimer = null;
+        connect();
+      }, RECONNECT_DELAY_MS);
+    };
+
+    const connect = async () => {
+      let ticket: string;
+      try {
+        const { data } = await api.post<{ ticket: string }>("/events/ticket");
+        ticket = data.ticket;
+      } catch {
+        scheduleReconnect();
+        return;
+      }
+      if (stopped) return;
+
+      source = new EventSource(
+        `${process.env.NEXT_PUBLIC_API_URL}/events/stream?ticket=${encodeURIComponent(ticket)}`
+      );
+
+      source.onopen = () => {
+        // 재연결이면 끊긴 동안 놓친 이벤트가 있을 수 있으므로 전체 갱신
+        if (wasConnected) queryClient.invalidateQueries();
+        wasConnected = true;
+        setStaleTime(STREAM_STALE_TIME);
+      };
+
+      source.onerror = () => {
+        setStaleTime(DEFAULT_STALE_TIME);
+        source?.close();
+        source = null;
+        scheduleReconnect();
+      };
+
+      Object.entries(EVENT_QUERY_KEYS).forEach(([eventType, queryKeys]) => {
+        source?.addEventListener(eventType, () => {
+          queryKeys.forEach((queryKey) => queryClient.invalidateQueries({ queryKey }));
+        });
+      });
+    };
+
+    connect();
+
+    return () => {
+      stopped = true;
+      if (reconnectTimer) clearTimeout(reconnectTimer);
+      source?.close();
+      setStaleTime(DEFAULT_STALE_TIME);
+    };
+  }, [queryClient]);
+}
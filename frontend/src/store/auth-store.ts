@@ -19,6 +19,7 @@ export const useAuthStore = create<AuthState>((set) => ({
   setUser: (user) => set({ user, isAuthenticated: !!user }),
   logout: () => {
     localStorage.removeItem("access_token");
+    localStorage.removeItem("bootstrap_sections");
     set({ user: null, isAuthenticated: false });
   },
 }));